@@ -32,7 +32,7 @@ from botstools._base import Bot as _Bot
 # >> GLOBAL VARIABLES
 # =============================================================================
 CCSBot = create_type_from_file('CCSBot',
-    CUSTOM_DATA_PATH / 'botstools' / 'entities' / 'CCSBot.ini')
+    CUSTOM_DATA_PATH / 'botstools' / 'entities' / 'CCSBot.ini', lazy=True)
 
 
 # =============================================================================
@@ -38,7 +38,8 @@ csbots_type_manager = TypeManager()
 # >> GLOBAL VARIABLES
 # =============================================================================
 CSBot = create_type_from_file('CCSBot',
-    CSBOTS_ENTITIES_DATA_PATH / 'CCSBot.ini', manager=csbots_type_manager)
+    CSBOTS_ENTITIES_DATA_PATH / 'CCSBot.ini', manager=csbots_type_manager,
+    lazy=True)
 
 functions = create_function_pipe_from_file(
     CSBOTS_FUNCTIONS_DATA_PATH / 'functions.ini', csbots_type_manager)
@@ -15,13 +15,8 @@ from pathlib import Path
 #   Warnings
 from warnings import warn
 
-# Site-Packages Imports
-#   ConfigObj
-from configobj import Section
-
 # Source.Python Imports
 #   Core
-from core import GameConfigObj
 #from core.dumps import _get_datamaps
 #   Entities
 from entities.classes import server_classes
@@ -39,9 +34,11 @@ from listeners import on_entity_created_listener_manager
 #from listeners import on_tick_listener_manager
 
 # Memory Tools Imports
+#   Config
+from memorytools.config import config_cache
 #   Memory Tools
 from memorytools.manager import get_data_from_file
-from memorytools.manager import get_type_from_file
+from memorytools.manager import get_type_from_dict
 
 
 # =============================================================================
@@ -127,9 +124,10 @@ def update_data():
             continue
 
         for path in paths:
-            raw_data = GameConfigObj(path)
+            raw_data = config_cache.get(path)
             set_server_class(raw_data, server_class, class_name)
-            for name, value in get_type_from_file(raw_data, server_classes).items():
+            for name, value in get_type_from_dict(
+                    raw_data, server_classes, lazy=True).items():
                 setattr(server_class, name, value)
 
         del data_paths[class_name]
@@ -143,7 +141,7 @@ def set_server_class(raw_data, server_class, class_name):
         setattr(server_class, name, server_class.inputs[value])
 
     for name, value in raw_data.get("property", {}).items():
-        if isinstance(value, Section):
+        if isinstance(value, dict):
             property = server_class.properties[value["name"]]
             setattr(server_class, name, server_classes.entity_property(
                 value["type"], property.offset, property.networked))
@@ -153,7 +151,7 @@ def set_server_class(raw_data, server_class, class_name):
                 property.prop_type, property.offset, property.networked))
 
     for name, value in raw_data.get("keyvalue", {}).items():
-        if isinstance(value, Section):
+        if isinstance(value, dict):
             keyvalue_name = value["name"]
             if keyvalue_name in server_class.keyvalues:
                 warn("KeyValue \"{name}\" already implemented.".format(name=keyvalue_name))
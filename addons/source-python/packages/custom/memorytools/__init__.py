@@ -6,12 +6,19 @@
 # >> IMPORTS
 # =============================================================================
 # Python Imports
+#   Contextlib
+from contextlib import contextmanager
 #   Ctypes
+from ctypes import addressof
 from ctypes import c_ubyte
 from ctypes import c_void_p
 from ctypes import memmove
+#   Mmap
+import mmap
 
 # Source.Python Imports
+#   Core
+from core import AutoUnload
 #   Memory
 from memory import alloc
 from memory import find_binary
@@ -21,11 +28,30 @@ from memory import Pointer
 #from memory.manager import manager
 from memory.manager import Type
 
+# Memory Tools Imports
+#   Cache
+from memorytools.cache import address_cache
+#   Helpers
+from memorytools.helpers import AddressNotFoundError
+from memorytools.helpers import IdentifierChain
+from memorytools.helpers import StringReference
+from memorytools.helpers import SymbolName
+#   Regions
+from memorytools.regions import check_readable
+from memorytools.regions import region_index
+#   Relocation
+from memorytools.relocation import apply_relocations
+from memorytools.relocation import load_relocations
+from memorytools.relocation import set_addresses
+
 
 # =============================================================================
 # >> ALL DECLARATION
 # =============================================================================
-__all__ = ("get_bytes",
+__all__ = ("MEM_CHUNK_SIZE",
+           "add_resolved_addresses",
+           "find_address",
+           "get_bytes",
            "get_call_bytes",
            "get_jmp_address",
            "get_jmp_bytes",
@@ -34,9 +60,13 @@ __all__ = ("get_bytes",
            "get_pointer",
            "get_relative_pointer",
            "get_relative_pointer_from_pointer",
+           "get_view",
            "load_binary",
+           "MappedBinary",
            "mem_print",
            "mem_write",
+           "read_into",
+           "resolved_addresses",
            "set_bytes",
            "set_global_addresses",
            "set_local_addresses",
@@ -46,6 +76,8 @@ __all__ = ("get_bytes",
 # =============================================================================
 # >> GLOBAL VARIABLES
 # =============================================================================
+MEM_CHUNK_SIZE = 1 << 20
+
 _singed_size_type = {
     1:Type.CHAR,
     4:Type.INT,
@@ -57,26 +89,233 @@ _unsinged_size_type = {
     4:Type.UINT,
 }
 
+# (Binary address, identifier) -> Address, for each data being loaded
+_resolved_addresses = list()
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class MappedBinary(AutoUnload):
+    """A file mapped into the memory, unmapped when the plugin is unloaded.
+
+    Unlike :func:`load_binary`, the file is not read into Python memory. It
+    is mapped copy-on-write, so the memory can be modified without changing
+    the file.
+
+    The mapping belongs to the plugin which creates the object, so it has
+    to be created by the plugin itself and kept as long as
+    :attr:`pointer` is used.
+    """
+
+    def __init__(self, path, executable=False, relocate=False):
+        """Map the file.
+
+        :param str path:
+            The file to map.
+        :param bool executable:
+            Whether the memory should be made executable.
+        :param bool relocate:
+            Whether the relocation table stored next to the file should be
+            applied.
+        :raise ValueError:
+            Raised if the file is empty.
+        """
+        self._mmap = None
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        self.length = len(self._mmap)
+        self._buffer = (c_ubyte*self.length).from_buffer(self._mmap)
+        self.pointer = Pointer(addressof(self._buffer))
+
+        if executable:
+            self.pointer.unprotect(self.length)
+
+        if relocate:
+            _relocate_binary(path, self.pointer)
+
+    @property
+    def mapped(self):
+        """Return whether the file is still mapped."""
+        return self._mmap is not None
+
+    def close(self):
+        """Unmap the file."""
+        if self._mmap is None:
+            return
+
+        # The mapping can't be closed while the buffer is exported
+        self._buffer = None
+        self._mmap.close()
+        self._mmap = None
+        region_index.invalidate()
+
+    def _unload_instance(self):
+        self.close()
+
 
 # =============================================================================
 # >> FUNCTIONS
 # =============================================================================
-def get_offset(binary, identifier, offset, size=4, srv_check=True):
-    """Return the offset."""
+def find_address(binary, identifier, srv_check=True):
+    """Return the address of the identifier, using the address cache."""
     # Get the binary
     if not isinstance(binary, BinaryFile):
         binary = find_binary(binary, srv_check)
 
-    return getattr(binary.find_address(identifier), 'get_' + _unsinged_size_type[size])(offset)
+    if isinstance(identifier, IdentifierChain):
+        return _find_chain_address(binary, identifier)
+
+    # Use the symbol index, if the binary has indexed the symbol
+    if isinstance(identifier, SymbolName) or (
+            type(identifier) is str and identifier.startswith("_Z")):
+        pointer = _find_symbol(binary, identifier)
+        if pointer is not None:
+            return pointer
+
+    # Use the address resolved for the data being loaded or the cached
+    # address, if available
+    address = None
+    if _resolved_addresses:
+        address = _resolved_addresses[-1].get(
+            (binary.address, identifier), None)
+    if address is None:
+        address = address_cache.get(binary, identifier)
+    if address is not None:
+        return Pointer(address)
+
+    # Scan the binary or only the scope of the identifier
+    pointer = None
+    scope = getattr(identifier, "scope", None)
+    if isinstance(identifier, StringReference):
+        pointer = _find_string_reference(binary, identifier)
+    elif scope is not None:
+        pointer = _find_scoped_address(binary, identifier, scope)
+
+    if pointer is None:
+        try:
+            pointer = binary.find_address(identifier)
+        except ValueError as error:
+            raise AddressNotFoundError(*error.args) from None
+
+    if pointer:
+        address_cache.set(binary, identifier, pointer.address)
+        _flush_address_cache()
+
+    return pointer
+
+@contextmanager
+def resolved_addresses():
+    """Let :func:`find_address` use the addresses resolved for a load.
+
+    :func:`memorytools.resolver.resolve_identifiers` adds the addresses it
+    resolves to the innermost load, so they are used even if the address
+    cache is disabled. The address cache is written once at the end of the
+    outermost load.
+
+    :return:
+        A dictionary with a (binary address, identifier) tuple as key and
+        the address as value.
+    :rtype: dict
+    """
+    addresses = dict()
+    _resolved_addresses.append(addresses)
+    try:
+        yield addresses
+    finally:
+        _resolved_addresses.pop()
+        _flush_address_cache()
+
+def add_resolved_addresses(addresses):
+    """Add the addresses to the innermost load, if any.
+
+    :param dict addresses:
+        A dictionary with a (binary address, identifier) tuple as key and
+        the address as value.
+    """
+    if _resolved_addresses:
+        _resolved_addresses[-1].update(addresses)
+
+def _find_chain_address(binary, chain):
+    # Try the alternative which matched last first
+    alternatives = list(chain)
+    winner = address_cache.get_winner(binary, chain)
+    if winner is None and _resolved_addresses:
+        winner = next((
+            identifier for identifier in chain
+            if (binary.address, identifier) in _resolved_addresses[-1]),
+            None)
+
+    if winner is not None:
+        alternatives.remove(winner)
+        alternatives.insert(0, winner)
+
+    for identifier in alternatives:
+        try:
+            pointer = find_address(binary, identifier)
+        except AddressNotFoundError:
+            continue
+
+        if not pointer:
+            continue
+
+        if identifier is not winner:
+            address_cache.set_winner(binary, chain, identifier)
+            _flush_address_cache()
+            chain.report_match(identifier)
+
+        return pointer
+
+    raise AddressNotFoundError("Could not find any of the alternatives.")
+
+def _flush_address_cache():
+    # Loads write the address cache once at their end
+    if not _resolved_addresses:
+        address_cache.flush()
+
+def _find_string_reference(binary, identifier):
+    # Imported here, as the module depends on this package
+    from memorytools.xref import find_string_reference
+
+    return Pointer(find_string_reference(binary, identifier))
+
+def _find_symbol(binary, identifier):
+    # Imported here, as the module depends on this package
+    from memorytools.symbols import find_symbol
+
+    address = find_symbol(binary, identifier)
+    return None if address is None else Pointer(address)
+
+def _find_scoped_address(binary, identifier, scope):
+    # Imported here, as both modules depend on this package
+    from memorytools.elf import get_scope
+    from memorytools.scan import scan_memory
+
+    scope_range = get_scope(binary, scope)
+    if scope_range is None:
+        return None
+
+    addresses = scan_memory(*scope_range, identifier, 1)
+    if not addresses:
+        raise AddressNotFoundError("Could not find address.")
+
+    return Pointer(addresses[0])
+
+def get_offset(binary, identifier, offset, size=4, srv_check=True):
+    """Return the offset."""
+    pointer = find_address(binary, identifier, srv_check)
+
+    return getattr(pointer, 'get_' + _unsinged_size_type[size])(offset)
 
 def get_pointer(binary, identifier, offset=0, level=0, srv_check=True):
     """Return the pointer."""
-    # Get the binary
-    if not isinstance(binary, BinaryFile):
-        binary = find_binary(binary, srv_check)
-
     # Get the pointer
-    pointer = binary.find_pointer(identifier, offset, level)
+    pointer = find_address(binary, identifier, srv_check)
+    if pointer:
+        pointer = Pointer(pointer.address + offset)
+        for i in range(level):
+            pointer = pointer.get_pointer()
 
     # Raise an error if the pointer is invalid
     if not pointer:
@@ -86,42 +325,79 @@ def get_pointer(binary, identifier, offset=0, level=0, srv_check=True):
 
 def get_relative_pointer(binary, identifier, offset, size=4, srv_check=True):
     """Return the relative pointer."""
-    # Get the binary
-    if not isinstance(binary, BinaryFile):
-        binary = find_binary(binary, srv_check)
-
     # Get the pointer
-    pointer = binary.find_address(identifier)
+    pointer = find_address(binary, identifier, srv_check)
     pointer += getattr(pointer, 'get_' + _singed_size_type[size])(offset)+offset+size
 
     return pointer
 
-def get_relative_pointer_from_pointer(pointer, offset, size=4):
+def get_relative_pointer_from_pointer(pointer, offset, size=4, guard=None):
     """Return the relative pointer."""
     # Get the pointer
     pointer = Pointer(pointer)
+    if guard or (guard is None and region_index.guard):
+        check_readable(pointer.address + offset, size, True)
     pointer += getattr(pointer, 'get_' + _singed_size_type[size])(offset)+offset+size
 
     return pointer
 
 def set_local_addresses(pointer, value, offsets):
-    if isinstance(pointer, int):
-        pointer = Pointer(pointer)
-
-    value = int(value)
-    for offset in offsets:
-        pointer.set_uint(value, offset)
+    set_addresses(pointer, value, offsets)
 
 def set_global_addresses(pointer, offsets):
-    if isinstance(pointer, int):
-        pointer = Pointer(pointer)
-
-    address = int(pointer)
-    for offset in offsets:
-        pointer.set_uint(pointer.get_uint(offset) + address, offset)
-
-def get_bytes(pointer, length, offset=0):
-    return bytes((c_ubyte*length).from_address(int(pointer)+offset))
+    apply_relocations(pointer, offsets)
+
+def get_view(pointer, length, offset=0, writable=False):
+    """Return a memoryview over the memory without copying it.
+
+    The view reads and writes the live memory, so it must not be used after
+    the memory has been freed.
+
+    On Python older than 3.8, memoryview has no ``toreadonly()``, so a view
+    which is not writable is a copy of the memory at the time of the call
+    instead. It does not see later changes of the memory.
+
+    :param Pointer/int pointer:
+        The pointer or memory address of the memory.
+    :param int length:
+        The length of the view in bytes.
+    :param int offset:
+        The offset to add to the address.
+    :param bool writable:
+        Whether the view should allow writing to the memory.
+    :rtype: memoryview
+    """
+    view = memoryview((c_ubyte*length).from_address(int(pointer)+offset)).cast("B")
+    if not writable:
+        if hasattr(view, "toreadonly"):
+            return view.toreadonly()
+
+        # Python < 3.8, see above
+        view = memoryview(bytes(view))
+
+    return view
+
+def read_into(pointer, buffer, offset=0):
+    """Copy the memory into a writable buffer and return the length.
+
+    :param Pointer/int pointer:
+        The pointer or memory address of the memory.
+    :param buffer:
+        A writable bytes-like object, e.g. a reusable bytearray. It is
+        filled completely.
+    :param int offset:
+        The offset to add to the address.
+    :rtype: int
+    """
+    target = memoryview(buffer).cast("B")
+    length = target.nbytes
+    target[:] = get_view(pointer, length, offset)
+    return length
+
+def get_bytes(pointer, length, offset=0, guard=None):
+    if guard or (guard is None and region_index.guard):
+        check_readable(int(pointer) + offset, length, True)
+    return get_view(pointer, length, offset).tobytes()
 
 def set_bytes(pointer, data, offset=0):
     if isinstance(data, bytearray):
@@ -158,7 +434,7 @@ def get_jmp_bytes(base, dest, short=True):
 
     return b"\xe9"+((get_jmp_address(base, dest)).to_bytes(4, "little"))
 
-def load_binary(path, auto_dealloc=True):
+def load_binary(path, auto_dealloc=True, relocate=False):
     with open(path, "rb") as file:
         data = file.read()
 
@@ -169,19 +445,27 @@ def load_binary(path, auto_dealloc=True):
 
     memmove(c_void_p(binary.address), data, length)
 
+    if relocate:
+        _relocate_binary(path, binary)
+
     return binary, length
 
-def mem_print(pointer, length, offset=0):
+def _relocate_binary(path, pointer):
+    offsets = load_relocations(path)
+    if offsets is not None:
+        apply_relocations(pointer, offsets)
+
+def mem_print(pointer, length, offset=0, guard=None):
     #data = Array(manager, False, Type.UCHAR, pointer, length)
     #print(' '.join("{:02X}".format(i) for i in data))
-    data = get_bytes(pointer, length, offset)
+    check_readable(int(pointer) + offset, length, guard)
+    data = get_view(pointer, length, offset)
     print(' '.join("{:02X}".format(i) for i in data))
 
-def mem_write(path, pointer, length, offset=0):
-    #data = Array(manager, False, Type.UCHAR, pointer, length)
-    #with open(path, "wb") as file:
-    #    file.write(bytes([i for i in data]))
-    data = get_bytes(pointer, length, offset)
+def mem_write(path, pointer, length, offset=0, guard=None):
+    check_readable(int(pointer) + offset, length, guard)
     with open(path, "wb") as file:
-        file.write(data)
-
+        # Views of a chunk only copy the chunk on Python < 3.8
+        for start in range(0, length, MEM_CHUNK_SIZE):
+            file.write(get_view(
+                pointer, min(MEM_CHUNK_SIZE, length - start), offset + start))
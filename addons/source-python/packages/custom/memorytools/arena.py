@@ -0,0 +1,158 @@
+# ../addons/source-python/packages/custom/memorytools/arena.py
+
+"""Provides a shared allocator for small pieces of executable code."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Ctypes
+from ctypes import c_void_p
+from ctypes import memmove
+#   Mmap
+from mmap import PAGESIZE
+
+# Source.Python Imports
+#   Memory
+from memory import alloc
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ("ExecutableArena",
+           "executable_arena",
+           )
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _Slab:
+    """An executable memory block divided into slots of the same size."""
+
+    def __init__(self, slot_size, block_size):
+        self.slot_size = slot_size
+        self.size = max(slot_size, block_size - block_size % slot_size)
+
+        self.memory = alloc(self.size, False)
+        self.memory.unprotect(self.size)
+
+        self.free_slots = list(range(
+            self.memory.address + self.size - slot_size,
+            self.memory.address - 1,
+            -slot_size))
+        self.used = 0
+
+
+class ExecutableArena:
+    """Packs small pieces of executable code into shared memory blocks.
+
+    The code is stored in slots of power of two sizes, each size with its
+    own blocks. Identical code is stored once and reference counted.
+    """
+
+    def __init__(self, block_size=PAGESIZE, min_slot_size=16):
+        """Initialize the arena.
+
+        :param int block_size:
+            The size of the memory blocks to allocate.
+        :param int min_slot_size:
+            The size of the smallest slot, which is also the alignment of
+            the code.
+        """
+        self.block_size = block_size
+        self.min_slot_size = min_slot_size
+
+        # Every allocated slab
+        self.slabs = list()
+
+        # Slot size -> Slabs with free slots
+        self._slabs = dict()
+
+        # Address -> Slab
+        self._slots = dict()
+
+        # Code -> Address, Address -> [Code, References]
+        self._addresses = dict()
+        self._references = dict()
+
+    def __len__(self):
+        return len(self._references)
+
+    def add(self, code):
+        """Store the code and return its address.
+
+        :param bytes code:
+            The code to store.
+        :rtype: int
+        """
+        code = bytes(code)
+        address = self._addresses.get(code, None)
+        if address is not None:
+            self._references[address][1] += 1
+            return address
+
+        address = self._allocate(len(code))
+        memmove(c_void_p(address), code, len(code))
+
+        self._addresses[code] = address
+        self._references[address] = [code, 1]
+        return address
+
+    def remove(self, address):
+        """Release one reference to the code at the address."""
+        address = int(address)
+        reference = self._references.get(address, None)
+        if reference is None:
+            return
+
+        reference[1] -= 1
+        if reference[1]:
+            return
+
+        del self._references[address]
+        del self._addresses[reference[0]]
+        self._free(address)
+
+    def _allocate(self, size):
+        slot_size = self.min_slot_size
+        while slot_size < size:
+            slot_size *= 2
+
+        slabs = self._slabs.setdefault(slot_size, [])
+        if not slabs:
+            slab = _Slab(slot_size, self.block_size)
+            self.slabs.append(slab)
+            slabs.append(slab)
+
+        slab = slabs[-1]
+        address = slab.free_slots.pop()
+        slab.used += 1
+        if not slab.free_slots:
+            slabs.pop()
+
+        self._slots[address] = slab
+        return address
+
+    def _free(self, address):
+        slab = self._slots.pop(address)
+        slabs = self._slabs[slab.slot_size]
+
+        if not slab.free_slots:
+            slabs.append(slab)
+
+        slab.free_slots.append(address)
+        slab.used -= 1
+
+        # Give the block back, unless it is the last one of its size
+        if not slab.used and len(slabs) > 1:
+            slabs.remove(slab)
+            self.slabs.remove(slab)
+            slab.memory.dealloc()
+
+
+# =============================================================================
+# >> EXECUTABLE ARENA
+# =============================================================================
+executable_arena = ExecutableArena()
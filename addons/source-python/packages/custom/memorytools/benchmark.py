@@ -0,0 +1,115 @@
+# ../addons/source-python/packages/custom/memorytools/benchmark.py
+
+"""Provides benchmarks of the memorytools call paths."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Ctypes
+import ctypes
+#   Timeit
+from timeit import repeat
+
+# Source.Python Imports
+#   Core
+from core import PLATFORM
+#   Memory
+from memory import alloc
+from memory import Convention
+from memory import DataType
+from memory import make_object
+from memory import Pointer
+from memory.manager import CustomType
+from memory.manager import manager
+
+# Memory Tools Imports
+#   Manager
+from memorytools.manager import function_cache_stats
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ("benchmark_call_backends",
+           "format_results",
+           )
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def benchmark_call_backends(number=100000, repeat_count=5):
+    """Compare the Function and ctypes call paths.
+
+    A pipe function (``abs``) and a member function (``strlen`` on the
+    object's memory) of the C runtime are called through both paths.
+
+    :param int number:
+        The number of calls per measurement.
+    :param int repeat_count:
+        The number of measurements, the fastest one is used.
+    :return:
+        A dictionary with (call, backend) as key and the seconds per call as
+        value.
+    :rtype: dict
+    """
+    abs_ptr = _get_c_function("abs")
+    strlen_ptr = _get_c_function("strlen")
+
+    pipes = {
+        "function": manager.pipe_function_pointer(
+            abs_ptr, (DataType.INT,), DataType.INT, Convention.CDECL),
+        "ctypes": manager.ctypes_pipe_function_pointer(
+            abs_ptr, (DataType.INT,), DataType.INT, Convention.CDECL),
+    }
+
+    cls = manager.create_type("_CallBackendBenchmark", {
+        "function": manager.function_pointer(
+            strlen_ptr, (), DataType.UINT, Convention.CDECL),
+        "ctypes": manager.ctypes_function_pointer(
+            strlen_ptr, (), DataType.UINT, Convention.CDECL),
+    }, (CustomType,))
+
+    memory = alloc(16)
+    ctypes.memmove(memory.address, b"benchmark\0", 10)
+    obj = make_object(cls, memory)
+
+    results = dict()
+    for backend, function in pipes.items():
+        results[("pipe", backend)] = _measure(
+            lambda: function(-1), number, repeat_count)
+
+    for backend in pipes:
+        results[("member", backend)] = _measure(
+            lambda: getattr(obj, backend)(), number, repeat_count)
+
+    return results
+
+def format_results(results):
+    """Return the results of :func:`benchmark_call_backends` as text."""
+    lines = list()
+    for call in ("pipe", "member"):
+        function_time = results[(call, "function")]
+        ctypes_time = results[(call, "ctypes")]
+        lines.append(
+            "{call:<6} function: {function:8.3f} us  ctypes: {ctypes:8.3f} us"
+            "  ({speedup:.2f}x)".format(
+                call=call,
+                function=function_time * 1e6,
+                ctypes=ctypes_time * 1e6,
+                speedup=function_time / ctypes_time))
+
+    lines.append("function cache: {0}".format(dict(function_cache_stats)))
+    return "\n".join(lines)
+
+def _get_c_function(name):
+    if PLATFORM == "windows":
+        library = ctypes.cdll.msvcrt
+    else:
+        library = ctypes.CDLL(None)
+
+    return Pointer(ctypes.cast(getattr(library, name), ctypes.c_void_p).value)
+
+def _measure(function, number, repeat_count):
+    return min(repeat(function, number=number, repeat=repeat_count)) / number
@@ -0,0 +1,342 @@
+# ../addons/source-python/packages/custom/memorytools/bundle.py
+
+"""Provides precompiled bundles of memorytools data files."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Marshal
+import marshal
+#   Os
+import os
+#   Pathlib
+from pathlib import Path
+#   Struct
+import struct
+#   Sys
+import sys
+#   Zlib
+import zlib
+
+# Site-Packages Imports
+#   Path
+from path import Path as _GamePath
+
+# Source.Python Imports
+#   Core
+from core import GAME_NAME
+from core import GameConfigObj
+from core import PLATFORM
+from core import SOURCE_ENGINE
+#   Memory
+from memory import Convention
+from memory import DataType
+from memory.helpers import Key
+from memory.manager import manager
+#   Paths
+from paths import BASE_PATH
+
+# Memory Tools Imports
+#   Config
+from memorytools.config import config_cache
+#   Helpers
+from memorytools.helpers import as_identifier
+from memorytools.helpers import as_op_codes
+from memorytools.helpers import PrecompiledSection
+from memorytools.helpers import STRING_REFERENCE_PREFIX
+from memorytools.helpers import StringReference
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ("BUNDLE_VERSION",
+           "Bundle",
+           "compile_bundle",
+           "get_bundle_data",
+           "get_bundle_name",
+           "load_data_file",
+           )
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+BUNDLE_VERSION = 1
+
+_magic = b"MTBUNDLE"
+_header = struct.Struct("<8sHHBB")
+
+_platforms = ("linux", "windows")
+
+_base_path = Path(BASE_PATH)
+
+# Directory -> Bundle or None
+_bundles = dict()
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class Bundle:
+    """A precompiled bundle of the data files of a directory."""
+
+    def __init__(self, path, files, platform=PLATFORM):
+        """Initialize the bundle.
+
+        :param Path path:
+            The path of the bundle file.
+        :param dict files:
+            The compiled files of the bundle.
+        :param str platform:
+            The platform the files were compiled for.
+        """
+        self.path = Path(path)
+        self.files = files
+        self.platform = platform
+        self._sections = dict()
+
+    @classmethod
+    def load(cls, path):
+        """Load a bundle file or return None if it can't be used."""
+        with open(path, "rb") as file:
+            data = file.read()
+
+        try:
+            magic, version, marshal_version, major, minor = (
+                _header.unpack_from(data))
+            if (magic != _magic or
+                version != BUNDLE_VERSION or
+                marshal_version != marshal.version or
+                (major, minor) != sys.version_info[:2]):
+                return None
+
+            content = marshal.loads(zlib.decompress(data[_header.size:]))
+        except (struct.error, zlib.error, EOFError, ValueError, TypeError):
+            return None
+
+        if (content["source_engine"] != SOURCE_ENGINE or
+            content["game_name"] != GAME_NAME or
+            content["platform"] != PLATFORM):
+            return None
+
+        return cls(path, content["files"])
+
+    def save(self):
+        """Write the bundle to the disk."""
+        content = {
+            "source_engine": SOURCE_ENGINE,
+            "game_name": GAME_NAME,
+            "platform": self.platform,
+            "files": self.files,
+        }
+
+        header = _header.pack(
+            _magic, BUNDLE_VERSION, marshal.version, *sys.version_info[:2])
+
+        with open(self.path, "wb") as file:
+            file.write(header)
+            file.write(zlib.compress(marshal.dumps(content), 9))
+
+    def get(self, name):
+        """Return a copy of the compiled file or None if it is outdated."""
+        section = self._sections.get(name, None)
+        if section is None:
+            compiled_file = self.files.get(name, None)
+            if compiled_file is None:
+                return None
+
+            # Make sure the data files have not been changed
+            directory = self.path.parent
+            for source, mtime, size in compiled_file["sources"]:
+                try:
+                    stat = os.stat(str(directory / source))
+                except OSError:
+                    return None
+
+                if stat.st_mtime_ns != mtime or stat.st_size != size:
+                    return None
+
+            section = _as_section(compiled_file["data"])
+            self._sections[name] = section
+
+        return PrecompiledSection(section)
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def get_bundle_name(platform=PLATFORM):
+    """Return the file name of the bundle of the running game."""
+    return "{engine}.{game}.{platform}.bundle".format(
+        engine=SOURCE_ENGINE, game=GAME_NAME, platform=platform)
+
+def compile_bundle(path, platform=PLATFORM, manager=manager):
+    """Compile every data file of a directory into a bundle.
+
+    The bundle is only valid for the running game and the given platform.
+    The platform specific keys are resolved and the identifiers, arguments,
+    return types, conventions and op-codes are converted in advance.
+    Identifiers keep the ``2A`` wildcard bytes as their mask.
+
+    :param Path path:
+        The directory of the data files.
+    :param str platform:
+        The platform to compile the bundle for.
+    :param TypeManager manager:
+        The manager used to convert the values.
+    :return:
+        The compiled bundle.
+    :rtype: Bundle
+    """
+    path = Path(path)
+
+    files = dict()
+    for file in sorted(path.rglob("*.ini")):
+        name = _get_logical_name(file.relative_to(path))
+        if name in files:
+            continue
+
+        sources = list()
+        for source in _get_sources(path / name):
+            stat = source.stat()
+            sources.append((
+                source.relative_to(path).as_posix(),
+                stat.st_mtime_ns,
+                stat.st_size))
+
+        files[name] = {
+            "sources": sources,
+            "data": _compile_section(
+                GameConfigObj(_GamePath(path / name)), platform, manager),
+        }
+
+    bundle = Bundle(path / get_bundle_name(platform), files, platform)
+    bundle.save()
+
+    _bundles.clear()
+    return bundle
+
+def get_bundle_data(file):
+    """Return the compiled data of a file or None if there is no bundle."""
+    file = Path(file)
+
+    directory = file.parent
+    while True:
+        bundle = _get_bundle(directory)
+        if bundle is not None:
+            return bundle.get(file.relative_to(directory).as_posix())
+
+        if directory == _base_path or directory.parent == directory:
+            return None
+
+        directory = directory.parent
+
+def load_data_file(file):
+    """Return the compiled data of a file or parse the data file."""
+    if not isinstance(file, (str, Path)):
+        return GameConfigObj(file)
+
+    data = get_bundle_data(file)
+    if data is not None:
+        return data
+
+    return config_cache.get(file)
+
+def _get_bundle(directory):
+    try:
+        return _bundles[directory]
+    except KeyError:
+        pass
+
+    bundle_path = directory / get_bundle_name()
+    bundle = Bundle.load(bundle_path) if bundle_path.is_file() else None
+
+    _bundles[directory] = bundle
+    return bundle
+
+def _get_logical_name(relative_path):
+    parts = relative_path.parts
+    if len(parts) >= 3 and parts[-3:-1] == (SOURCE_ENGINE, GAME_NAME):
+        parts = parts[:-3] + parts[-1:]
+    elif len(parts) >= 2 and parts[-2] == SOURCE_ENGINE:
+        parts = parts[:-2] + parts[-1:]
+
+    return Path(*parts).as_posix()
+
+def _get_sources(file):
+    for source in (
+            file,
+            file.parent / SOURCE_ENGINE / file.name,
+            file.parent / SOURCE_ENGINE / GAME_NAME / file.name):
+        if source.is_file():
+            yield source
+
+def _compile_section(section, platform, manager):
+    suffixes = tuple("_" + other for other in _platforms if other != platform)
+    platform_suffix = "_" + platform
+
+    data = dict()
+    for key, value in section.items():
+        if isinstance(value, dict):
+            data[key] = _compile_section(value, platform, manager)
+            continue
+
+        if key.endswith(suffixes):
+            continue
+
+        if key.endswith(platform_suffix):
+            key = key[:-len(platform_suffix)]
+        elif key + platform_suffix in section:
+            continue
+
+        converter = _compilers.get(key, None)
+        data[key] = value if converter is None else converter(manager, value)
+
+    return data
+
+def _as_section(data):
+    return {
+        key: (PrecompiledSection(_as_section(value))
+              if isinstance(value, dict) else value)
+        for key, value in data.items()}
+
+def _compile_identifier(manager, value):
+    identifier = as_identifier(manager, value)
+
+    # Marshal only supports the built-in types
+    if isinstance(identifier, tuple):
+        return tuple(
+            _compile_alternative(alternative) for alternative in identifier)
+    return _compile_alternative(identifier)
+
+def _compile_alternative(identifier):
+    if isinstance(identifier, StringReference):
+        return STRING_REFERENCE_PREFIX + identifier
+    return identifier
+
+def _compile_args(manager, value):
+    return tuple(int(data_type) for data_type in Key.as_args_tuple(
+        manager, value))
+
+def _compile_return_type(manager, value):
+    return_type = Key.as_return_type(manager, value)
+    if isinstance(return_type, DataType):
+        return int(return_type)
+    return return_type
+
+def _compile_convention(manager, value):
+    convention = getattr(Convention, value, None)
+    if isinstance(convention, Convention):
+        return int(convention)
+    return value
+
+_compilers = {
+    Key.IDENTIFIER: _compile_identifier,
+    Key.ARGS: _compile_args,
+    Key.RETURN_TYPE: _compile_return_type,
+    Key.CONVENTION: _compile_convention,
+    "op_codes": as_op_codes,
+    "base_op_codes": as_op_codes,
+}
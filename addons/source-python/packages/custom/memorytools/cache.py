@@ -0,0 +1,342 @@
+# ../addons/source-python/packages/custom/memorytools/cache.py
+
+"""Provides a persistent cache for resolved addresses."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Ctypes
+import ctypes
+#   Json
+import json
+#   Os
+import os
+#   Pathlib
+from pathlib import Path
+#   Zlib
+from zlib import crc32
+
+# Source.Python Imports
+#   Core
+from core import PLATFORM
+#   Paths
+from paths import CUSTOM_DATA_PATH
+
+# Memory Tools Imports
+#   Helpers
+from memorytools.helpers import STRING_REFERENCE_PREFIX
+from memorytools.helpers import StringReference
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ("ADDRESS_CACHE_PATH",
+           "AddressCache",
+           "address_cache",
+           "get_binary_identity",
+           "get_binary_path",
+           )
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# ../addons/source-python/data/custom/memorytools/cache
+ADDRESS_CACHE_PATH = CUSTOM_DATA_PATH / "memorytools" / "cache"
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _BinaryCache:
+    """Resolved offsets of a single loaded binary."""
+
+    def __init__(self, path, identity, file):
+        self.path = path
+        self.identity = identity
+        self.file = file
+        self.offsets = dict()
+
+        # Whether the offsets or winners changed since the last save
+        self.dirty = False
+
+        # Chain key -> Key of the alternative which matched
+        self.winners = dict()
+
+
+class AddressCache:
+    """Cache of resolved addresses, stored relative to the binary base.
+
+    The offsets are keyed by the identity of the binary on disk (path, size
+    and modification time), so a game update invalidates the cache.
+
+    Changes are kept in memory until :meth:`flush` is called, which
+    :mod:`memorytools` does at the end of every load, so a file is written
+    at most once per load.
+    """
+
+    version = 1
+
+    def __init__(self, path, enabled=True, persistent=True, verify=True):
+        """Initialize the cache.
+
+        :param Path path:
+            The directory to store the cache files in.
+        :param bool enabled:
+            Whether the cache should be used at all.
+        :param bool persistent:
+            Whether the cache should be written to/read from the disk.
+        :param bool verify:
+            Whether a cached signature should be compared with the memory
+            before it is returned.
+        """
+        self.path = Path(path)
+        self.enabled = enabled
+        self.persistent = persistent
+        self.verify = verify
+
+        self._binaries = dict()
+
+    def get(self, binary, identifier):
+        """Return the cached address of the identifier or None."""
+        if not self.enabled:
+            return None
+
+        key = self.get_key(identifier)
+        if key is None:
+            return None
+
+        offset = self._get_binary_cache(binary).offsets.get(key, None)
+        if offset is None:
+            return None
+
+        address = binary.address + offset
+        if (self.verify and
+            isinstance(identifier, bytes) and
+            not self._match(address, identifier)):
+            self.discard(binary, identifier)
+            return None
+
+        return address
+
+    def set(self, binary, identifier, address):
+        """Store the address of the identifier."""
+        if not self.enabled:
+            return
+
+        key = self.get_key(identifier)
+        if key is None:
+            return
+
+        binary_cache = self._get_binary_cache(binary)
+        binary_cache.offsets[key] = int(address) - binary.address
+        binary_cache.dirty = True
+
+    def update(self, binary, addresses):
+        """Store the addresses of a dictionary of identifiers."""
+        if not self.enabled or not addresses:
+            return
+
+        binary_cache = self._get_binary_cache(binary)
+        for identifier, address in addresses.items():
+            key = self.get_key(identifier)
+            if key is not None:
+                binary_cache.offsets[key] = int(address) - binary.address
+                binary_cache.dirty = True
+
+    def get_winner(self, binary, chain):
+        """Return the alternative of the chain which matched last or None.
+
+        :param BinaryFile binary:
+            The binary the chain was resolved in.
+        :param IdentifierChain chain:
+            The alternative identifiers.
+        """
+        if not self.enabled:
+            return None
+
+        binary_cache = self._get_binary_cache(binary)
+        key = binary_cache.winners.get(self.get_chain_key(chain), None)
+        for identifier in chain:
+            if self.get_key(identifier) == key:
+                return identifier
+
+        return None
+
+    def set_winner(self, binary, chain, identifier):
+        """Store the alternative of the chain which matched."""
+        if not self.enabled:
+            return
+
+        key = self.get_key(identifier)
+        binary_cache = self._get_binary_cache(binary)
+        chain_key = self.get_chain_key(chain)
+        if binary_cache.winners.get(chain_key) != key:
+            binary_cache.winners[chain_key] = key
+            binary_cache.dirty = True
+
+    def discard(self, binary, identifier):
+        """Remove the identifier from the cache."""
+        key = self.get_key(identifier)
+        binary_cache = self._get_binary_cache(binary)
+        if binary_cache.offsets.pop(key, None) is not None:
+            binary_cache.dirty = True
+
+    def invalidate(self, binary=None):
+        """Remove the cached addresses of the binary or of all binaries."""
+        if binary is None:
+            binary_caches = list(self._binaries.values())
+            self._binaries.clear()
+            if self.path.is_dir():
+                for file in self.path.glob("*.json"):
+                    file.unlink()
+        else:
+            binary_cache = self._binaries.pop(binary.address, None)
+            binary_caches = [] if binary_cache is None else [binary_cache]
+
+        for binary_cache in binary_caches:
+            if binary_cache.file is not None and binary_cache.file.exists():
+                binary_cache.file.unlink()
+
+    def flush(self):
+        """Write the cached addresses of every changed binary to the disk."""
+        for binary_cache in self._binaries.values():
+            if binary_cache.dirty:
+                self.save(binary_cache)
+
+    def save(self, binary_cache):
+        """Write the cached addresses of the binary to the disk."""
+        binary_cache.dirty = False
+        if not self.persistent or binary_cache.file is None:
+            return
+
+        data = {
+            "version": self.version,
+            "path": binary_cache.path,
+            "identity": binary_cache.identity,
+            "offsets": binary_cache.offsets,
+            "winners": binary_cache.winners,
+        }
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        temp_file = binary_cache.file.with_suffix(".tmp")
+        with open(temp_file, "w") as file:
+            json.dump(data, file, indent=1, sort_keys=True)
+        os.replace(str(temp_file), str(binary_cache.file))
+
+    @staticmethod
+    def get_key(identifier):
+        """Return the cache key of the identifier."""
+        if isinstance(identifier, bytes):
+            return identifier.hex().upper()
+        if isinstance(identifier, StringReference):
+            return STRING_REFERENCE_PREFIX + identifier
+        if isinstance(identifier, str):
+            return "symbol:" + identifier
+        return None
+
+    @classmethod
+    def get_chain_key(cls, chain):
+        """Return the cache key of a chain of identifiers."""
+        return "|".join(str(cls.get_key(identifier)) for identifier in chain)
+
+    @staticmethod
+    def _match(address, identifier):
+        data = ctypes.string_at(address, len(identifier))
+        for signature_byte, data_byte in zip(identifier, data):
+            if signature_byte != 0x2A and signature_byte != data_byte:
+                return False
+        return True
+
+    def _get_binary_cache(self, binary):
+        binary_cache = self._binaries.get(binary.address, None)
+        if binary_cache is not None:
+            return binary_cache
+
+        path = get_binary_path(binary)
+        identity = get_binary_identity(binary, path)
+        if identity is None:
+            binary_cache = _BinaryCache(None, None, None)
+        else:
+            file = self.path / "{name}.{hash:08X}.json".format(
+                name=Path(path).name, hash=crc32(path.encode("utf-8")))
+            binary_cache = _BinaryCache(path, identity, file)
+
+            if self.persistent:
+                self._load(binary_cache)
+
+        self._binaries[binary.address] = binary_cache
+        return binary_cache
+
+    def _load(self, binary_cache):
+        try:
+            with open(binary_cache.file) as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+
+        if (data.get("version") != self.version or
+            data.get("path") != binary_cache.path or
+            data.get("identity") != binary_cache.identity):
+            return
+
+        binary_cache.offsets.update(data.get("offsets", {}))
+        binary_cache.winners.update(data.get("winners", {}))
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def get_binary_identity(binary, path):
+    """Return the identity of the binary's file or None.
+
+    The identity changes whenever the file is replaced, e.g. by a game
+    update.
+
+    :param BinaryFile binary:
+        The loaded binary.
+    :param str path:
+        The path of the file the binary was loaded from.
+    :rtype: list
+    """
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+
+    return [stat.st_size, stat.st_mtime_ns, binary.size]
+
+def get_binary_path(binary):
+    """Return the path of the file the binary was loaded from or None."""
+    address = binary.address
+
+    if PLATFORM == "windows":
+        buffer = ctypes.create_unicode_buffer(1024)
+        if not ctypes.windll.kernel32.GetModuleFileNameW(
+                ctypes.c_void_p(address), buffer, len(buffer)):
+            return None
+        return buffer.value
+
+    try:
+        with open("/proc/self/maps") as file:
+            for line in file:
+                fields = line.split(None, 5)
+                if len(fields) < 6:
+                    continue
+
+                start, end = fields[0].split("-")
+                if int(start, 16) <= address < int(end, 16):
+                    path = fields[5].strip()
+                    return path if path.startswith("/") else None
+    except OSError:
+        pass
+
+    return None
+
+
+# =============================================================================
+# >> ADDRESS CACHE
+# =============================================================================
+address_cache = AddressCache(ADDRESS_CACHE_PATH)
@@ -0,0 +1,117 @@
+# ../addons/source-python/packages/custom/memorytools/config.py
+
+"""Provides a shared cache of parsed data files."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Os
+import os
+
+# Site-Packages Imports
+#   Path
+from path import Path
+
+# Source.Python Imports
+#   Core
+from core import GAME_NAME
+from core import GameConfigObj
+from core import SOURCE_ENGINE
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ("ConfigCache",
+           "config_cache",
+           )
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class ConfigCache:
+    """Cache of parsed data files keyed by path and modification time.
+
+    :meth:`get` hands out a deep copy of the parsed file as plain
+    dictionaries, so callers can modify any section without changing the
+    cached file.
+    """
+
+    def __init__(self):
+        """Initialize the cache."""
+        self.hits = 0
+        self.misses = 0
+
+        self._configs = dict()
+
+    def get(self, file):
+        """Return a deep copy of the parsed data file.
+
+        :param Path/str file:
+            The data file to parse. Like :class:`core.GameConfigObj`, the
+            engine and game specific files are only merged if ``file`` is a
+            :class:`path.Path`.
+        :rtype: dict
+        """
+        key = (str(file), isinstance(file, Path))
+        mtimes = self._get_mtimes(file)
+
+        cached = self._configs.get(key, None)
+        if cached is not None and cached[0] == mtimes:
+            self.hits += 1
+        else:
+            self.misses += 1
+            cached = (mtimes, GameConfigObj(file))
+            self._configs[key] = cached
+
+        return _copy_section(cached[1])
+
+    def clear(self):
+        """Remove all the parsed data files and reset the counters."""
+        self._configs.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _get_mtimes(file):
+        if isinstance(file, Path):
+            files = (
+                file,
+                file.parent / SOURCE_ENGINE / file.name,
+                file.parent / SOURCE_ENGINE / GAME_NAME / file.name)
+        else:
+            files = (file,)
+
+        mtimes = list()
+        for file in files:
+            try:
+                mtimes.append(os.stat(str(file)).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+
+        return tuple(mtimes)
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def _copy_section(section):
+    # Faster than copy.deepcopy, as the values are only strings and lists
+    copy = dict()
+    for key, value in section.items():
+        if isinstance(value, dict):
+            value = _copy_section(value)
+        elif isinstance(value, list):
+            value = list(value)
+
+        copy[key] = value
+
+    return copy
+
+
+# =============================================================================
+# >> CONFIG CACHE
+# =============================================================================
+config_cache = ConfigCache()
@@ -8,18 +8,24 @@
 # Python Imports
 #   Ctypes
 import ctypes
+#   Types
+from types import MethodType
+#   Weakref
+from weakref import finalize
 
 # Source.Python Imports
 #   Core
-from core import AutoUnload
 from core import PLATFORM
+from core import WeakAutoUnload
 #   Memory
-from memory import alloc
 from memory import Convention
 from memory import DataType
+from memory import get_object_pointer
+from memory import Pointer
 
 # Memory Tools Imports
 #   Memory Tools
+from memorytools.arena import executable_arena
 from memorytools.conventions import CDECL_RETURN4
 from memorytools.conventions import FASTCALL_CALLER
 
@@ -27,33 +33,80 @@ from memorytools.conventions import FASTCALL_CALLER
 # =============================================================================
 # >> ALL DECLARATION
 # =============================================================================
-__all__ = ("get_ctype_argtypes",
+__all__ = ("is_ctype_compatible",
+           "get_ctype_argtypes",
            "get_ctype_calling_convention",
            "get_ctype_from_data_type",
            "get_ctype_function",
+           "get_ctype_prototype",
+           "get_ctype_signature",
            "Base_Ctypes",
            "Ctypes_CDECL",
            "Ctypes_FASTCALL",
            "Ctypes_FASTCALL_CALLER",
            "Ctypes_THISCALL",
            "Ctypes_STDCALL",
+           "CtypesFunction",
            )
 
 
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# (factory, restype, argtypes) -> Prototype
+_prototypes = dict()
+
+# (arguments, return_type) -> (argtypes, restype)
+_signatures = dict()
+
+# Data types which can be passed to ctypes without a conversion
+_compatible_data_types = frozenset((
+    DataType.BOOL,
+    DataType.UCHAR,
+    DataType.SHORT,
+    DataType.USHORT,
+    DataType.INT,
+    DataType.UINT,
+    DataType.LONG,
+    DataType.ULONG,
+    DataType.LONG_LONG,
+    DataType.ULONG_LONG,
+    DataType.FLOAT,
+    DataType.DOUBLE,
+    DataType.POINTER,
+))
+
+
 # =============================================================================
 # >> CLASSES
 # =============================================================================
-class Base_Ctypes(AutoUnload):
+class Base_Ctypes(WeakAutoUnload):
+    """Calls a function through a stub stored in the executable arena.
+
+    If ``auto_dealloc`` is True, the slot of the stub is released once the
+    instance is garbage collected, so :attr:`function` must not be used
+    without the instance. Otherwise the instance is kept alive until it is
+    unloaded, so just :attr:`function` can be kept.
+    """
+
+    # Instances created with auto_dealloc=False, kept until unloaded
+    _persistent = set()
+
     def __init__(self, address, argtypes, restype, auto_dealloc=True):
-        functype = ctypes.CFUNCTYPE(restype, *argtypes)
+        functype = get_ctype_prototype(restype, argtypes)
 
         size = self.get_size(argtypes)
         op_codes = self.make_asm(int(address), size, argtypes, restype)
-        op_codes_size = len(op_codes)
 
-        self.memory = alloc(op_codes_size, auto_dealloc)
-        self.memory.unprotect(op_codes_size)
-        ctypes.memmove(ctypes.c_void_p(self.memory.address), op_codes, op_codes_size)
+        # Identical stubs share the same slot of the arena
+        self.memory = Pointer(executable_arena.add(op_codes))
+
+        self._finalizer = None
+        if auto_dealloc:
+            self._finalizer = finalize(
+                self, executable_arena.remove, self.memory.address)
+        else:
+            self._persistent.add(self)
 
         self.function = functype(self.memory.address)
 
@@ -61,7 +114,16 @@ class Base_Ctypes(AutoUnload):
         return self.function(*args, **kwargs)
 
     def _unload_instance(self):
-        self.memory.dealloc()
+        self._persistent.discard(self)
+        if not self.memory:
+            return
+
+        if self._finalizer is not None:
+            self._finalizer()
+        else:
+            executable_arena.remove(self.memory.address)
+
+        self.memory = Pointer()
 
     @staticmethod
     def get_size(argtypes):
@@ -74,7 +136,7 @@ class Base_Ctypes(AutoUnload):
 
 class Ctypes_CDECL:
     def __init__(self, address, argtypes, restype, auto_dealloc=True):
-        functype = ctypes.CFUNCTYPE(restype, *argtypes)
+        functype = get_ctype_prototype(restype, argtypes)
         self.function = functype(int(address))
 
     def __call__(self, *args, **kwargs):
@@ -83,7 +145,7 @@ class Ctypes_CDECL:
 
 class Ctypes_STDCALL(Ctypes_CDECL):
     def __init__(self, address, argtypes, restype, auto_dealloc=True):
-        functype = ctypes.WINFUNCTYPE(restype, *argtypes)
+        functype = get_ctype_prototype(restype, argtypes, ctypes.WINFUNCTYPE)
         self.function = functype(int(address))
 
 
@@ -187,13 +249,83 @@ class Ctypes_DELPHI_MODIFIED(Base_Ctypes):
         return bytes(op_codes)
 
 
+class CtypesFunction:
+    """Calls a function through ctypes instead of :class:`memory.Function`.
+
+    Pointer arguments accept Pointer, int or any object with a pointer and
+    a pointer return value is returned as Pointer. If the instance is set
+    on a type, it is bound to the instances like a method.
+    """
+
+    def __init__(self, function, doc=None, calling_convention=None):
+        """Initialize the function.
+
+        :param Function function:
+            The function to call.
+        :param str doc:
+            The documentation of the function.
+        :param calling_convention:
+            The ctypes calling convention class to use.
+        :raise ValueError:
+            Raised if the calling convention or a data type is not
+            supported.
+        """
+        if not is_ctype_compatible(function.arguments, function.return_type):
+            raise ValueError("Given data types are not supported.")
+
+        self.function = function
+        self.ctype = get_ctype_function(function, calling_convention)
+        self.__doc__ = doc
+
+        self._call = self.ctype.function
+        self._pointer_args = tuple(
+            index for index, data_type in enumerate(function.arguments)
+            if data_type == DataType.POINTER)
+        self._pointer_return = function.return_type == DataType.POINTER
+
+    def __call__(self, *args):
+        if self._pointer_args:
+            args = list(args)
+            for index in self._pointer_args:
+                args[index] = _as_address(args[index])
+
+        result = self._call(*args)
+        if self._pointer_return:
+            return Pointer(result or 0)
+
+        return result
+
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+
+        return MethodType(self, obj)
+
+
 # =============================================================================
 # >> FUNCTIONS
 # =============================================================================
+def is_ctype_compatible(arguments, return_type):
+    """Return whether the function can be called through CtypesFunction."""
+    if return_type != DataType.VOID and return_type not in _compatible_data_types:
+        return False
+
+    return all(
+        data_type in _compatible_data_types for data_type in arguments)
+
+def _as_address(value):
+    if value is None or isinstance(value, int):
+        return value
+
+    if isinstance(value, Pointer):
+        return value.address
+
+    return get_object_pointer(value).address
+
 def get_ctype_function(function, calling_convention=None, auto_dealloc=True):
     address = function.trampoline.address if function.is_hooked() else function.address
-    argtypes = get_ctype_argtypes(*function.arguments)
-    restype = get_ctype_from_data_type(function.return_type)
+    argtypes, restype = get_ctype_signature(
+        function.arguments, function.return_type)
 
     if calling_convention is None:
         if function.convention != Convention.CUSTOM:
@@ -227,6 +359,29 @@ def get_ctype_calling_convention(calling_convention):
     except KeyError:
         raise ValueError("Given calling_convention is not supported.")
 
+def get_ctype_prototype(restype, argtypes, factory=ctypes.CFUNCTYPE):
+    """Return the cached function prototype of the signature."""
+    key = (factory, restype, tuple(argtypes))
+    try:
+        return _prototypes[key]
+    except KeyError:
+        pass
+
+    prototype = _prototypes[key] = factory(restype, *argtypes)
+    return prototype
+
+def get_ctype_signature(arguments, return_type):
+    """Return the cached ctypes argtypes and restype of the data types."""
+    key = (tuple(arguments), return_type)
+    try:
+        return _signatures[key]
+    except KeyError:
+        pass
+
+    signature = _signatures[key] = (
+        get_ctype_argtypes(*arguments), get_ctype_from_data_type(return_type))
+    return signature
+
 def get_ctype_argtypes(*argtypes):
     ctype_argtypes = list()
     for data_type in argtypes:
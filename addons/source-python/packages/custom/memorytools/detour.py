@@ -0,0 +1,369 @@
+# ../addons/source-python/packages/custom/memorytools/detour.py
+
+"""Provides lightweight inline detours of x86 functions."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Ctypes
+import ctypes
+
+# Source.Python Imports
+#   Core
+from core import WeakAutoUnload
+#   Memory
+from memory import Pointer
+
+# Memory Tools Imports
+#   Memory Tools
+from memorytools import get_bytes
+from memorytools import get_jmp_bytes
+#   Arena
+from memorytools.arena import executable_arena
+#   Patcher
+from memorytools.patcher import Patcher
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ("Detour",
+           "get_instruction_size",
+           "get_prologue_size",
+           "relocate_code",
+           )
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# The size of the jump written over the function
+JMP_SIZE = 5
+
+_prefixes = frozenset((0x26, 0x2E, 0x36, 0x3E, 0x64, 0x65, 0x66, 0x67, 0xF2, 0xF3))
+
+# Op-codes followed by a ModRM byte
+_modrm_op_codes = frozenset((
+    0x00, 0x01, 0x02, 0x03, 0x08, 0x09, 0x0A, 0x0B,
+    0x10, 0x11, 0x12, 0x13, 0x18, 0x19, 0x1A, 0x1B,
+    0x20, 0x21, 0x22, 0x23, 0x28, 0x29, 0x2A, 0x2B,
+    0x30, 0x31, 0x32, 0x33, 0x38, 0x39, 0x3A, 0x3B,
+    0x84, 0x85, 0x86, 0x87, 0x88, 0x89, 0x8A, 0x8B, 0x8D, 0x8F,
+    0xD1, 0xD3, 0xD9, 0xDD, 0xFE, 0xFF,
+))
+
+# Op-codes followed by a ModRM byte and an immediate of the given size,
+# None is the operand size
+_modrm_imm_op_codes = {
+    0x69: None, 0x6B: 1, 0x80: 1, 0x81: None, 0x83: 1,
+    0xC0: 1, 0xC1: 1, 0xC6: 1, 0xC7: None,
+}
+
+# Op-codes followed by an immediate of the given size only
+_imm_op_codes = {
+    0x04: 1, 0x05: None, 0x0C: 1, 0x0D: None, 0x24: 1, 0x25: None,
+    0x2C: 1, 0x2D: None, 0x34: 1, 0x35: None, 0x3C: 1, 0x3D: None,
+    0x68: None, 0x6A: 1, 0xA8: 1, 0xA9: None, 0xC2: 2,
+    0xA0: 4, 0xA1: 4, 0xA2: 4, 0xA3: 4,
+}
+
+# Two byte (0x0F) op-codes followed by a ModRM byte
+_modrm_0f_op_codes = frozenset((
+    0x10, 0x11, 0x12, 0x13, 0x14, 0x15, 0x16, 0x17, 0x1F,
+    0x28, 0x29, 0x2A, 0x2C, 0x2D, 0x2E, 0x2F,
+    0x51, 0x54, 0x57, 0x58, 0x59, 0x5A, 0x5C, 0x5D, 0x5E, 0x5F,
+    0x6E, 0x7E, 0xAF, 0xB6, 0xB7, 0xBE, 0xBF, 0xD6, 0xEF,
+) + tuple(range(0x40, 0x50)) + tuple(range(0x90, 0xA0)))
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class Detour(WeakAutoUnload):
+    """Redirects a function to a callback by overwriting its prologue.
+
+    The overwritten instructions are relocated into a trampoline in the
+    executable arena, followed by a jump back to the rest of the function,
+    so the callback can still call the original function.
+
+    The callback is entered with the stack and the registers of the
+    original call, so it has to use the same calling convention.
+    """
+
+    def __init__(
+            self, pointer, callback, prototype=None, size=None,
+            base_op_codes=None):
+        """Initialize the detour.
+
+        :param Pointer/int pointer:
+            The pointer or memory address of the function.
+        :param callback:
+            The address of a native callback, a ctypes function pointer or
+            a Python callable if ``prototype`` is given.
+        :param prototype:
+            The ctypes function type of the function, e.g. created by
+            :func:`memorytools.ctypes.get_ctype_prototype`. It wraps
+            Python callbacks and :attr:`original`.
+        :param int size:
+            The size of the whole instructions to overwrite. It has to end
+            on an instruction boundary. Defaults to the size of the
+            instructions covering the jump.
+        :param bytes base_op_codes:
+            Base op-codes used for verification to prevent crashes
+            when binary has been changed.
+        :raise TypeError:
+            Raised if the callback is not supported.
+        :raise ValueError:
+            Raised if the prologue can not be relocated, the size is too
+            small or splits an instruction or ``base_op_codes`` does not
+            match the original op-codes.
+        """
+        self._trampoline = None
+        self.patcher = None
+
+        address = int(pointer)
+
+        if isinstance(callback, (Pointer, int)):
+            self.callback = None
+            callback_address = int(callback)
+        else:
+            if not isinstance(callback, ctypes._CFuncPtr):
+                if prototype is None or not callable(callback):
+                    raise TypeError(
+                        "callback type is not supported: {type}".format(
+                            type=repr(type(callback))))
+
+                callback = prototype(callback)
+
+            # Keep the callback alive as long as the detour
+            self.callback = callback
+            callback_address = ctypes.cast(callback, ctypes.c_void_p).value
+
+        if size is None:
+            size = get_prologue_size(address)
+        elif size < JMP_SIZE:
+            raise ValueError(
+                "The size must be at least {0} bytes.".format(JMP_SIZE))
+        elif get_prologue_size(address, size) != size:
+            raise ValueError(
+                "The size must end on an instruction boundary.")
+
+        self.address = address
+        self.size = size
+
+        original = get_bytes(address, size)
+        Patcher.check_op_codes(original, base_op_codes)
+
+        trampoline = relocate_code(original, address)
+        trampoline += _get_absolute_jmp_bytes(address + size)
+
+        self.patcher = Patcher(
+            address, size, get_jmp_bytes(address, callback_address, False),
+            base_op_codes)
+
+        # Don't leave the patcher registered if the detour is not created
+        try:
+            self._trampoline = executable_arena.add(trampoline)
+            self.trampoline = Pointer(self._trampoline)
+
+            self.original = None
+            if prototype is not None:
+                self.original = prototype(self._trampoline)
+        except Exception:
+            self._unload_instance()
+            raise
+
+    @property
+    def enabled(self):
+        return self.patcher is not None and self.patcher.patched
+
+    def enable(self):
+        """Redirect the function to the callback."""
+        self.patcher.patch()
+
+    def disable(self):
+        """Restore the prologue of the function."""
+        self.patcher.reset()
+
+    def _unload_instance(self):
+        if self.patcher is not None:
+            self.patcher._unload_instance()
+            self.patcher = None
+
+        if self._trampoline is not None:
+            executable_arena.remove(self._trampoline)
+            self._trampoline = None
+            self.trampoline = Pointer()
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def get_instruction_size(code, offset=0):
+    """Return the size of the x86 instruction at the offset.
+
+    Only the instructions commonly found in function prologues are
+    supported.
+
+    :param bytes code:
+        The code.
+    :param int offset:
+        The offset of the instruction in the code.
+    :raise ValueError:
+        Raised if the instruction is not supported.
+    :rtype: int
+    """
+    start = offset
+    operand_size = 4
+    while code[offset] in _prefixes:
+        if code[offset] == 0x66:
+            operand_size = 2
+        offset += 1
+
+    op_code = code[offset]
+    offset += 1
+
+    if op_code == 0x0F:
+        op_code = code[offset]
+        offset += 1
+        if 0x80 <= op_code <= 0x8F:
+            return offset - start + 4
+        if op_code in _modrm_0f_op_codes:
+            return offset - start + _get_modrm_size(code, offset)
+        raise ValueError(
+            "Unsupported instruction: 0F {0:02X}".format(op_code))
+
+    if 0x40 <= op_code <= 0x61 or op_code in (0x90, 0x99, 0xC3, 0xC9, 0xCC):
+        return offset - start
+    if 0x70 <= op_code <= 0x7F or op_code in (0xEB, 0xB0, 0xB1, 0xB2,
+            0xB3, 0xB4, 0xB5, 0xB6, 0xB7):
+        return offset - start + 1
+    if 0xB8 <= op_code <= 0xBF:
+        return offset - start + operand_size
+    if op_code in (0xE8, 0xE9):
+        return offset - start + 4
+    if op_code in _modrm_op_codes:
+        return offset - start + _get_modrm_size(code, offset)
+    if op_code in _modrm_imm_op_codes:
+        size = _modrm_imm_op_codes[op_code] or operand_size
+        return offset - start + _get_modrm_size(code, offset) + size
+    if op_code == 0xF6 or op_code == 0xF7:
+        # test has an immediate, the other forms do not
+        size = (1 if op_code == 0xF6 else operand_size) if (
+            code[offset] >> 3 & 7) in (0, 1) else 0
+        return offset - start + _get_modrm_size(code, offset) + size
+    if op_code in _imm_op_codes:
+        return offset - start + (_imm_op_codes[op_code] or operand_size)
+
+    raise ValueError("Unsupported instruction: {0:02X}".format(op_code))
+
+def _get_modrm_size(code, offset):
+    modrm = code[offset]
+    mod = modrm >> 6
+    rm = modrm & 7
+
+    size = 1
+    if mod == 3:
+        return size
+
+    if rm == 4:
+        size += 1
+        if mod == 0 and code[offset + 1] & 7 == 5:
+            size += 4
+
+    if mod == 0 and rm == 5:
+        size += 4
+    elif mod == 1:
+        size += 1
+    elif mod == 2:
+        size += 4
+
+    return size
+
+def get_prologue_size(pointer, min_size=JMP_SIZE):
+    """Return the size of the whole instructions covering min_size bytes.
+
+    :param Pointer/int pointer:
+        The pointer or memory address of the function.
+    :param int min_size:
+        The number of bytes to cover.
+    :raise ValueError:
+        Raised if an instruction is not supported.
+    :rtype: int
+    """
+    # The longest x86 instruction is 15 bytes
+    code = get_bytes(pointer, min_size + 15)
+
+    size = 0
+    while size < min_size:
+        size += get_instruction_size(code, size)
+
+    return size
+
+def relocate_code(code, address):
+    """Return the instructions rewritten to run from any address.
+
+    Relative calls and jumps are replaced by absolute ones, which do not
+    depend on the address of the relocated code.
+
+    :param bytes code:
+        The whole instructions to relocate.
+    :param int address:
+        The original address of the code.
+    :raise ValueError:
+        Raised if an instruction is not supported or a relative call or
+        jump targets the relocated code itself.
+    :rtype: bytes
+    """
+    relocated = bytearray()
+    offset = 0
+    while offset < len(code):
+        size = get_instruction_size(code, offset)
+        instruction = code[offset:offset+size]
+        end = address + offset + size
+
+        # Relative calls and jumps are never prefixed by the compilers
+        op_code = instruction[0]
+
+        if op_code == 0xE8:
+            # Push the original return address and jump to the function
+            target = _get_relative_target(code, address, end, instruction, 1)
+            relocated += b"\x68" + (end & 0xFFFFFFFF).to_bytes(4, "little")
+            relocated += _get_absolute_jmp_bytes(target)
+        elif op_code in (0xE9, 0xEB):
+            relocated += _get_absolute_jmp_bytes(
+                _get_relative_target(code, address, end, instruction, 1))
+        elif 0x70 <= op_code <= 0x7F or (
+                op_code == 0x0F and 0x80 <= instruction[1] <= 0x8F):
+            condition = op_code & 0xF if op_code != 0x0F else (
+                instruction[1] & 0xF)
+            target = _get_relative_target(
+                code, address, end, instruction, 1 if op_code != 0x0F else 2)
+
+            # Skip the absolute jump if the condition is not met
+            jmp_bytes = _get_absolute_jmp_bytes(target)
+            relocated += bytes((0x70 | condition ^ 1, len(jmp_bytes)))
+            relocated += jmp_bytes
+        else:
+            relocated += instruction
+
+        offset += size
+
+    return bytes(relocated)
+
+def _get_relative_target(code, address, end, instruction, start):
+    target = end + int.from_bytes(
+        instruction[start:], "little", signed=True)
+
+    # The relocated code does not exist at the original address anymore
+    if address <= target < address + len(code):
+        raise ValueError(
+            "Relative branch into the relocated code: 0x{0:X}".format(
+                target & 0xFFFFFFFF))
+
+    return target
+
+def _get_absolute_jmp_bytes(dest):
+    # push dest; ret
+    return b"\x68" + (int(dest) & 0xFFFFFFFF).to_bytes(4, "little") + b"\xc3"
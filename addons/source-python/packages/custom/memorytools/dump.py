@@ -0,0 +1,210 @@
+# ../addons/source-python/packages/custom/memorytools/dump.py
+
+"""Provides comparison of memory dumps written by mem_write."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Collections
+from collections import namedtuple
+#   Contextlib
+from contextlib import contextmanager
+#   Mmap
+import mmap
+#   Os
+import os
+
+# Site-Packages Imports
+#   NumPy
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Memory Tools Imports
+#   Memory Tools
+from memorytools import get_view
+from memorytools import MEM_CHUNK_SIZE
+#   Layout
+from memorytools.layout import get_layout
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ("DiffRange",
+           "diff_buffers",
+           "diff_dumps",
+           "diff_memory",
+           )
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# Chunks of this size or less are compared byte by byte without NumPy
+_scalar_size = 64
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+DiffRange = namedtuple("DiffRange", ("start", "end", "fields"))
+DiffRange.__doc__ = """A changed byte range [start, end) of a comparison.
+
+``fields`` is a list of the field names overlapping the range if a layout
+was given. If a stride was given as well, the names are (index, name)
+tuples of the elements in the region.
+"""
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def diff_buffers(
+        old, new, layout=None, stride=None, chunk_size=MEM_CHUNK_SIZE):
+    """Return the changed byte ranges between two buffers.
+
+    The buffers are compared chunk by chunk. Equal chunks are skipped with
+    a single comparison, changed chunks are narrowed down with NumPy if it
+    is available.
+
+    :param old:
+        The old bytes-like object.
+    :param new:
+        The new bytes-like object.
+    :param layout:
+        A :class:`memorytools.layout.StructLayout` or a type with a layout
+        used to name the changed fields.
+    :param int stride:
+        The size of one element, if the buffers hold an array of the type.
+    :param int chunk_size:
+        The number of bytes compared at once.
+    :rtype: list
+    """
+    old = memoryview(old).cast("B")
+    new = memoryview(new).cast("B")
+    length = min(len(old), len(new))
+
+    ranges = list()
+    for start in range(0, length, chunk_size):
+        end = min(start + chunk_size, length)
+        old_chunk = old[start:end]
+        new_chunk = new[start:end]
+        if old_chunk == new_chunk:
+            continue
+
+        for range_start, range_end in _diff_chunk(old_chunk, new_chunk):
+            _add_range(ranges, start + range_start, start + range_end)
+
+    if len(old) != len(new):
+        _add_range(ranges, length, max(len(old), len(new)))
+
+    if isinstance(layout, type):
+        layout = get_layout(layout)
+
+    return [
+        DiffRange(start, end, _get_fields(layout, stride, start, end))
+        for start, end in ranges]
+
+def diff_dumps(old_path, new_path, layout=None, stride=None,
+        chunk_size=MEM_CHUNK_SIZE):
+    """Return the changed byte ranges between two dump files.
+
+    The files are memory mapped, so they are not read into memory.
+
+    :param str old_path:
+        The old dump file.
+    :param str new_path:
+        The new dump file.
+    :rtype: list
+    """
+    with _map_file(old_path) as old, _map_file(new_path) as new:
+        return diff_buffers(old, new, layout, stride, chunk_size)
+
+def diff_memory(path, pointer, length=None, offset=0, layout=None,
+        stride=None, chunk_size=MEM_CHUNK_SIZE):
+    """Return the changed byte ranges between a dump file and the memory.
+
+    :param str path:
+        The dump file.
+    :param Pointer/int pointer:
+        The pointer or memory address of the memory.
+    :param int length:
+        The length of the memory. Defaults to the size of the dump file.
+    :param int offset:
+        The offset to add to the address.
+    :rtype: list
+    """
+    if length is None:
+        length = os.path.getsize(str(path))
+
+    with _map_file(path) as old:
+        new = get_view(pointer, length, offset)
+        return diff_buffers(old, new, layout, stride, chunk_size)
+
+@contextmanager
+def _map_file(path):
+    with open(str(path), "rb") as file:
+        if not os.fstat(file.fileno()).st_size:
+            yield memoryview(b"")
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            view = memoryview(data)
+            try:
+                yield view
+            finally:
+                view.release()
+
+def _diff_chunk(old, new):
+    if numpy is not None:
+        changed = numpy.flatnonzero(
+            numpy.frombuffer(old, numpy.uint8) !=
+            numpy.frombuffer(new, numpy.uint8))
+
+        breaks = numpy.flatnonzero(numpy.diff(changed) != 1) + 1
+        starts = changed[numpy.concatenate(([0], breaks))]
+        ends = changed[numpy.concatenate((breaks - 1, [len(changed) - 1]))]
+        return zip(starts.tolist(), (ends + 1).tolist())
+
+    ranges = list()
+    _diff_scalar(old, new, 0, ranges)
+    return ranges
+
+def _diff_scalar(old, new, base, ranges):
+    # Split the chunk until the changed parts are small enough
+    if len(old) > _scalar_size:
+        middle = len(old) // 2
+        for start, end in ((0, middle), (middle, len(old))):
+            if old[start:end] != new[start:end]:
+                _diff_scalar(
+                    old[start:end], new[start:end], base + start, ranges)
+        return
+
+    for index, (old_byte, new_byte) in enumerate(zip(old, new)):
+        if old_byte != new_byte:
+            _add_range(ranges, base + index, base + index + 1)
+
+def _add_range(ranges, start, end):
+    if ranges and ranges[-1][1] == start:
+        ranges[-1] = (ranges[-1][0], end)
+    else:
+        ranges.append((start, end))
+
+def _get_fields(layout, stride, start, end):
+    if layout is None:
+        return []
+
+    if not stride:
+        return layout.get_fields(start, end)
+
+    fields = list()
+    for index in range(start // stride, (end - 1) // stride + 1):
+        base = index * stride
+        fields.extend(
+            (index, name) for name in layout.get_fields(
+                max(start, base) - base, min(end, base + stride) - base))
+
+    return fields
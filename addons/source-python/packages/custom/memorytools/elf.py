@@ -0,0 +1,309 @@
+# ../addons/source-python/packages/custom/memorytools/elf.py
+
+"""Provides the sections and segments of loaded ELF binaries."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Collections
+from collections import namedtuple
+#   Mmap
+import mmap
+#   Struct
+import struct
+
+# Memory Tools Imports
+#   Cache
+from memorytools.cache import get_binary_path
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ("ElfFile",
+           "Section",
+           "Segment",
+           "Symbol",
+           "get_elf_file",
+           "get_scope",
+           "get_sections",
+           )
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+ELF_MAGIC = b"\x7fELF"
+
+PT_LOAD = 1
+
+PF_X = 1
+PF_W = 2
+
+SHF_WRITE = 1
+SHF_ALLOC = 2
+SHF_EXECINSTR = 4
+
+SHT_SYMTAB = 2
+SHT_NOBITS = 8
+SHT_DYNSYM = 11
+
+SHN_UNDEF = 0
+
+STT_OBJECT = 1
+STT_FUNC = 2
+
+# ELF class -> (Header, Program header, Section header, Symbol) formats
+_formats = {
+    1: ("<16sHHIIIIIHHHHHH", "<IIIIIIII", "<IIIIIIIIII", "<IIIBBH"),
+    2: ("<16sHHIQQQIHHHHHH", "<IIQQQQQQ", "<IIQQQQIIQQ", "<IBBHQQ"),
+}
+
+# Binary address -> ElfFile or None
+_elf_files = dict()
+
+# Scope -> (Section filter, Segment filter)
+_scopes = {
+    "text": (
+        lambda section: section.flags & SHF_EXECINSTR,
+        lambda segment: segment.flags & PF_X),
+    "rodata": (
+        lambda section: section.name.startswith(".rodata"),
+        lambda segment: not segment.flags & (PF_W | PF_X)),
+    "data": (
+        lambda section: section.flags & SHF_WRITE,
+        lambda segment: segment.flags & PF_W),
+}
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+Segment = namedtuple(
+    "Segment", ("type", "flags", "offset", "vaddr", "filesz", "memsz"))
+
+Section = namedtuple(
+    "Section", ("name", "type", "flags", "addr", "offset", "size", "link",
+                "info", "entsize"))
+
+Symbol = namedtuple(
+    "Symbol", ("name", "value", "size", "type", "bind", "shndx"))
+
+
+class ElfFile:
+    """The headers of an ELF file, parsed from a read-only mapping."""
+
+    def __init__(self, path):
+        """Parse the headers of the file.
+
+        :param str path:
+            The path of the ELF file.
+        :raise ValueError:
+            Raised if the file is not a little endian ELF file.
+        """
+        self.path = str(path)
+        with open(self.path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        data = self.data
+        if data[:4] != ELF_MAGIC or data[4] not in _formats or data[5] != 1:
+            raise ValueError(
+                "Not a little endian ELF file: {0}".format(self.path))
+
+        self.elf_class = data[4]
+        self.pointer_size = 4 * self.elf_class
+        header, program_header, section_header, self._symbol = (
+            struct.Struct(format) for format in _formats[self.elf_class])
+
+        (_, self.type, self.machine, _, _, phoff, shoff, _, _, phentsize,
+            phnum, shentsize, shnum, shstrndx) = header.unpack_from(data)
+
+        self.segments = list()
+        for index in range(phnum):
+            fields = program_header.unpack_from(data, phoff + index * phentsize)
+            if self.elf_class == 1:
+                p_type, offset, vaddr, _, filesz, memsz, flags, _ = fields
+            else:
+                p_type, flags, offset, vaddr, _, filesz, memsz, _ = fields
+
+            self.segments.append(
+                Segment(p_type, flags, offset, vaddr, filesz, memsz))
+
+        headers = [
+            section_header.unpack_from(data, shoff + index * shentsize)
+            for index in range(shnum if shoff else 0)]
+
+        self.sections = list()
+        if not headers:
+            return
+
+        names_offset = headers[shstrndx][4]
+        for (name, sh_type, flags, addr, offset, size, link, info, _,
+                entsize) in headers:
+            start = names_offset + name
+            self.sections.append(Section(
+                data[start:data.find(b"\0", start)].decode("ascii", "replace"),
+                sh_type, flags, addr, offset, size, link, info, entsize))
+
+    @property
+    def base_vaddr(self):
+        """The virtual address the binary's base address corresponds to."""
+        return min((
+            segment.vaddr for segment in self.segments
+            if segment.type == PT_LOAD), default=0)
+
+    def get_section(self, name):
+        """Return the section with the name or None."""
+        for section in self.sections:
+            if section.name == name:
+                return section
+        return None
+
+    def iter_symbols(self):
+        """Yield the defined symbols of .symtab and .dynsym.
+
+        A symbol exported by both tables is yielded twice.
+        """
+        data = self.data
+        symbol = self._symbol
+        for section in self.sections:
+            if section.type not in (SHT_SYMTAB, SHT_DYNSYM):
+                continue
+
+            names_offset = self.sections[section.link].offset
+            for offset in range(
+                    section.offset, section.offset + section.size,
+                    symbol.size):
+                fields = symbol.unpack_from(data, offset)
+                if self.elf_class == 1:
+                    name, value, size, info, _, shndx = fields
+                else:
+                    name, info, _, shndx, value, size = fields
+
+                if not name or shndx == SHN_UNDEF:
+                    continue
+
+                start = names_offset + name
+                yield Symbol(
+                    data[start:data.find(b"\0", start)].decode(
+                        "ascii", "replace"),
+                    value, size, info & 0xF, info >> 4, shndx)
+
+    def get_scope(self, scope):
+        """Return the virtual address range [start, end) of the scope.
+
+        :param str scope:
+            ``text`` for the executable sections, ``rodata`` for the
+            read-only data, ``data`` for the writable data or the name of a
+            section, e.g. ``.text``.
+        :return:
+            The range or None, if the binary has no such sections.
+        :rtype: tuple
+        """
+        if scope.startswith("."):
+            section = self.get_section(scope)
+            return None if section is None else (
+                section.addr, section.addr + section.size)
+
+        if scope not in _scopes:
+            raise ValueError("Unknown scope: {0}".format(scope))
+
+        section_filter, segment_filter = _scopes[scope]
+        if self.sections:
+            ranges = [
+                (section.addr, section.addr + section.size)
+                for section in self.sections
+                if section.flags & SHF_ALLOC and section.size and
+                section.type != SHT_NOBITS and section_filter(section)]
+        else:
+            ranges = [
+                (segment.vaddr, segment.vaddr + segment.filesz)
+                for segment in self.segments
+                if segment.type == PT_LOAD and segment_filter(segment)]
+
+        if not ranges:
+            return None
+
+        return min(start for start, end in ranges), max(
+            end for start, end in ranges)
+
+    def close(self):
+        self.data.close()
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def get_elf_file(binary):
+    """Return the parsed ELF file of the loaded binary or None.
+
+    The file is parsed once per binary. None is returned if the file of the
+    binary is unknown or not an ELF file, e.g. on Windows.
+
+    :param BinaryFile binary:
+        The loaded binary.
+    :rtype: ElfFile
+    """
+    try:
+        return _elf_files[binary.address]
+    except KeyError:
+        pass
+
+    elf_file = None
+    path = get_binary_path(binary)
+    if path is not None:
+        try:
+            elf_file = ElfFile(path)
+        except (OSError, ValueError, struct.error):
+            pass
+
+    _elf_files[binary.address] = elf_file
+    return elf_file
+
+def get_sections(binary):
+    """Return the sections of the loaded binary with their addresses.
+
+    :param BinaryFile binary:
+        The loaded binary.
+    :return:
+        A dictionary with the section name as key and an (address, size)
+        tuple as value. It is empty if the binary is not an ELF file.
+    :rtype: dict
+    """
+    elf_file = get_elf_file(binary)
+    if elf_file is None:
+        return dict()
+
+    base = binary.address - elf_file.base_vaddr
+    return {
+        section.name: (base + section.addr, section.size)
+        for section in elf_file.sections if section.flags & SHF_ALLOC}
+
+def get_scope(binary, scope):
+    """Return the memory range of the scope in the loaded binary.
+
+    :param BinaryFile binary:
+        The loaded binary.
+    :param str scope:
+        The scope, see :meth:`ElfFile.get_scope`.
+    :return:
+        An (address, size) tuple or None, if the binary is not an ELF file
+        or has no such sections. The whole binary should be used then.
+    :rtype: tuple
+    """
+    elf_file = get_elf_file(binary)
+    if elf_file is None:
+        return None
+
+    scope_range = elf_file.get_scope(scope)
+    if scope_range is None:
+        return None
+
+    base = binary.address - elf_file.base_vaddr
+    start = max(base + scope_range[0], binary.address)
+    end = min(base + scope_range[1], binary.address + binary.size)
+    if end <= start:
+        return None
+
+    return start, end - start
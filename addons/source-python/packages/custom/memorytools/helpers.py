@@ -9,18 +9,360 @@
 #   Binascii
 import binascii
 
+# Source.Python Imports
+#   Core
+from core import echo_console
+from core import PLATFORM
+#   Memory
+from memory import Convention
+from memory import DataType
+from memory.helpers import parse_data as _parse_data
+from memory.helpers import Key
+from memory.helpers import NO_DEFAULT
+
 
 # =============================================================================
 # >> ALL DECLARATION
 # =============================================================================
-__all__ = ("as_op_codes",
+__all__ = ("STRING_REFERENCE_PREFIX",
+           "as_identifier",
+           "as_op_codes",
+           "get_scoped_identifier",
+           "parse_data",
+           "AddressNotFoundError",
+           "IdentifierChain",
+           "LazyAttribute",
+           "PrecompiledSection",
+           "ScopedIdentifier",
+           "StringReference",
+           "SymbolName",
            )
 
 
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# The prefix of identifiers referring to a string literal
+STRING_REFERENCE_PREFIX = "string:"
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class AddressNotFoundError(ValueError):
+    """Raised if an identifier is not found in its binary.
+
+    Chains of identifiers only try the next alternative on this error, so
+    other errors, e.g. of a malformed identifier, are not hidden.
+    """
+
+
+class IdentifierChain(tuple):
+    """Alternative identifiers of the same address, tried in order.
+
+    The chain is written as ``identifier = A | B | C`` in the data files.
+    """
+
+    def __repr__(self):
+        return "IdentifierChain({0})".format(tuple.__repr__(self))
+
+    def report_match(self, identifier):
+        """Echo which alternative matched to the server console, unless it
+        is the first one.
+        """
+        index = self.index(identifier)
+        if not index:
+            return
+
+        if isinstance(identifier, bytes):
+            identifier = " ".join("{:02X}".format(i) for i in identifier)
+
+        echo_console("Alternative {0} of {1} matched: {2}".format(
+            index + 1, len(self), identifier))
+
+
+class LazyAttribute(object):
+    """An attribute which is created the first time it is accessed.
+
+    Once created, the attribute replaces itself in the dictionary of the
+    class it was assigned to.
+    """
+
+    def __init__(self, name, function, *args):
+        """Initialize the lazy attribute.
+
+        :param str name:
+            The name of the attribute.
+        :param callable function:
+            The function which creates the attribute.
+        :param args:
+            The arguments passed to ``function``.
+        """
+        self.name = name
+        self.function = function
+        self.args = args
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, cls=None):
+        if cls is None:
+            cls = type(obj)
+
+        value = self.resolve(cls)
+        if hasattr(type(value), "__get__"):
+            return value.__get__(obj, cls)
+
+        return value
+
+    def __set__(self, obj, value):
+        attribute = self.resolve(type(obj))
+        if hasattr(type(attribute), "__set__"):
+            attribute.__set__(obj, value)
+        else:
+            obj.__dict__[self.name] = value
+
+    def resolve(self, cls):
+        """Create the attribute and replace this object with it."""
+        value = self.function(*self.args)
+        for base in cls.__mro__:
+            if base.__dict__.get(self.name, None) is self:
+                setattr(base, self.name, value)
+                break
+
+        return value
+
+
+class PrecompiledSection(dict):
+    """A section of a data bundle.
+
+    The platform specific keys are already resolved and the values of
+    :attr:`precompiled_keys` are already converted.
+    """
+
+    precompiled_keys = (
+        Key.IDENTIFIER,
+        Key.ARGS,
+        Key.RETURN_TYPE,
+        Key.CONVENTION,
+        "op_codes",
+        "base_op_codes",
+    )
+
+
+class ScopedIdentifier(bytes):
+    """A signature which is only searched in a part of its binary.
+
+    It is equal to the plain signature, so it shares its cached address.
+    """
+
+    def __new__(cls, identifier, scope):
+        self = super().__new__(cls, identifier)
+        self.scope = scope
+        return self
+
+    def __repr__(self):
+        return "ScopedIdentifier({0}, {1!r})".format(
+            bytes.__repr__(self), self.scope)
+
+
+class StringReference(str):
+    """The function which references a string literal.
+
+    The string is written as ``identifier = "string:<text>"`` in the data
+    files and resolved by :mod:`memorytools.xref`.
+    """
+
+    def __repr__(self):
+        return "StringReference({0})".format(str.__repr__(self))
+
+
+class SymbolName(str):
+    """The name of a symbol, given by ``symbol = <name>`` in the data files.
+
+    It is looked up in the symbol index of :mod:`memorytools.symbols`.
+    """
+
+    def __repr__(self):
+        return "SymbolName({0})".format(str.__repr__(self))
+
+
 # =============================================================================
 # >> FUNCTIONS
 # =============================================================================
+def as_identifier(manager, value):
+    """Convert a string into an identifier or a chain of identifiers.
+
+    Alternatives are separated by ``|`` and converted like
+    :meth:`memory.helpers.Key.as_identifier`. Alternatives starting with
+    ``string:`` are converted into a :class:`StringReference`.
+    """
+    if isinstance(value, str) and "|" in value:
+        return IdentifierChain(
+            _as_identifier(manager, alternative.strip())
+            for alternative in value.split("|"))
+
+    return _as_identifier(manager, value)
+
+def _as_identifier(manager, value):
+    if isinstance(value, str) and value.startswith(STRING_REFERENCE_PREFIX):
+        return StringReference(value[len(STRING_REFERENCE_PREFIX):])
+
+    return Key.as_identifier(manager, value)
+
 def as_op_codes(manager, value):
     """Convert a string into a byte string."""
     return binascii.unhexlify(value.replace(' ', ""))
 
+def parse_data(manager, raw_data, keys):
+    """Parse the data like :func:`memory.helpers.parse_data`.
+
+    Sections of a data bundle are parsed without converting the
+    precompiled values again.
+    """
+    try:
+        identifier_index = [key for key, *_ in keys].index(Key.IDENTIFIER)
+    except ValueError:
+        identifier_index = None
+
+    if not isinstance(raw_data, PrecompiledSection):
+        sections = raw_data
+        if identifier_index is not None:
+            raw_data = _with_symbol_identifiers(raw_data)
+
+        for name, temp_data in _parse_data(manager, raw_data, keys):
+            if identifier_index is not None:
+                temp_data[identifier_index] = _get_identifier(
+                    sections[name], temp_data[identifier_index])
+            yield (name, temp_data)
+        return
+
+    for name, data in raw_data.items():
+        temp_data = []
+        for key, converter, default in keys:
+            value = data.get(key, default)
+
+            # The identifier can be replaced by a symbol
+            if (value is NO_DEFAULT and
+                key == Key.IDENTIFIER and
+                "symbol" in data):
+                temp_data.append(None)
+                continue
+
+            # If the value is NO_DEFAULT, the key is really required
+            if value is NO_DEFAULT:
+                raise KeyError(
+                    'Missing information for key "{0}".'.format(key))
+
+            if value is not default:
+                converter = _precompiled_converters.get(key, converter)
+                value = converter(manager, value)
+
+            temp_data.append(value)
+
+        if identifier_index is not None:
+            temp_data[identifier_index] = _get_identifier(
+                data, temp_data[identifier_index])
+
+        yield (name, temp_data)
+
+def _get_symbol(section):
+    return section.get("symbol_" + PLATFORM, section.get("symbol", None))
+
+def _with_symbol_identifiers(raw_data):
+    """Return the data with the symbols as identifier of the sections
+    without one, so the identifier is not reported missing."""
+    if not any(
+            isinstance(section, dict) and _get_symbol(section) is not None
+            for section in raw_data.values()):
+        return raw_data
+
+    data = dict()
+    for name, section in raw_data.items():
+        symbol = _get_symbol(section)
+        if symbol is not None and Key.IDENTIFIER not in section and (
+                Key.IDENTIFIER + "_" + PLATFORM not in section):
+            section = dict(section)
+            section[Key.IDENTIFIER] = symbol
+
+        data[name] = section
+
+    return data
+
+def _get_identifier(section, identifier):
+    """Return the identifier of the section with its symbol and scope.
+
+    The symbol is tried before the identifier, if the section has both.
+    """
+    symbol = _get_symbol(section)
+    if symbol is not None:
+        symbol = SymbolName(symbol)
+        if (Key.IDENTIFIER not in section and
+            Key.IDENTIFIER + "_" + PLATFORM not in section):
+            identifier = symbol
+        elif isinstance(identifier, IdentifierChain):
+            identifier = IdentifierChain((symbol,) + identifier)
+        elif identifier != symbol:
+            identifier = IdentifierChain((symbol, identifier))
+
+    return get_scoped_identifier(section, identifier)
+
+def get_scoped_identifier(section, identifier):
+    """Return the identifier limited to the scope of the section.
+
+    The scope is given by the ``scope`` key, e.g. ``scope = text``. Symbols
+    and identifiers without a scope are returned as they are.
+
+    :param dict section:
+        The section of the identifier.
+    :param identifier:
+        The converted identifier.
+    """
+    scope = section.get("scope_" + PLATFORM, section.get("scope", None))
+    if scope is not None and isinstance(identifier, IdentifierChain):
+        return IdentifierChain(
+            get_scoped_identifier(section, alternative)
+            for alternative in identifier)
+
+    if (scope is None or
+        not isinstance(identifier, bytes) or
+        isinstance(identifier, ScopedIdentifier)):
+        return identifier
+
+    return ScopedIdentifier(identifier, scope)
+
+def _from_identifier(manager, value):
+    if isinstance(value, tuple):
+        return IdentifierChain(
+            _from_identifier(manager, alternative) for alternative in value)
+
+    if isinstance(value, str) and value.startswith(STRING_REFERENCE_PREFIX):
+        return StringReference(value[len(STRING_REFERENCE_PREFIX):])
+
+    return value
+
+def _from_args(manager, value):
+    return tuple(DataType.values[data_type] for data_type in value)
+
+def _from_return_type(manager, value):
+    if isinstance(value, int):
+        return DataType.values[value]
+    return value
+
+def _from_convention(manager, value):
+    if isinstance(value, int):
+        return Convention.values[value]
+    return Key.as_convention(manager, value)
+
+def _from_op_codes(manager, value):
+    return value
+
+_precompiled_converters = {
+    Key.IDENTIFIER: _from_identifier,
+    Key.ARGS: _from_args,
+    Key.RETURN_TYPE: _from_return_type,
+    Key.CONVENTION: _from_convention,
+    "op_codes": _from_op_codes,
+    "base_op_codes": _from_op_codes,
+}
+
@@ -0,0 +1,301 @@
+# ../addons/source-python/packages/custom/memorytools/layout.py
+
+"""Provides bulk reading and writing of instance attributes."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Collections
+from collections import namedtuple
+#   Ctypes
+from ctypes import string_at
+#   Struct
+import struct
+#   Weakref
+from weakref import WeakKeyDictionary
+
+# Source.Python Imports
+#   Memory
+from memory import get_object_pointer
+from memory import Pointer
+from memory import TYPE_SIZES
+from memory.helpers import Type
+
+# Memory Tools Imports
+#   Memory Tools
+from memorytools import get_view
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ("StructLayout",
+           "get_layout",
+           "register_field",
+           "restore",
+           "snapshot",
+           )
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+_pointer_format = "Q" if TYPE_SIZES["POINTER"] == 8 else "I"
+
+_struct_formats = {
+    Type.BOOL: "?",
+    Type.CHAR: "c",
+    Type.UCHAR: "B",
+    Type.SHORT: "h",
+    Type.USHORT: "H",
+    Type.INT: "i",
+    Type.UINT: "I",
+    Type.LONG: "q" if TYPE_SIZES["LONG"] == 8 else "i",
+    Type.ULONG: "Q" if TYPE_SIZES["ULONG"] == 8 else "I",
+    Type.LONG_LONG: "q",
+    Type.ULONG_LONG: "Q",
+    Type.FLOAT: "f",
+    Type.DOUBLE: "d",
+    Type.POINTER: _pointer_format,
+    Type.STRING_POINTER: _pointer_format,
+}
+
+# Attribute getter -> (type_name, offset, length)
+_fields = WeakKeyDictionary()
+
+# Type -> StructLayout or None
+_layouts = WeakKeyDictionary()
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class StructLayout:
+    """A :class:`struct.Struct` layout of the native instance attributes.
+
+    Every field is read with a single :meth:`struct.Struct.unpack_from` and
+    written with a single :meth:`struct.Struct.pack_into` over the memory of
+    the object. The gaps between the fields are part of the layout, so they
+    are written back unchanged.
+    """
+
+    def __init__(self, fields, name="Snapshot"):
+        """Initialize the layout.
+
+        :param iterable fields:
+            (name, type_name, offset, length) tuples of the instance
+            attributes. Fields which are not native or overlap a previous
+            field are left out.
+        :param str name:
+            The name of the snapshot tuple type.
+        """
+        formats = list()
+        self.names = list()
+        self.offsets = list()
+        self._fields = list()
+
+        position = 0
+        for field_name, attribute_type, offset, length in sorted(
+                fields, key=lambda field: field[2]):
+            if attribute_type == Type.STRING_ARRAY:
+                field_format = "{}s".format(length)
+            else:
+                field_format = _struct_formats.get(attribute_type, None)
+
+            if field_format is None or offset < position:
+                continue
+
+            if offset > position:
+                formats.append("{}s".format(offset - position))
+
+            self._fields.append((len(formats), attribute_type, length))
+            size = struct.calcsize("=" + field_format)
+            self.names.append(field_name)
+            self.offsets.append((offset, size))
+            formats.append(field_format)
+            position = offset + size
+
+        self.struct = struct.Struct("=" + "".join(formats))
+        self.snapshot_type = namedtuple(name, self.names, rename=True)
+
+    def __len__(self):
+        return len(self.names)
+
+    def get_fields(self, start, end):
+        """Return the names of the fields overlapping the byte range."""
+        return [
+            name for name, (offset, size) in zip(self.names, self.offsets)
+            if offset < end and start < offset + size]
+
+    def unpack(self, pointer):
+        """Read every field of the object at the pointer.
+
+        :param Pointer/int pointer:
+            The pointer or memory address of the object.
+        :rtype: tuple
+        """
+        values = self.struct.unpack_from(
+            get_view(pointer, self.struct.size))
+
+        return self.snapshot_type._make(
+            _unpackers.get(attribute_type, _identity)(values[index])
+            for index, attribute_type, length in self._fields)
+
+    def pack(self, pointer, values):
+        """Write the fields to the object at the pointer.
+
+        String pointers are left unchanged.
+
+        :param Pointer/int pointer:
+            The pointer or memory address of the object.
+        :param tuple/dict values:
+            A snapshot or a dictionary of the fields to write. Missing
+            fields of a dictionary are left unchanged.
+        """
+        view = get_view(pointer, self.struct.size, writable=True)
+        current = list(self.struct.unpack_from(view))
+
+        if not isinstance(values, dict):
+            values = dict(zip(self.names, values))
+
+        for name, (index, attribute_type, length) in zip(
+                self.names, self._fields):
+            if name not in values or attribute_type == Type.STRING_POINTER:
+                continue
+
+            packer = _packers.get(attribute_type, None)
+            value = values[name]
+            current[index] = (
+                value if packer is None else packer(value, length))
+
+        self.struct.pack_into(view, 0, *current)
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def register_field(attribute, type_name, offset, length=0):
+    """Add an instance attribute to the layout of the types using it.
+
+    :param property attribute:
+        The attribute created by :meth:`TypeManager.instance_attribute`.
+    :param str type_name:
+        The type of the attribute.
+    :param int offset:
+        The offset of the attribute.
+    :param int length:
+        The length of a string array.
+    """
+    _fields[attribute.fget] = (type_name, offset, length)
+
+    # The attribute might be set on a type with a layout
+    _layouts.clear()
+
+def get_layout(cls):
+    """Return the layout of the registered instance attributes of the type.
+
+    :param type cls:
+        The type or an instance of it.
+    :return:
+        The layout or None, if the type has no native instance attribute.
+    :rtype: StructLayout
+    """
+    if not isinstance(cls, type):
+        cls = type(cls)
+
+    try:
+        return _layouts[cls]
+    except KeyError:
+        pass
+
+    fields = list()
+    names = set()
+    for base in cls.__mro__:
+        for name, value in vars(base).items():
+            if name in names:
+                continue
+
+            names.add(name)
+            field = _get_field(value)
+            if field is not None:
+                fields.append((name,) + field)
+
+    layout = StructLayout(fields, cls.__name__ + "Snapshot")
+    layout = _layouts[cls] = layout if layout else None
+    return layout
+
+def snapshot(obj, as_dict=False):
+    """Return the native instance attributes of the object in one read.
+
+    :param obj:
+        An instance of a type with registered instance attributes.
+    :param bool as_dict:
+        Whether a dictionary should be returned instead of a named tuple.
+    :raise ValueError:
+        Raised if the type of the object has no layout.
+    :rtype: tuple/dict
+    """
+    values = _get_layout(obj).unpack(get_object_pointer(obj))
+    return values._asdict() if as_dict else values
+
+def restore(obj, values):
+    """Write the native instance attributes of the object in one write.
+
+    :param obj:
+        An instance of a type with registered instance attributes.
+    :param tuple/dict values:
+        A snapshot or a dictionary of the attributes to write.
+    :raise ValueError:
+        Raised if the type of the object has no layout.
+    """
+    _get_layout(obj).pack(get_object_pointer(obj), values)
+
+def _get_layout(obj):
+    layout = get_layout(obj)
+    if layout is None:
+        raise ValueError(
+            "{0} has no native instance attribute.".format(
+                type(obj).__name__))
+
+    return layout
+
+def _get_field(value):
+    fget = getattr(value, "fget", None)
+    if fget is None:
+        return None
+
+    try:
+        return _fields.get(fget, None)
+    except TypeError:
+        return None
+
+def _identity(value):
+    return value
+
+def _unpack_string_pointer(address):
+    if not address:
+        return None
+    return string_at(address).decode("utf-8", "replace")
+
+def _unpack_string_array(value):
+    return value.split(b"\0", 1)[0].decode("utf-8", "replace")
+
+def _pack_string_array(value, length):
+    return value.encode("utf-8")[:length-1]
+
+def _pack_char(value, length):
+    return value.encode("latin-1") if isinstance(value, str) else value
+
+_unpackers = {
+    Type.CHAR: lambda value: value.decode("latin-1"),
+    Type.POINTER: Pointer,
+    Type.STRING_POINTER: _unpack_string_pointer,
+    Type.STRING_ARRAY: _unpack_string_array,
+}
+
+_packers = {
+    Type.CHAR: _pack_char,
+    Type.POINTER: lambda value, length: int(value),
+    Type.STRING_ARRAY: _pack_string_array,
+}
@@ -5,41 +5,68 @@
 # =============================================================================
 # >> IMPORTS
 # =============================================================================
+# Python Imports
+#   Collections
+from collections import Counter
+from collections import defaultdict
+#   Functools
+from functools import wraps
+#   Inspect
+from inspect import currentframe
+#   Pathlib
+from pathlib import Path
+#   Weakref
+from weakref import ref
+from weakref import WeakKeyDictionary
+from weakref import WeakSet
+
 # Source.Python Imports
-#   Core
-from core import GameConfigObj
+#   Listeners
+from listeners import on_plugin_unloaded_manager
 #   Memory
-from memory import find_binary
 from memory import Convention
 from memory import DataType
-from memory.helpers import parse_data
 from memory.helpers import Key
 from memory.helpers import MemberFunction
 from memory.helpers import NO_DEFAULT
 from memory.manager import manager
 from memory.manager import CustomType
 from memory.manager import TypeManager
+#   Paths
+from paths import PLUGIN_PATH
 
 # Memory Tools Imports
 #   Memory Tools
+from memorytools import find_address
 from memorytools import get_offset
 from memorytools import get_pointer
 from memorytools import get_relative_pointer
+from memorytools import resolved_addresses
+from memorytools.bundle import load_data_file
 from memorytools.ctypes import get_ctype_function
+from memorytools.ctypes import CtypesFunction
+from memorytools.ctypes import is_ctype_compatible
+from memorytools.helpers import as_identifier
 from memorytools.helpers import as_op_codes
+from memorytools.helpers import parse_data
+from memorytools.helpers import LazyAttribute
+from memorytools.layout import register_field
 from memorytools.patcher import Patcher
 from memorytools.patcher import Patchers
+from memorytools.resolver import resolve_identifiers
 
 
 # =============================================================================
 # >> ALL DECLARATION
 # =============================================================================
-__all__ = ("create_ctype_pipe_from_file",
+__all__ = ("clear_function_caches",
+           "create_ctype_pipe_from_file",
            "create_data_pipe_from_file",
            "create_function_pipe_from_file",
            "create_patchers_from_file",
            "create_pointer_pipe_from_file",
            "create_type_from_file",
+           "function_cache_stats",
            "get_ctype_from_dict",
            "get_ctype_from_file",
            "get_data_from_dict",
@@ -58,6 +85,53 @@ __all__ = ("create_ctype_pipe_from_file",
            )
 
 
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# Number of created and reused (saved) function objects of function_pointer
+function_cache_stats = Counter()
+
+# Plugin name -> Types created from data files by the plugin
+_plugin_types = defaultdict(WeakSet)
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _FunctionDescriptor(object):
+    """Base of the descriptors created by :func:`function_pointer`."""
+
+    def __init__(self):
+        self.function = None
+
+        # Instance -> MemberFunction bound to it
+        self.bound_functions = WeakKeyDictionary()
+
+    def clear(self):
+        """Drop the cached function objects."""
+        self.function = None
+        self.bound_functions.clear()
+
+
+class _WeakMemberFunction(MemberFunction):
+    """A MemberFunction which references its instance weakly.
+
+    It is cached per instance by the descriptors of :func:`function_pointer`
+    and would otherwise keep the instance alive.
+    """
+
+    @property
+    def _this(self):
+        this = self._this_ref()
+        if this is None:
+            raise ReferenceError("The instance of the function is gone.")
+        return this
+
+    @_this.setter
+    def _this(self, this):
+        self._this_ref = ref(this)
+
+
 # =============================================================================
 # >> FUNCTIONS
 # =============================================================================
@@ -72,28 +146,97 @@ def function_pointer(
     if return_type not in DataType.values:
         return_type = self.create_converter(return_type)
 
-    class fget(object):
+    class fget(_FunctionDescriptor):
         def __get__(fget_self, obj, cls):
-            # Create the function object
-            func = ptr.make_function(
-                convention,
-                args,
-                return_type
-            )
+            # Create the function object only once
+            func = fget_self.function
+            if func is None:
+                func = fget_self.function = ptr.make_function(
+                    convention,
+                    args,
+                    return_type
+                )
+                func.__doc__ = doc
+                function_cache_stats["functions"] += 1
+            else:
+                function_cache_stats["functions_saved"] += 1
 
             # Called with a this pointer?
-            if obj is not None:
-                # Wrap the function using MemberFunction, so we don't have
-                # to pass the this pointer anymore
-                func = MemberFunction(self, return_type, func, obj)
-
-            func.__doc__ = doc
-            return func
+            if obj is None:
+                return func
+
+            # Reuse the MemberFunction bound to the instance
+            try:
+                member_func = fget_self.bound_functions.get(obj, None)
+            except TypeError:
+                # Not hashable or not weak referenceable
+                member_func = None
+                cacheable = False
+            else:
+                cacheable = True
+
+            if member_func is not None:
+                function_cache_stats["member_functions_saved"] += 1
+                return member_func
+
+            # Wrap the function using MemberFunction, so we don't have
+            # to pass the this pointer anymore
+            if cacheable:
+                member_func = _WeakMemberFunction(self, return_type, func, obj)
+                fget_self.bound_functions[obj] = member_func
+            else:
+                member_func = MemberFunction(self, return_type, func, obj)
+
+            member_func.__doc__ = doc
+            function_cache_stats["member_functions"] += 1
+            return member_func
 
     return fget()
 
 TypeManager.function_pointer = function_pointer
 
+def clear_function_caches(cls):
+    """Drop the cached function objects of the type's member functions.
+
+    The caches belong to the type and die with it. This releases them
+    earlier, e.g. when the plugin owning the type is unloaded while the
+    type is still referenced.
+
+    The caches of the types created by :func:`create_type_from_file` or
+    updated by :func:`set_type_from_file` in a plugin are cleared when the
+    plugin is unloaded.
+
+    :param type cls:
+        The type created from a data file.
+    """
+    for base in cls.__mro__:
+        for value in vars(base).values():
+            if isinstance(value, _FunctionDescriptor):
+                value.clear()
+
+def _add_plugin_type(cls):
+    # Find the first caller outside of memorytools
+    frame = currentframe().f_back
+    while (frame is not None and
+           frame.f_globals.get("__name__", "").split(".")[0] == "memorytools"):
+        frame = frame.f_back
+
+    if frame is None:
+        return
+
+    try:
+        path = Path(frame.f_code.co_filename).relative_to(str(PLUGIN_PATH))
+    except ValueError:
+        return
+
+    _plugin_types[path.parts[0]].add(cls)
+
+def _on_plugin_unloaded(plugin):
+    for cls in _plugin_types.pop(getattr(plugin, "name", plugin), ()):
+        clear_function_caches(cls)
+
+on_plugin_unloaded_manager.register_listener(_on_plugin_unloaded)
+
 def pipe_function_pointer(
         self, ptr, args=(), return_type=DataType.VOID,
         convention=Convention.CDECL, doc=None):
@@ -111,46 +254,136 @@ def pipe_function_pointer(
 
 TypeManager.pipe_function_pointer = pipe_function_pointer
 
-def create_function_pipe_from_file(file, manager=manager):
-    return manager.create_pipe(get_function_from_file(file, manager))
+def ctypes_function_pointer(
+        self, ptr, args=(), return_type=DataType.VOID,
+        convention=Convention.THISCALL, doc=None):
+    """Create a wrapper for a function called through ctypes.
+
+    Falls back to :meth:`function_pointer` if the arguments, the return type
+    or the calling convention are not supported by ctypes.
+    """
+    # Automatically add the this pointer argument
+    this_args = (DataType.POINTER,) + tuple(args)
+
+    if _is_ctypes_callable(this_args, return_type, convention):
+        try:
+            return CtypesFunction(
+                ptr.make_function(convention, this_args, return_type), doc)
+        except ValueError:
+            pass
+
+    return self.function_pointer(ptr, args, return_type, convention, doc)
+
+TypeManager.ctypes_function_pointer = ctypes_function_pointer
+
+def ctypes_pipe_function_pointer(
+        self, ptr, args=(), return_type=DataType.VOID,
+        convention=Convention.CDECL, doc=None):
+    """Create a simple pipe function called through ctypes.
 
-def set_function_from_file(cls, file, manager=manager):
+    Falls back to :meth:`pipe_function_pointer` if the arguments, the return
+    type or the calling convention are not supported by ctypes.
+    """
+    if _is_ctypes_callable(args, return_type, convention):
+        try:
+            return CtypesFunction(
+                ptr.make_function(convention, args, return_type), doc)
+        except ValueError:
+            pass
+
+    return self.pipe_function_pointer(ptr, args, return_type, convention, doc)
+
+TypeManager.ctypes_pipe_function_pointer = ctypes_pipe_function_pointer
+
+def _is_ctypes_callable(args, return_type, convention):
+    # Custom types and conventions, e.g. return_type = CCSBot, need the
+    # converters of memory.Function
+    return (
+        isinstance(return_type, DataType) and
+        isinstance(convention, Convention) and
+        all(isinstance(data_type, DataType) for data_type in args) and
+        is_ctype_compatible(args, return_type))
+
+def _resolving_load(loader):
+    # Let find_address use the addresses resolve_identifiers finds during
+    # the load, even if the address cache is disabled
+    @wraps(loader)
+    def wrapper(*args, **kwargs):
+        with resolved_addresses():
+            return loader(*args, **kwargs)
+
+    return wrapper
+
+def create_function_pipe_from_file(
+        file, manager=manager, call_backend=None):
+    return manager.create_pipe(
+        get_function_from_file(file, manager, call_backend))
+
+def set_function_from_file(cls, file, manager=manager, call_backend=None):
     if hasattr(cls, "_manager"):
         manager = cls._manager
 
-    for name, value in get_function_from_file(file, manager).items():
+    for name, value in get_function_from_file(
+            file, manager, call_backend).items():
         setattr(cls, name, value)
 
-def get_function_from_file(file, manager=manager):
-    return get_function_from_dict(GameConfigObj(file), manager)
-
-def get_function_from_dict(raw_data, manager=manager):
+def get_function_from_file(file, manager=manager, call_backend=None):
+    return get_function_from_dict(
+        load_data_file(file), manager, call_backend)
+
+@_resolving_load
+def get_function_from_dict(raw_data, manager=manager, call_backend=None):
+    """Return the pipe functions described by the data.
+
+    :param dict raw_data:
+        The data of the functions.
+    :param TypeManager manager:
+        The manager used to create the functions.
+    :param str call_backend:
+        ``function`` to call the functions through :class:`memory.Function`
+        or ``ctypes`` to call them through ctypes, if their data types are
+        plain scalars and pointers. If None, the ``call_backend`` key of
+        the data is used. The ``call_backend`` key of a function overrides
+        it.
+    :rtype: dict
+    """
     function_dict = dict()
 
+    # Resolve all the signatures with one scan per binary
+    resolve_identifiers(raw_data, manager)
+
     binary = raw_data.pop(Key.BINARY, None)
     if binary is not None:
         binary = Key.as_str(manager, binary)
 
     srv_check = Key.as_bool(manager, raw_data.pop(Key.SRV_CHECK, "True"))
 
+    file_call_backend = _as_call_backend(
+        manager, raw_data.pop("call_backend", "function"))
+    if call_backend is None:
+        call_backend = file_call_backend
+
     # Prepare functions
     funcs = parse_data(
         manager,
         raw_data.pop("function", {}),
         (
             (Key.BINARY, Key.as_str, binary if binary is not None else NO_DEFAULT),
-            (Key.IDENTIFIER, Key.as_identifier, NO_DEFAULT),
+            (Key.IDENTIFIER, as_identifier, NO_DEFAULT),
             (Key.ARGS, Key.as_args_tuple, ()),
             (Key.RETURN_TYPE, Key.as_return_type, DataType.VOID),
             (Key.CONVENTION, Key.as_convention, Convention.CDECL),
             (Key.SRV_CHECK, Key.as_bool, srv_check),
-            (Key.DOC, Key.as_str, None)
+            (Key.DOC, Key.as_str, None),
+            ("call_backend", _as_call_backend, call_backend)
         )
     )
 
     # Create the functions
     for name, data in funcs:
-        function_dict[name] = manager.pipe_function(*data)
+        ptr = find_address(data[0], data[1], data[5])
+        function_dict[name] = _create_pipe_function(
+            manager, ptr, *data[2:5], data[6], data[7])
 
     # Prepare binary absolute functions
     funcs = parse_data(
@@ -158,21 +391,22 @@ def get_function_from_dict(raw_data, manager=manager):
         raw_data.pop("binary_absolute_function", {}),
         (
             (Key.BINARY, Key.as_str, binary if binary is not None else NO_DEFAULT),
-            (Key.IDENTIFIER, Key.as_identifier, NO_DEFAULT),
+            (Key.IDENTIFIER, as_identifier, NO_DEFAULT),
             (Key.OFFSET, Key.as_int, NO_DEFAULT),
             (Key.LEVEL, Key.as_int, 1),
             (Key.SRV_CHECK, Key.as_bool, srv_check),
             (Key.ARGS, Key.as_args_tuple, ()),
             (Key.RETURN_TYPE, Key.as_return_type, DataType.VOID),
             (Key.CONVENTION, Key.as_convention, Convention.CDECL),
-            (Key.DOC, Key.as_str, None)
+            (Key.DOC, Key.as_str, None),
+            ("call_backend", _as_call_backend, call_backend)
         )
     )
 
     # Create the functions
     for name, data in funcs:
         ptr = get_pointer(*data[:5])
-        function_dict[name] = manager.pipe_function_pointer(ptr, *data[5:])
+        function_dict[name] = _create_pipe_function(manager, ptr, *data[5:])
 
     # Prepare binary relative functions
     funcs = parse_data(
@@ -180,21 +414,22 @@ def get_function_from_dict(raw_data, manager=manager):
         raw_data.pop("binary_relative_function", {}),
         (
             (Key.BINARY, Key.as_str, binary if binary is not None else NO_DEFAULT),
-            (Key.IDENTIFIER, Key.as_identifier, NO_DEFAULT),
+            (Key.IDENTIFIER, as_identifier, NO_DEFAULT),
             (Key.OFFSET, Key.as_int, NO_DEFAULT),
             (Key.SIZE, Key.as_int, 4),
             (Key.SRV_CHECK, Key.as_bool, srv_check),
             (Key.ARGS, Key.as_args_tuple, ()),
             (Key.RETURN_TYPE, Key.as_return_type, DataType.VOID),
             (Key.CONVENTION, Key.as_convention, Convention.CDECL),
-            (Key.DOC, Key.as_str, None)
+            (Key.DOC, Key.as_str, None),
+            ("call_backend", _as_call_backend, call_backend)
         )
     )
 
     # Create the functions
     for name, data in funcs:
         ptr = get_relative_pointer(*data[:5])
-        function_dict[name] = manager.pipe_function_pointer(ptr, *data[5:])
+        function_dict[name] = _create_pipe_function(manager, ptr, *data[5:])
 
     # Prepare functions
     funcs = parse_data(
@@ -202,21 +437,40 @@ def get_function_from_dict(raw_data, manager=manager):
         raw_data,
         (
             (Key.BINARY, Key.as_str, binary if binary is not None else NO_DEFAULT),
-            (Key.IDENTIFIER, Key.as_identifier, NO_DEFAULT),
+            (Key.IDENTIFIER, as_identifier, NO_DEFAULT),
             (Key.ARGS, Key.as_args_tuple, ()),
             (Key.RETURN_TYPE, Key.as_return_type, DataType.VOID),
             (Key.CONVENTION, Key.as_convention, Convention.CDECL),
             (Key.SRV_CHECK, Key.as_bool, srv_check),
-            (Key.DOC, Key.as_str, None)
+            (Key.DOC, Key.as_str, None),
+            ("call_backend", _as_call_backend, call_backend)
         )
     )
 
     # Create the functions
     for name, data in funcs:
-        function_dict[name] = manager.pipe_function(*data)
+        ptr = find_address(data[0], data[1], data[5])
+        function_dict[name] = _create_pipe_function(
+            manager, ptr, *data[2:5], data[6], data[7])
 
     return function_dict
 
+def _as_call_backend(manager, value):
+    value = Key.as_str(manager, value).lower()
+    if value not in ("function", "ctypes"):
+        raise ValueError(f"Unknown call_backend: '{value}'")
+
+    return value
+
+def _create_pipe_function(
+        manager, ptr, args, return_type, convention, doc, call_backend):
+    if call_backend == "ctypes":
+        return manager.ctypes_pipe_function_pointer(
+            ptr, args, return_type, convention, doc)
+
+    return manager.pipe_function_pointer(
+        ptr, args, return_type, convention, doc)
+
 def create_pointer_pipe_from_file(file, manager=manager):
     return manager.create_pipe(get_pointer_from_file(file, manager))
 
@@ -228,11 +482,15 @@ def set_pointer_from_file(cls, file, manager=manager):
         setattr(cls, name, value)
 
 def get_pointer_from_file(file, manager=manager):
-    return get_pointer_from_dict(GameConfigObj(file), manager)
+    return get_pointer_from_dict(load_data_file(file), manager)
 
+@_resolving_load
 def get_pointer_from_dict(raw_data, manager=manager):
     pointer_dict = dict()
 
+    # Resolve all the signatures with one scan per binary
+    resolve_identifiers(raw_data, manager)
+
     binary = raw_data.pop(Key.BINARY, None)
     if binary is not None:
         binary = Key.as_str(manager, binary)
@@ -245,7 +503,7 @@ def get_pointer_from_dict(raw_data, manager=manager):
         raw_data.pop("binary_pointer", {}),
         (
             (Key.BINARY, Key.as_str, binary if binary is not None else NO_DEFAULT),
-            (Key.IDENTIFIER, Key.as_identifier, NO_DEFAULT),
+            (Key.IDENTIFIER, as_identifier, NO_DEFAULT),
             (Key.OFFSET, Key.as_int, NO_DEFAULT),
             (Key.LEVEL, Key.as_int, 0),
             (Key.SRV_CHECK, Key.as_bool, srv_check)
@@ -262,7 +520,7 @@ def get_pointer_from_dict(raw_data, manager=manager):
         raw_data,
         (
             (Key.BINARY, Key.as_str, binary if binary is not None else NO_DEFAULT),
-            (Key.IDENTIFIER, Key.as_identifier, NO_DEFAULT),
+            (Key.IDENTIFIER, as_identifier, NO_DEFAULT),
             (Key.OFFSET, Key.as_int, NO_DEFAULT),
             (Key.LEVEL, Key.as_int, 0),
             (Key.SRV_CHECK, Key.as_bool, srv_check)
@@ -275,19 +533,61 @@ def get_pointer_from_dict(raw_data, manager=manager):
 
     return pointer_dict
 
-def create_type_from_file(type_name, file, bases=(CustomType,), manager=manager):
-    return manager.create_type(type_name, get_type_from_file(file, manager), bases)
-
-def set_type_from_file(cls, file):
-    for name, value in get_type_from_file(file, cls._manager).items():
+def create_type_from_file(
+        type_name, file, bases=(CustomType,), manager=manager, lazy=None,
+        call_backend=None):
+    cls = manager.create_type(
+        type_name,
+        get_type_from_file(file, manager, lazy, call_backend),
+        bases)
+    _add_plugin_type(cls)
+    return cls
+
+def set_type_from_file(cls, file, lazy=None, call_backend=None):
+    for name, value in get_type_from_file(
+            file, cls._manager, lazy, call_backend).items():
         setattr(cls, name, value)
 
-def get_type_from_file(file, manager=manager):
-    return get_type_from_dict(GameConfigObj(file), manager)
-
-def get_type_from_dict(raw_data, manager=manager):
+    _add_plugin_type(cls)
+
+def get_type_from_file(file, manager=manager, lazy=None, call_backend=None):
+    return get_type_from_dict(
+        load_data_file(file), manager, lazy, call_backend)
+
+@_resolving_load
+def get_type_from_dict(
+        raw_data, manager=manager, lazy=None, call_backend=None):
+    """Return the attributes of a type described by the data.
+
+    :param dict raw_data:
+        The data of the type.
+    :param TypeManager manager:
+        The manager used to create the attributes.
+    :param bool lazy:
+        Whether the attributes found via a binary should be resolved the
+        first time they are accessed. If None, the ``lazy`` key of the data
+        is used.
+    :param str call_backend:
+        ``function`` to call the functions through :class:`memory.Function`
+        or ``ctypes`` to call them through ctypes, if their data types are
+        plain scalars and pointers. If None, the ``call_backend`` key of
+        the data is used. The ``call_backend`` key of a function overrides
+        it.
+    :rtype: dict
+    """
     type_dict = dict()
 
+    if lazy is None:
+        lazy = Key.as_bool(manager, raw_data.get("lazy", "False"))
+
+    if call_backend is None:
+        call_backend = _as_call_backend(
+            manager, raw_data.get("call_backend", "function"))
+
+    # Resolve all the signatures with one scan per binary
+    if not lazy:
+        resolve_identifiers(raw_data, manager)
+
     binary = raw_data.get(Key.BINARY, None)
     if binary is not None:
         binary = Key.as_str(manager, binary)
@@ -321,6 +621,10 @@ def get_type_from_dict(raw_data, manager=manager):
         for name, data in attributes:
             type_dict[name] = method(*data)
 
+            # Add the attribute to the layout of the type
+            if method.__name__ == "instance_attribute":
+                register_field(type_dict[name], data[0], data[1], data[3])
+
     # Prepare arrays
     for method in (
             manager.static_instance_array,
@@ -366,18 +670,19 @@ def get_type_from_dict(raw_data, manager=manager):
         (
             (Key.BINARY, Key.as_str, binary if binary is not None else NO_DEFAULT),
             (Key.SRV_CHECK, Key.as_bool, srv_check),
-            (Key.IDENTIFIER, Key.as_identifier, NO_DEFAULT),
+            (Key.IDENTIFIER, as_identifier, NO_DEFAULT),
             (Key.ARGS, Key.as_args_tuple, ()),
             (Key.RETURN_TYPE, Key.as_return_type, DataType.VOID),
             (Key.CONVENTION, Key.as_convention, Convention.THISCALL),
-            (Key.DOC, Key.as_str, None)
+            (Key.DOC, Key.as_str, None),
+            ("call_backend", _as_call_backend, call_backend)
         )
     )
 
     # Create the functions
     for name, data in funcs:
-        ptr = find_binary(*data[:2]).find_address(data[2])
-        type_dict[name] = manager.function_pointer(ptr, *data[3:])
+        type_dict[name] = _create_attribute(
+            lazy, name, _create_function, manager, data)
 
 
     # Via binary.
@@ -389,7 +694,7 @@ def get_type_from_dict(raw_data, manager=manager):
         (
             ("method", Key.as_str, "instance_attribute"),
             (Key.BINARY, Key.as_str, binary if binary is not None else NO_DEFAULT),
-            (Key.IDENTIFIER, Key.as_identifier, NO_DEFAULT),
+            (Key.IDENTIFIER, as_identifier, NO_DEFAULT),
             (Key.OFFSET, Key.as_int, NO_DEFAULT),
             (Key.SIZE, Key.as_int, 4),
             (Key.SRV_CHECK, Key.as_bool, srv_check),
@@ -400,9 +705,8 @@ def get_type_from_dict(raw_data, manager=manager):
 
     # Create the attributes
     for name, data in attributes:
-        method = getattr(manager, data[0])
-        offset = get_offset(*data[1:6])
-        type_dict[name] = method(data[6], offset, data[7])
+        type_dict[name] = _create_attribute(
+            lazy, name, _create_binary_attribute, manager, data)
 
     # Prepare binary arrays
     arrays = parse_data(
@@ -411,7 +715,7 @@ def get_type_from_dict(raw_data, manager=manager):
         (
             ("method", Key.as_str, "static_instance_array"),
             (Key.BINARY, Key.as_str, binary if binary is not None else NO_DEFAULT),
-            (Key.IDENTIFIER, Key.as_identifier, NO_DEFAULT),
+            (Key.IDENTIFIER, as_identifier, NO_DEFAULT),
             (Key.OFFSET, Key.as_int, NO_DEFAULT),
             (Key.SIZE, Key.as_int, 4),
             (Key.SRV_CHECK, Key.as_bool, srv_check),
@@ -423,9 +727,8 @@ def get_type_from_dict(raw_data, manager=manager):
 
     # Create the arrays
     for name, data in arrays:
-        method = getattr(manager, data[0])
-        offset = get_offset(*data[1:6])
-        type_dict[name] = method(data[6], offset, data[7], data[8])
+        type_dict[name] = _create_attribute(
+            lazy, name, _create_binary_attribute, manager, data)
 
     # Prepare binary virtual functions
     vfuncs = parse_data(
@@ -433,7 +736,7 @@ def get_type_from_dict(raw_data, manager=manager):
         raw_data.get("binary_virtual_function", {}),
         (
             (Key.BINARY, Key.as_str, binary if binary is not None else NO_DEFAULT),
-            (Key.IDENTIFIER, Key.as_identifier, NO_DEFAULT),
+            (Key.IDENTIFIER, as_identifier, NO_DEFAULT),
             (Key.OFFSET, Key.as_int, NO_DEFAULT),
             (Key.SIZE, Key.as_int, 4),
             (Key.SRV_CHECK, Key.as_bool, srv_check),
@@ -446,8 +749,8 @@ def get_type_from_dict(raw_data, manager=manager):
 
     # Create the virtual functions
     for name, data in vfuncs:
-        index = get_offset(*data[:5]) // 4
-        type_dict[name] = manager.virtual_function(index, *data[5:])
+        type_dict[name] = _create_attribute(
+            lazy, name, _create_binary_virtual_function, manager, data)
 
     # Prepare binary absolute functions
     funcs = parse_data(
@@ -455,21 +758,22 @@ def get_type_from_dict(raw_data, manager=manager):
         raw_data.get("binary_absolute_function", {}),
         (
             (Key.BINARY, Key.as_str, binary if binary is not None else NO_DEFAULT),
-            (Key.IDENTIFIER, Key.as_identifier, NO_DEFAULT),
+            (Key.IDENTIFIER, as_identifier, NO_DEFAULT),
             (Key.OFFSET, Key.as_int, NO_DEFAULT),
             (Key.LEVEL, Key.as_int, 1),
             (Key.SRV_CHECK, Key.as_bool, srv_check),
             (Key.ARGS, Key.as_args_tuple, ()),
             (Key.RETURN_TYPE, Key.as_return_type, DataType.VOID),
             (Key.CONVENTION, Key.as_convention, Convention.THISCALL),
-            (Key.DOC, Key.as_str, None)
+            (Key.DOC, Key.as_str, None),
+            ("call_backend", _as_call_backend, call_backend)
         )
     )
 
     # Create the functions
     for name, data in funcs:
-        ptr = get_pointer(*data[:5])
-        type_dict[name] = manager.function_pointer(ptr, *data[5:])
+        type_dict[name] = _create_attribute(
+            lazy, name, _create_binary_absolute_function, manager, data)
 
     # Prepare binary relative functions
     funcs = parse_data(
@@ -477,21 +781,22 @@ def get_type_from_dict(raw_data, manager=manager):
         raw_data.get("binary_relative_function", {}),
         (
             (Key.BINARY, Key.as_str, binary if binary is not None else NO_DEFAULT),
-            (Key.IDENTIFIER, Key.as_identifier, NO_DEFAULT),
+            (Key.IDENTIFIER, as_identifier, NO_DEFAULT),
             (Key.OFFSET, Key.as_int, NO_DEFAULT),
             (Key.SIZE, Key.as_int, 4),
             (Key.SRV_CHECK, Key.as_bool, srv_check),
             (Key.ARGS, Key.as_args_tuple, ()),
             (Key.RETURN_TYPE, Key.as_return_type, DataType.VOID),
             (Key.CONVENTION, Key.as_convention, Convention.THISCALL),
-            (Key.DOC, Key.as_str, None)
+            (Key.DOC, Key.as_str, None),
+            ("call_backend", _as_call_backend, call_backend)
         )
     )
 
     # Create the functions
     for name, data in funcs:
-        ptr = get_relative_pointer(*data[:5])
-        type_dict[name] = manager.function_pointer(ptr, *data[5:])
+        type_dict[name] = _create_attribute(
+            lazy, name, _create_binary_relative_function, manager, data)
 
     # Prepare binary pointers
     ptrs = parse_data(
@@ -499,7 +804,7 @@ def get_type_from_dict(raw_data, manager=manager):
         raw_data.get("binary_pointer", {}),
         (
             (Key.BINARY, Key.as_str, binary if binary is not None else NO_DEFAULT),
-            (Key.IDENTIFIER, Key.as_identifier, NO_DEFAULT),
+            (Key.IDENTIFIER, as_identifier, NO_DEFAULT),
             (Key.OFFSET, Key.as_int, NO_DEFAULT),
             (Key.LEVEL, Key.as_int, 0),
             (Key.SRV_CHECK, Key.as_bool, srv_check)
@@ -508,10 +813,49 @@ def get_type_from_dict(raw_data, manager=manager):
 
     # Create the pointers
     for name, data in ptrs:
-        type_dict[name] = get_pointer(*data)
+        type_dict[name] = _create_attribute(
+            lazy, name, _create_binary_pointer, manager, data)
 
     return type_dict
 
+def _create_attribute(lazy, name, function, manager, data):
+    if lazy:
+        return LazyAttribute(name, function, manager, data)
+
+    return function(manager, data)
+
+def _create_member_function(
+        manager, ptr, args, return_type, convention, doc, call_backend):
+    if call_backend == "ctypes":
+        return manager.ctypes_function_pointer(
+            ptr, args, return_type, convention, doc)
+
+    return manager.function_pointer(ptr, args, return_type, convention, doc)
+
+def _create_function(manager, data):
+    ptr = find_address(data[0], data[2], data[1])
+    return _create_member_function(manager, ptr, *data[3:])
+
+def _create_binary_attribute(manager, data):
+    method = getattr(manager, data[0])
+    offset = get_offset(*data[1:6])
+    return method(data[6], offset, *data[7:])
+
+def _create_binary_virtual_function(manager, data):
+    index = get_offset(*data[:5]) // 4
+    return manager.virtual_function(index, *data[5:])
+
+def _create_binary_absolute_function(manager, data):
+    ptr = get_pointer(*data[:5])
+    return _create_member_function(manager, ptr, *data[5:])
+
+def _create_binary_relative_function(manager, data):
+    ptr = get_relative_pointer(*data[:5])
+    return _create_member_function(manager, ptr, *data[5:])
+
+def _create_binary_pointer(manager, data):
+    return get_pointer(*data)
+
 def create_data_pipe_from_file(file):
     return manager.create_pipe(get_data_from_file(file))
 
@@ -520,11 +864,15 @@ def set_data_from_file(cls, file):
         setattr(cls, name, value)
 
 def get_data_from_file(file):
-    return get_data_from_dict(GameConfigObj(file))
+    return get_data_from_dict(load_data_file(file))
 
+@_resolving_load
 def get_data_from_dict(raw_data):
     data_dict = dict()
 
+    # Resolve all the signatures with one scan per binary
+    resolve_identifiers(raw_data)
+
     binary = raw_data.get(Key.BINARY, None)
     if binary is not None:
         binary = Key.as_str(manager, binary)
@@ -554,14 +902,14 @@ def get_data_from_dict(raw_data):
         manager,
         raw_data.get("function", {}),
         (
-            (Key.IDENTIFIER, Key.as_identifier, NO_DEFAULT),
+            (Key.IDENTIFIER, as_identifier, NO_DEFAULT),
             (Key.BINARY, Key.as_str, binary if binary is not None else NO_DEFAULT),
             (Key.SRV_CHECK, Key.as_bool, srv_check)
         )
     )
 
     for name, data in pointers_data:
-        data_dict[name] = find_binary(*data[1:]).find_address(data[0]).address
+        data_dict[name] = find_address(data[1], data[0], data[2]).address
 
 
     for method_name in ("binary_attribute", "binary_array"):
@@ -570,7 +918,7 @@ def get_data_from_dict(raw_data):
             raw_data.get(method_name, {}),
             (
                 (Key.BINARY, Key.as_str, binary if binary is not None else NO_DEFAULT),
-                (Key.IDENTIFIER, Key.as_identifier, NO_DEFAULT),
+                (Key.IDENTIFIER, as_identifier, NO_DEFAULT),
                 (Key.OFFSET, Key.as_int, NO_DEFAULT),
                 (Key.SIZE, Key.as_int, 4),
                 (Key.SRV_CHECK, Key.as_bool, srv_check)
@@ -586,7 +934,7 @@ def get_data_from_dict(raw_data):
         raw_data.get("binary_virtual_function", {}),
         (
             (Key.BINARY, Key.as_str, binary if binary is not None else NO_DEFAULT),
-            (Key.IDENTIFIER, Key.as_identifier, NO_DEFAULT),
+            (Key.IDENTIFIER, as_identifier, NO_DEFAULT),
             (Key.OFFSET, Key.as_int, NO_DEFAULT),
             (Key.SIZE, Key.as_int, 4),
             (Key.SRV_CHECK, Key.as_bool, srv_check)
@@ -602,7 +950,7 @@ def get_data_from_dict(raw_data):
         raw_data.get("binary_absolute_function", {}),
         (
             (Key.BINARY, Key.as_str, binary if binary is not None else NO_DEFAULT),
-            (Key.IDENTIFIER, Key.as_identifier, NO_DEFAULT),
+            (Key.IDENTIFIER, as_identifier, NO_DEFAULT),
             (Key.OFFSET, Key.as_int, NO_DEFAULT),
             (Key.LEVEL, Key.as_int, 1),
             (Key.SRV_CHECK, Key.as_bool, srv_check)
@@ -618,7 +966,7 @@ def get_data_from_dict(raw_data):
         raw_data.get("binary_relative_function", {}),
         (
             (Key.BINARY, Key.as_str, binary if binary is not None else NO_DEFAULT),
-            (Key.IDENTIFIER, Key.as_identifier, NO_DEFAULT),
+            (Key.IDENTIFIER, as_identifier, NO_DEFAULT),
             (Key.OFFSET, Key.as_int, NO_DEFAULT),
             (Key.SIZE, Key.as_int, 4),
             (Key.SRV_CHECK, Key.as_bool, srv_check)
@@ -634,7 +982,7 @@ def get_data_from_dict(raw_data):
         raw_data.get("binary_pointer", {}),
         (
             (Key.BINARY, Key.as_str, binary if binary is not None else NO_DEFAULT),
-            (Key.IDENTIFIER, Key.as_identifier, NO_DEFAULT),
+            (Key.IDENTIFIER, as_identifier, NO_DEFAULT),
             (Key.OFFSET, Key.as_int, NO_DEFAULT),
             (Key.LEVEL, Key.as_int, 0),
             (Key.SRV_CHECK, Key.as_bool, srv_check)
@@ -655,11 +1003,14 @@ def set_ctype_from_file(cls, file, auto_dealloc=True):
 
 def get_ctype_from_file(file, auto_dealloc=True):
     return get_ctype_from_dict(
-        get_function_from_dict(GameConfigObj(file)), auto_dealloc=True)
+        get_function_from_dict(load_data_file(file)), auto_dealloc)
 
 def get_ctype_from_dict(raw_data, auto_dealloc=True):
     ctype_dict = {}
     for name, value in raw_data.items():
+        if isinstance(value, CtypesFunction):
+            value = value.function
+
         if auto_dealloc:
             ctype_dict[name] = get_ctype_function(value)
         else:
@@ -667,9 +1018,13 @@ def get_ctype_from_dict(raw_data, auto_dealloc=True):
 
     return ctype_dict
 
+@_resolving_load
 def create_patchers_from_file(file):
     """Create patchers from a file."""
-    raw_data = GameConfigObj(file)
+    raw_data = load_data_file(file)
+
+    # Resolve all the signatures with one scan per binary
+    resolve_identifiers(raw_data)
 
     binary = raw_data.pop(Key.BINARY, None)
     if binary is not None:
@@ -682,7 +1037,7 @@ def create_patchers_from_file(file):
         manager,
         raw_data, (
             (Key.BINARY, Key.as_str, binary if binary is not None else NO_DEFAULT),
-            (Key.IDENTIFIER, Key.as_identifier, NO_DEFAULT),
+            (Key.IDENTIFIER, as_identifier, NO_DEFAULT),
             (Key.OFFSET, Key.as_int, 0),
             (Key.LEVEL, Key.as_int, 0),
             (Key.SRV_CHECK, Key.as_bool, srv_check),
@@ -696,7 +1051,8 @@ def create_patchers_from_file(file):
     patchers = Patchers()
     for name, data in patcher_data:
         try:
-            patchers[name] = Patcher(get_pointer(*data[:5]), *data[5:])
+            patchers[name] = Patcher(
+                get_pointer(*data[:5]), *data[5:], unprotect=False)
         except (TypeError, ValueError):
             print(f"An exception was raised on '{name}'")
             raise
@@ -6,12 +6,16 @@
 # >> IMPORTS
 # =============================================================================
 # Python Imports
+#   Bisect
+from bisect import bisect_left
+from bisect import bisect_right
 #   Collections
 from collections.abc import MutableMapping
 #   Ctypes
-from ctypes import c_ubyte
 from ctypes import c_void_p
 from ctypes import memmove
+#   Mmap
+from mmap import PAGESIZE
 #   Weakref
 from weakref import WeakValueDictionary
 
@@ -24,12 +28,16 @@ from memory import Pointer
 # Memory Tools Imports
 #   Memory Tools
 from memorytools import get_jmp_bytes
+from memorytools import get_view
+#   Regions
+from memorytools.regions import check_readable
 
 
 # =============================================================================
 # >> ALL DECLARATION
 # =============================================================================
 __all__ = ("make_jmp",
+           "unprotect_patchers",
            "Patcher",
            "Patchers",
            )
@@ -38,8 +46,43 @@ __all__ = ("make_jmp",
 # =============================================================================
 # >> CLASSES
 # =============================================================================
+class _PatcherIndex:
+    """Sorted interval index of the non-overlapping patchers."""
+
+    def __init__(self):
+        self._addresses = list()
+        self._patchers = list()
+
+    def __len__(self):
+        return len(self._patchers)
+
+    def __iter__(self):
+        return iter(list(self._patchers))
+
+    def add(self, patcher):
+        index = bisect_right(self._addresses, patcher.address)
+        self._addresses.insert(index, patcher.address)
+        self._patchers.insert(index, patcher)
+
+    def remove(self, patcher):
+        index = bisect_left(self._addresses, patcher.address)
+        while self._patchers[index] is not patcher:
+            index += 1
+
+        del self._addresses[index]
+        del self._patchers[index]
+
+    def in_range(self, start, end):
+        # Only the previous patcher can reach into the range
+        index = max(bisect_right(self._addresses, start) - 1, 0)
+        stop = bisect_left(self._addresses, end)
+
+        return [patcher for patcher in self._patchers[index:stop]
+                if patcher.address + patcher.size > start]
+
+
 class Patcher(WeakAutoUnload):
-    _patchers = dict()
+    _patchers = _PatcherIndex()
 
     no_op_codes = [
         b"\x90",
@@ -53,7 +96,9 @@ class Patcher(WeakAutoUnload):
         b"\x66\x0f\x1f\x84\x00\x00\x00\x00\x00",
     ]
 
-    def __init__(self, pointer, size, op_codes=None, base_op_codes=None):
+    def __init__(
+            self, pointer, size, op_codes=None, base_op_codes=None,
+            unprotect=True, guard=None):
         """Initialize the patcher.
 
         :param Pointer/int pointer:
@@ -65,12 +110,20 @@ class Patcher(WeakAutoUnload):
         :param bytes base_op_codes:
             Base op-codes used for verification to prevent crashes
             when binary has been changed.
+        :param bool unprotect:
+            Whether the memory should be unprotected right away. If not, it
+            is unprotected by :meth:`Patchers.apply` or the first
+            :meth:`patch`.
+        :param bool guard:
+            Whether the memory should be validated before it is read. If
+            None, the global ``region_index.guard`` is used.
         :raise TypeError:
             Raised if ``pointer`` is not Pointer or int.
         :raise ValueError:
             Raised if the patcher is overlapping with another patcher's
             memory space or ``base_op_codes`` does not match the original
-            op-codes or ``op_codes`` and ``base_op_codes`` exceed ``size``.
+            op-codes or ``op_codes`` and ``base_op_codes`` exceed ``size``
+            or the memory is not readable, while the guard is enabled.
         """
         self._patchable = False
 
@@ -87,42 +140,68 @@ class Patcher(WeakAutoUnload):
 
         address = int(pointer)
 
-        for patcher in self._patchers.values():
-            if (address <= patcher.address):
-                small_address = address + size
-                large_address = patcher.address
-            else:
-                small_address = patcher.address + patcher.size
-                large_address = address
-
-            if small_address > large_address:
-                patcher_address = hex(patcher.address)
-                patcher_original = ' '.join("{:02X}".format(i) for i in patcher.original)
-                patcher_op_codes = ' '.join("{:02X}".format(i) for i in patcher.op_codes)
-                raise ValueError(f"Patcher's memory space is overlapping:\n    address '{patcher_address}'\n    original '{patcher_original}'\n    op_codes '{patcher_op_codes}'")
-
-        original = bytes((c_ubyte*size).from_address(address))
-
-        if base_op_codes is not None:
-            original_op_codes = original[:len(base_op_codes)]
-            for base_byte, original_byte, in zip(base_op_codes, original_op_codes):
-                if base_byte != 0x2A and base_byte != original_byte:
-                    original_op_codes = ' '.join("{:02X}".format(i) for i in original_op_codes)
-                    base_op_codes = ' '.join("{:02X}".format(i) for i in base_op_codes).replace("2A", "??")
-                    raise ValueError(f"Original op-codes does not match base_op_codes:\n    original '{original_op_codes}'\n    base     '{base_op_codes}'")
-
-        Pointer(address).unprotect(size)
+        for patcher in self._patchers.in_range(address, address + size):
+            patcher_address = hex(patcher.address)
+            patcher_original = ' '.join("{:02X}".format(i) for i in patcher.original)
+            patcher_op_codes = ' '.join("{:02X}".format(i) for i in patcher.op_codes)
+            raise ValueError(f"Patcher's memory space is overlapping:\n    address '{patcher_address}'\n    original '{patcher_original}'\n    op_codes '{patcher_op_codes}'")
+
+        check_readable(address, size, guard)
+        original = get_view(address, size)
+
+        self.check_op_codes(original, base_op_codes)
+
+        if unprotect:
+            Pointer(address).unprotect(size)
 
         self.address = address
         self.size = size
         self.pointer = c_void_p(address)
-        self.original = original
+        self.original = original.tobytes()
         self.op_codes = self.get_op_codes(op_codes, size)
+        self.base_op_codes = base_op_codes
+        self.unprotected = unprotect
 
         self.patched = False
         self._patchable = True
 
-        self._patchers[id(self)] = self
+        self._patchers.add(self)
+
+    @classmethod
+    def find(cls, address):
+        """Return the patcher which patches the address or None."""
+        address = int(address)
+        patchers = cls._patchers.in_range(address, address + 1)
+        return patchers[0] if patchers else None
+
+    @classmethod
+    def in_range(cls, start, end):
+        """Return the patchers which overlap the memory [start, end)."""
+        return cls._patchers.in_range(int(start), int(end))
+
+    @staticmethod
+    def check_op_codes(original, base_op_codes):
+        """Raise ValueError if the op-codes do not match base_op_codes."""
+        if base_op_codes is None:
+            return
+
+        original_op_codes = original[:len(base_op_codes)]
+        for base_byte, original_byte, in zip(base_op_codes, original_op_codes):
+            if base_byte != 0x2A and base_byte != original_byte:
+                original_op_codes = ' '.join("{:02X}".format(i) for i in original_op_codes)
+                base_op_codes = ' '.join("{:02X}".format(i) for i in base_op_codes).replace("2A", "??")
+                raise ValueError(f"Original op-codes does not match base_op_codes:\n    original '{original_op_codes}'\n    base     '{base_op_codes}'")
+
+    def verify(self):
+        """Raise ValueError if the memory does not match base_op_codes."""
+        if not self.patched:
+            self.check_op_codes(
+                get_view(self.address, self.size), self.base_op_codes)
+
+    def unprotect(self):
+        if not self.unprotected:
+            Pointer(self.address).unprotect(self.size)
+            self.unprotected = True
 
     @classmethod
     def get_no_op(cls, size):
@@ -142,6 +221,7 @@ class Patcher(WeakAutoUnload):
 
     def patch(self):
         if not self.patched and self._patchable:
+            self.unprotect()
             memmove(self.pointer, self.op_codes, self.size)
             self.patched = True
 
@@ -167,7 +247,7 @@ class Patcher(WeakAutoUnload):
             self.reset()
             self._patchable = False
 
-            del self._patchers[id(self)]
+            self._patchers.remove(self)
 
 
 class Patchers(MutableMapping):
@@ -200,6 +280,38 @@ class Patchers(MutableMapping):
             patcher.patch()
         self.patched = True
 
+    def apply(self):
+        """Patch every patcher or none of them.
+
+        All the patchers are verified against their base_op_codes first.
+        Their memory is then unprotected once per merged page span and
+        every write is rolled back if any of them fails.
+
+        :raise ValueError:
+            Raised if the memory of a patcher does not match its
+            base_op_codes.
+        """
+        patchers = [
+            patcher for patcher in self._patchers.values()
+            if not patcher.patched and patcher._patchable]
+
+        for patcher in patchers:
+            patcher.verify()
+
+        unprotect_patchers(patchers)
+
+        patched = list()
+        try:
+            for patcher in patchers:
+                patcher.patch()
+                patched.append(patcher)
+        except BaseException:
+            for patcher in reversed(patched):
+                patcher.reset()
+            raise
+
+        self.patched = True
+
     def reset(self):
         for patcher in self._patchers.values():
             patcher.reset()
@@ -229,3 +341,35 @@ def make_jmp(base, dest, short=True):
     jmp_bytes = get_jmp_bytes(base, dest, short)
     return Patcher(base, len(jmp_bytes), jmp_bytes)
 
+def unprotect_patchers(patchers, page_size=PAGESIZE):
+    """Unprotect the memory of the patchers once per merged page span.
+
+    :param iterable patchers:
+        The patchers to unprotect.
+    :param int page_size:
+        The size of a memory page.
+    :return:
+        The (start, size) tuples of the unprotected spans.
+    :rtype: list
+    """
+    patchers = sorted(
+        (patcher for patcher in patchers if not patcher.unprotected),
+        key=lambda patcher: patcher.address)
+
+    spans = list()
+    for patcher in patchers:
+        start = patcher.address - patcher.address % page_size
+        end = -(-(patcher.address + patcher.size) // page_size) * page_size
+        if spans and start <= spans[-1][1]:
+            spans[-1][1] = max(spans[-1][1], end)
+        else:
+            spans.append([start, end])
+
+    for start, end in spans:
+        Pointer(start).unprotect(end - start)
+
+    for patcher in patchers:
+        patcher.unprotected = True
+
+    return [(start, end - start) for start, end in spans]
+
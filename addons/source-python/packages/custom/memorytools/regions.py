@@ -0,0 +1,303 @@
+# ../addons/source-python/packages/custom/memorytools/regions.py
+
+"""Provides an index of the memory regions of the process."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Bisect
+from bisect import bisect_right
+#   Collections
+from collections import namedtuple
+#   Ctypes
+import ctypes
+
+# Source.Python Imports
+#   Core
+from core import PLATFORM
+#   Listeners
+from listeners import on_plugin_loaded_manager
+from listeners import on_plugin_unloaded_manager
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ("Region",
+           "RegionIndex",
+           "check_readable",
+           "is_executable",
+           "is_readable",
+           "is_writable",
+           "region_index",
+           )
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+MEM_COMMIT = 0x1000
+
+PAGE_NOACCESS = 0x01
+PAGE_GUARD = 0x100
+
+_readable_protections = 0x02 | 0x04 | 0x08 | 0x20 | 0x40 | 0x80
+_writable_protections = 0x04 | 0x08 | 0x40 | 0x80
+_executable_protections = 0x10 | 0x20 | 0x40 | 0x80
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+Region = namedtuple(
+    "Region", ("start", "end", "readable", "writable", "executable", "path"))
+
+
+class _MemoryBasicInformation(ctypes.Structure):
+    _fields_ = (
+        ("BaseAddress", ctypes.c_void_p),
+        ("AllocationBase", ctypes.c_void_p),
+        ("AllocationProtect", ctypes.c_ulong),
+        ("RegionSize", ctypes.c_size_t),
+        ("State", ctypes.c_ulong),
+        ("Protect", ctypes.c_ulong),
+        ("Type", ctypes.c_ulong),
+    )
+
+
+class RegionIndex:
+    """Sorted index of the mapped memory regions of the process.
+
+    The index is read from /proc/self/maps, or with VirtualQuery on Windows.
+    Memory mapped or unprotected after the last refresh, e.g. by a module
+    loaded since, is not indexed, so the index is refreshed whenever a
+    check fails. Memory unmapped since is still indexed, so a check that
+    passes is verified again after :meth:`invalidate`, which is called
+    whenever a plugin is loaded or unloaded.
+    """
+
+    def __init__(self, guard=False):
+        """Initialize the index.
+
+        :param bool guard:
+            Whether :func:`check_readable` should validate the memory, if
+            the caller doesn't decide it.
+        """
+        self.guard = guard
+        self.refreshes = 0
+
+        self._starts = list()
+        self._regions = list()
+        self._loaded = False
+        self._stale = False
+
+    def __len__(self):
+        self._load()
+        return len(self._regions)
+
+    def __iter__(self):
+        self._load()
+        return iter(list(self._regions))
+
+    def refresh(self):
+        """Read the memory regions of the process again."""
+        if PLATFORM == "windows":
+            regions = _read_windows_regions()
+        else:
+            regions = _read_proc_regions()
+
+        regions.sort()
+        self._starts = [region.start for region in regions]
+        self._regions = regions
+        self._loaded = True
+        self._stale = False
+        self.refreshes += 1
+
+    def invalidate(self):
+        """Verify the next successful checks against the memory regions
+        read again, e.g. after modules were loaded or unloaded.
+        """
+        self._stale = True
+
+    def find(self, address):
+        """Return the region containing the address or None."""
+        self._load()
+        region = self._find(int(address))
+        if region is None:
+            self.refresh()
+            region = self._find(int(address))
+
+        return region
+
+    def is_readable(self, address, size=1):
+        """Return whether the memory [address, address+size) is readable."""
+        return self._check(int(address), size, "readable")
+
+    def is_writable(self, address, size=1):
+        """Return whether the memory [address, address+size) is writable."""
+        return self._check(int(address), size, "writable")
+
+    def is_executable(self, address, size=1):
+        """Return whether the memory [address, address+size) is executable."""
+        return self._check(int(address), size, "executable")
+
+    def _load(self):
+        if not self._loaded:
+            self.refresh()
+
+    def _find(self, address):
+        index = bisect_right(self._starts, address) - 1
+        if index < 0:
+            return None
+
+        region = self._regions[index]
+        return region if address < region.end else None
+
+    def _check(self, address, size, attribute):
+        self._load()
+        if self._check_regions(address, size, attribute):
+            if not self._stale:
+                return True
+
+        # The memory might have been mapped or unmapped since the last
+        # refresh
+        self.refresh()
+        return self._check_regions(address, size, attribute)
+
+    def _check_regions(self, address, size, attribute):
+        end = address + max(size, 1)
+        index = bisect_right(self._starts, address) - 1
+        if index < 0:
+            return False
+
+        # The memory can span adjacent regions
+        regions = self._regions
+        while index < len(regions):
+            region = regions[index]
+            if region.start > address or not getattr(region, attribute):
+                return False
+
+            if region.end >= end:
+                return True
+
+            address = region.end
+            index += 1
+
+        return False
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def is_readable(address, size=1):
+    """Return whether the memory [address, address+size) is readable.
+
+    :param Pointer/int address:
+        The pointer or memory address.
+    :param int size:
+        The size of the memory.
+    :rtype: bool
+    """
+    return region_index.is_readable(address, size)
+
+def is_writable(address, size=1):
+    """Return whether the memory [address, address+size) is writable."""
+    return region_index.is_writable(address, size)
+
+def is_executable(address, size=1):
+    """Return whether the memory [address, address+size) is executable."""
+    return region_index.is_executable(address, size)
+
+def check_readable(address, size=1, guard=None):
+    """Raise ValueError if the guard is enabled and the memory is not
+    readable. Empty memory is always readable.
+
+    Hot paths should only call the function if their guard is enabled, e.g.
+    ``if guard or (guard is None and region_index.guard)``.
+
+    :param Pointer/int address:
+        The pointer or memory address.
+    :param int size:
+        The size of the memory.
+    :param bool guard:
+        Whether the memory should be validated. If None, the global
+        ``region_index.guard`` is used, which is disabled by default.
+    :raise ValueError:
+        Raised if the memory is not readable.
+    """
+    if guard is None:
+        guard = region_index.guard
+
+    if (guard and
+        size > 0 and
+        not region_index.is_readable(address, size)):
+        raise ValueError(
+            "Memory is not readable: 0x{0:X} ({1} bytes)".format(
+                int(address), size))
+
+def _read_proc_regions():
+    regions = list()
+    try:
+        with open("/proc/self/maps") as file:
+            for line in file:
+                fields = line.split(None, 5)
+                if len(fields) < 5:
+                    continue
+
+                start, end = fields[0].split("-")
+                permissions = fields[1]
+                regions.append(Region(
+                    int(start, 16), int(end, 16),
+                    permissions[0] == "r", permissions[1] == "w",
+                    permissions[2] == "x",
+                    fields[5].strip() if len(fields) > 5 else ""))
+    except OSError:
+        pass
+
+    return regions
+
+def _read_windows_regions():
+    virtual_query = ctypes.windll.kernel32.VirtualQuery
+    virtual_query.argtypes = (
+        ctypes.c_void_p, ctypes.POINTER(_MemoryBasicInformation),
+        ctypes.c_size_t)
+    virtual_query.restype = ctypes.c_size_t
+
+    regions = list()
+    information = _MemoryBasicInformation()
+    address = 0
+    while virtual_query(
+            address, ctypes.byref(information), ctypes.sizeof(information)):
+        start = information.BaseAddress or 0
+        end = start + information.RegionSize
+        if end <= address:
+            break
+
+        protect = information.Protect
+        if (information.State == MEM_COMMIT and
+            not protect & (PAGE_NOACCESS | PAGE_GUARD)):
+            regions.append(Region(
+                start, end, bool(protect & _readable_protections),
+                bool(protect & _writable_protections),
+                bool(protect & _executable_protections), ""))
+
+        address = end
+
+    return regions
+
+
+# =============================================================================
+# >> REGION INDEX
+# =============================================================================
+region_index = RegionIndex()
+
+
+# =============================================================================
+# >> LISTENERS
+# =============================================================================
+def _on_plugin_changed(plugin):
+    region_index.invalidate()
+
+on_plugin_loaded_manager.register_listener(_on_plugin_changed)
+on_plugin_unloaded_manager.register_listener(_on_plugin_changed)
@@ -0,0 +1,167 @@
+# ../addons/source-python/packages/custom/memorytools/relocation.py
+
+"""Provides batched relocation of loaded code and data blobs."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Array
+from array import array
+#   Ctypes
+from ctypes import c_ubyte
+#   Os
+import os
+#   Struct
+import struct
+#   Sys
+import sys
+
+# Site-Packages Imports
+#   NumPy
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ("apply_relocations",
+           "get_relocation_path",
+           "load_relocations",
+           "save_relocations",
+           "set_addresses",
+           )
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+_uint = struct.Struct("<I")
+
+# The type code of array with 4 byte items
+_array_typecode = "I" if array("I").itemsize == 4 else "L"
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def apply_relocations(pointer, offsets, address=None):
+    """Add the address to the unsigned int at every offset.
+
+    This is the batched version of
+    :func:`memorytools.set_global_addresses`.
+
+    :param Pointer/int pointer:
+        The pointer or memory address of the blob.
+    :param offsets:
+        An array('I'), NumPy array or any iterable of the offsets.
+    :param Pointer/int address:
+        The address to add. Defaults to the address of the blob.
+    """
+    base = int(pointer)
+    address = base if address is None else int(address)
+
+    if numpy is not None:
+        view, indices = _get_indices(base, offsets)
+        if view is not None:
+            values = view[indices].view("<u4").ravel()
+            values += numpy.uint32(address & 0xFFFFFFFF)
+            view[indices] = values.view(numpy.uint8).reshape(-1, 4)
+        return
+
+    offsets = _as_sequence(offsets)
+    view = _get_view(base, offsets)
+    for offset in offsets:
+        _uint.pack_into(
+            view, offset,
+            (_uint.unpack_from(view, offset)[0] + address) & 0xFFFFFFFF)
+
+def set_addresses(pointer, value, offsets):
+    """Set the unsigned int at every offset to the value.
+
+    This is the batched version of :func:`memorytools.set_local_addresses`.
+
+    :param Pointer/int pointer:
+        The pointer or memory address of the blob.
+    :param Pointer/int value:
+        The value to set.
+    :param offsets:
+        An array('I'), NumPy array or any iterable of the offsets.
+    """
+    base = int(pointer)
+    value = int(value) & 0xFFFFFFFF
+
+    if numpy is not None:
+        view, indices = _get_indices(base, offsets)
+        if view is not None:
+            view[indices] = numpy.frombuffer(_uint.pack(value), numpy.uint8)
+        return
+
+    offsets = _as_sequence(offsets)
+    view = _get_view(base, offsets)
+    data = _uint.pack(value)
+    for offset in offsets:
+        view[offset:offset+4] = data
+
+def get_relocation_path(path):
+    """Return the path of the relocation table stored next to the blob."""
+    return str(path) + ".reloc"
+
+def load_relocations(path):
+    """Return the relocation table of the blob or None if there is none.
+
+    The table is a little endian array of 4 byte offsets.
+
+    :param str path:
+        The path of the blob.
+    :rtype: array
+    """
+    path = get_relocation_path(path)
+    if not os.path.isfile(path):
+        return None
+
+    offsets = array(_array_typecode)
+    with open(path, "rb") as file:
+        offsets.frombytes(file.read())
+
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    return offsets
+
+def save_relocations(path, offsets):
+    """Store the relocation table next to the blob.
+
+    :param str path:
+        The path of the blob.
+    :param offsets:
+        An array('I'), NumPy array or any iterable of the offsets.
+    """
+    offsets = array(_array_typecode, (int(offset) for offset in offsets))
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    with open(get_relocation_path(path), "wb") as file:
+        file.write(offsets.tobytes())
+
+def _as_sequence(offsets):
+    if isinstance(offsets, (array, list, tuple)):
+        return offsets
+    return list(offsets)
+
+def _get_view(base, offsets):
+    length = max(offsets, default=-4) + 4
+    return memoryview((c_ubyte*length).from_address(base)).cast("B")
+
+def _get_indices(base, offsets):
+    offsets = numpy.asarray(_as_sequence(offsets), dtype=numpy.intp)
+    if not offsets.size:
+        return None, None
+
+    view = numpy.frombuffer(_get_view(base, (int(offsets.max()),)), numpy.uint8)
+
+    # Every row holds the indices of the 4 bytes of one unsigned int
+    return view, offsets[:, None] + numpy.arange(4)
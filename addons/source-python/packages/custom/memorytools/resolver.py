@@ -0,0 +1,248 @@
+# ../addons/source-python/packages/custom/memorytools/resolver.py
+
+"""Provides batch resolution of the identifiers in data files."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Collections
+from collections import defaultdict
+#   Re
+import re
+
+# Source.Python Imports
+#   Core
+from core import PLATFORM
+#   Memory
+from memory import find_binary
+from memory.helpers import Key
+from memory.manager import manager
+
+# Memory Tools Imports
+#   Memory Tools
+from memorytools import add_resolved_addresses
+from memorytools import get_view
+#   Cache
+from memorytools.cache import address_cache
+#   Elf
+from memorytools.elf import get_scope
+#   Helpers
+from memorytools.helpers import as_identifier
+from memorytools.helpers import get_scoped_identifier
+from memorytools.helpers import IdentifierChain
+from memorytools.helpers import PrecompiledSection
+#   Scan
+from memorytools.scan import Pattern
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ("find_signatures",
+           "get_identifiers",
+           "resolve_identifiers",
+           )
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def find_signatures(binary, signatures, scope=None):
+    """Find the first address of every signature in one scan of the binary.
+
+    All the signatures are reduced to their longest literal run and searched
+    at once with a single alternation. Each anchor hit is then verified
+    against the full signature, including the ``2A`` wildcards.
+
+    :param BinaryFile binary:
+        The binary to scan.
+    :param iterable signatures:
+        The signatures to find.
+    :param str scope:
+        The part of the binary to scan, see :func:`memorytools.elf.get_scope`.
+        The whole binary is scanned if it is None or not available.
+    :return:
+        A dictionary with the signature as key and its address as value.
+        Signatures which could not be found are omitted.
+    :rtype: dict
+    """
+    signatures = [
+        Pattern(signature) for signature in set(signatures)
+        if any(byte != 0x2A for byte in signature)]
+
+    scope_range = None if scope is None else get_scope(binary, scope)
+    if scope_range is None:
+        scope_range = (binary.address, binary.size)
+
+    base, size = scope_range
+    view = get_view(base, size)
+
+    # Group the signatures by anchor. An anchor matched at a position hides
+    # every shorter anchor which is a prefix of it.
+    anchors = defaultdict(list)
+    for signature in signatures:
+        anchors[signature.anchor].append(signature)
+
+    prefixes = {
+        anchor: [other for other in anchors if anchor.startswith(other)]
+        for anchor in anchors}
+
+    addresses = dict()
+    remaining = len(signatures)
+    live = compiled = len(anchors)
+    regex = None
+    position = 0
+    while remaining:
+        # Leave the exhausted anchors out of the search once they are the
+        # majority, so the regex is compiled O(log anchors) times
+        if regex is None or 2 * live <= compiled:
+            regex = re.compile(b"|".join(
+                re.escape(anchor) for anchor in sorted(
+                    (anchor for anchor in anchors if anchors[anchor]),
+                    key=len, reverse=True)))
+            compiled = live
+
+        match = regex.search(view, position)
+        if match is None:
+            break
+
+        position = match.start() + 1
+        for anchor in prefixes[match.group()]:
+            anchor_signatures = anchors[anchor]
+            for signature in list(anchor_signatures):
+                start = match.start() - signature.anchor_offset
+                if start < 0 or signature.regex.match(view, start) is None:
+                    continue
+
+                addresses[signature.data] = base + start
+                anchor_signatures.remove(signature)
+                remaining -= 1
+                if not anchor_signatures:
+                    live -= 1
+
+    return addresses
+
+def get_identifiers(raw_data, manager=manager):
+    """Return every identifier of the data grouped by binary.
+
+    :param dict raw_data:
+        The data to gather the identifiers from.
+    :param TypeManager manager:
+        The manager used to convert the values.
+    :return:
+        A dictionary with a (binary, srv_check) tuple as key and a set of
+        identifiers as value.
+    :rtype: dict
+    """
+    identifiers = defaultdict(set)
+    _get_identifiers(raw_data, None, True, identifiers, manager)
+    return identifiers
+
+def _get_identifiers(section, binary, srv_check, identifiers, manager):
+    value = _get_value(section, Key.BINARY)
+    if value is not None:
+        binary = Key.as_str(manager, value)
+
+    value = _get_value(section, Key.SRV_CHECK)
+    if value is not None:
+        srv_check = Key.as_bool(manager, value)
+
+    value = _get_value(section, Key.IDENTIFIER)
+    if value is not None and binary is not None:
+        if not isinstance(section, PrecompiledSection):
+            value = as_identifier(manager, value)
+        elif isinstance(value, tuple):
+            value = IdentifierChain(value)
+        identifiers[(binary, srv_check)].add(
+            get_scoped_identifier(section, value))
+
+    for value in section.values():
+        if isinstance(value, dict):
+            _get_identifiers(value, binary, srv_check, identifiers, manager)
+
+def _get_value(section, key):
+    value = section.get(key + "_" + PLATFORM, None)
+    if value is None:
+        value = section.get(key, None)
+    return value if not isinstance(value, dict) else None
+
+def resolve_identifiers(raw_data, manager=manager):
+    """Resolve every signature of the data with one scan per binary.
+
+    The resolved addresses are added to the innermost
+    :func:`memorytools.resolved_addresses` load, so the loaders of
+    :mod:`memorytools.manager` will not scan the binaries again. They are
+    stored in the address cache as well, if it is enabled, and signatures
+    which are already cached do not cause a scan at all.
+
+    Every signature of a chain of alternatives is searched in the same scan,
+    unless the alternative which matched last is cached. The first
+    alternative found is stored as the winner of the chain.
+
+    :param dict raw_data:
+        The data to gather the identifiers from.
+    :param TypeManager manager:
+        The manager used to convert the values.
+    :return:
+        A dictionary with a (binary address, identifier) tuple as key and
+        the address as value.
+    :rtype: dict
+    """
+    resolved = dict()
+    for (binary, srv_check), identifiers in get_identifiers(
+            raw_data, manager).items():
+        binary = find_binary(binary, srv_check)
+        addresses = dict()
+
+        # Scope -> Signatures
+        signatures = defaultdict(list)
+        chains = list()
+        for identifier in identifiers:
+            if isinstance(identifier, IdentifierChain):
+                winner = address_cache.get_winner(binary, identifier)
+                if winner is not None and isinstance(winner, bytes):
+                    address = address_cache.get(binary, winner)
+                    if address is not None:
+                        addresses[winner] = address
+                        continue
+
+                chains.append(identifier)
+                alternatives = identifier
+            else:
+                alternatives = (identifier,)
+
+            for alternative in alternatives:
+                if not isinstance(alternative, bytes):
+                    continue
+
+                address = address_cache.get(binary, alternative)
+                if address is None:
+                    signatures[getattr(alternative, "scope", None)].append(
+                        alternative)
+                else:
+                    addresses[alternative] = address
+
+        for scope, scope_signatures in signatures.items():
+            found = find_signatures(binary, scope_signatures, scope)
+            address_cache.update(binary, found)
+            addresses.update(found)
+
+        # Symbols are not resolved here, so only the signatures in front of
+        # the first symbol can win
+        for chain in chains:
+            for alternative in chain:
+                if alternative in addresses:
+                    if address_cache.get_winner(binary, chain) != alternative:
+                        chain.report_match(alternative)
+                    address_cache.set_winner(binary, chain, alternative)
+                    break
+
+                if not isinstance(alternative, bytes):
+                    break
+
+        for identifier, address in addresses.items():
+            resolved[(binary.address, identifier)] = address
+
+    add_resolved_addresses(resolved)
+    return resolved
@@ -0,0 +1,266 @@
+# ../addons/source-python/packages/custom/memorytools/scan.py
+
+"""Provides searching of memory and files for every match of a pattern."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Mmap
+import mmap
+#   Os
+import os
+#   Re
+import re
+
+# Site-Packages Imports
+#   NumPy
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Source.Python Imports
+#   Memory
+from memory import BinaryFile
+
+# Memory Tools Imports
+#   Memory Tools
+from memorytools import MEM_CHUNK_SIZE
+from memorytools import get_view
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ("Pattern",
+           "is_unique",
+           "scan_all",
+           "scan_binary",
+           "scan_buffer",
+           "scan_file",
+           "scan_memory",
+           )
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class Pattern:
+    """A byte pattern with wildcards.
+
+    Patterns can be given as bytes, where ``0x2A`` is a wildcard like in the
+    data files, or as a hex string, where ``2A``, ``?`` and ``??`` are
+    wildcards.
+    """
+
+    def __init__(self, pattern):
+        """Initialize the pattern.
+
+        :param bytes/str pattern:
+            The pattern to search for.
+        :raise ValueError:
+            Raised if the pattern is empty or only consists of wildcards.
+        """
+        if isinstance(pattern, Pattern):
+            pattern = pattern.data
+
+        if isinstance(pattern, str):
+            tokens = pattern.split()
+            pattern = bytes(
+                0x2A if token in ("?", "??") else int(token, 16)
+                for token in tokens)
+
+        self.data = bytes(pattern)
+        self.fixed = tuple(
+            (index, byte) for index, byte in enumerate(self.data)
+            if byte != 0x2A)
+
+        if not self.fixed:
+            raise ValueError("Pattern does not contain any fixed byte.")
+
+        # Use the longest run without wildcards as the anchor
+        start = length = 0
+        for match in re.finditer(b"[^\x2A]+", self.data):
+            if match.end() - match.start() > length:
+                start = match.start()
+                length = match.end() - match.start()
+
+        self.anchor = self.data[start:start+length]
+        self.anchor_offset = start
+        self.regex = re.compile(b"".join(
+            b"." if byte == 0x2A else re.escape(bytes((byte,)))
+            for byte in self.data), re.DOTALL)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __repr__(self):
+        return "{0}('{1}')".format(type(self).__name__, ' '.join(
+            "??" if byte == 0x2A else "{:02X}".format(byte)
+            for byte in self.data))
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def scan_buffer(buffer, pattern, limit=None):
+    """Return the offset of every match of the pattern in the buffer.
+
+    Matches may overlap. If NumPy is available the candidates are filtered
+    with vectorized comparisons of the fixed bytes, chunk by chunk until
+    ``limit`` matches are found, otherwise the anchor of the pattern is
+    searched with the C search of :mod:`re`.
+
+    :param buffer:
+        A bytes-like object to search.
+    :param bytes/str/Pattern pattern:
+        The pattern to search for.
+    :param int limit:
+        The maximum number of matches to return.
+    :rtype: list
+    """
+    pattern = Pattern(pattern)
+    view = memoryview(buffer).cast("B")
+
+    if numpy is not None:
+        return _scan_numpy(view, pattern, limit)
+
+    return _scan_anchor(view, pattern, limit)
+
+def _scan_numpy(view, pattern, limit):
+    length = len(pattern)
+    count = len(view) - length + 1
+    if count <= 0:
+        return []
+
+    data = numpy.frombuffer(view, dtype=numpy.uint8)
+
+    offsets = list()
+    for start in range(0, count, MEM_CHUNK_SIZE):
+        # The chunks overlap by the pattern, so matches can cross them
+        stop = min(start + MEM_CHUNK_SIZE, count)
+        chunk = data[start:stop+length-1]
+
+        # Start with the first byte of the anchor, then narrow the
+        # candidates down with every other fixed byte
+        index, byte = pattern.anchor_offset, pattern.anchor[0]
+        candidates = numpy.flatnonzero(
+            chunk[index:index+stop-start] == byte)
+        for index, byte in pattern.fixed:
+            if not len(candidates):
+                break
+            if index == pattern.anchor_offset:
+                continue
+            candidates = candidates[chunk[candidates + index] == byte]
+
+        offsets.extend((candidates + start).tolist())
+        if limit is not None and len(offsets) >= limit:
+            return offsets[:limit]
+
+    return offsets
+
+def _scan_anchor(view, pattern, limit):
+    anchor = re.compile(re.escape(pattern.anchor))
+    end = len(view) - len(pattern) + pattern.anchor_offset + 1
+
+    offsets = list()
+    position = pattern.anchor_offset
+    while limit is None or len(offsets) < limit:
+        match = anchor.search(view, position, end + len(pattern.anchor) - 1)
+        if match is None:
+            break
+
+        position = match.start() + 1
+        offset = match.start() - pattern.anchor_offset
+        if pattern.regex.match(view, offset) is not None:
+            offsets.append(offset)
+
+    return offsets
+
+def scan_memory(address, size, pattern, limit=None):
+    """Return the address of every match of the pattern in a memory range.
+
+    :param Pointer/int address:
+        The start of the memory range.
+    :param int size:
+        The size of the memory range.
+    :param bytes/str/Pattern pattern:
+        The pattern to search for.
+    :param int limit:
+        The maximum number of matches to return.
+    :rtype: list
+    """
+    address = int(address)
+    view = get_view(address, size)
+    return [address + offset
+            for offset in scan_buffer(view, pattern, limit)]
+
+def scan_binary(binary, pattern, limit=None):
+    """Return the address of every match of the pattern in a binary.
+
+    :param BinaryFile binary:
+        The loaded binary to search.
+    :param bytes/str/Pattern pattern:
+        The pattern to search for.
+    :param int limit:
+        The maximum number of matches to return.
+    :rtype: list
+    """
+    return scan_memory(binary.address, binary.size, pattern, limit)
+
+def scan_file(path, pattern, limit=None):
+    """Return the file offset of every match of the pattern in a file.
+
+    The file is memory mapped, so large files are not read into memory.
+    Empty files, which can't be mapped, have no matches.
+
+    :param str path:
+        The file to search, e.g. a ``.so`` on the disk.
+    :param bytes/str/Pattern pattern:
+        The pattern to search for.
+    :param int limit:
+        The maximum number of matches to return.
+    :rtype: list
+    """
+    pattern = Pattern(pattern)
+    with open(str(path), "rb") as file:
+        if not os.fstat(file.fileno()).st_size:
+            return []
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            view = memoryview(data)
+            try:
+                return scan_buffer(view, pattern, limit)
+            finally:
+                view.release()
+
+def scan_all(source, pattern, size=None, limit=None):
+    """Return every match of the pattern in a binary, memory, file or buffer.
+
+    :param source:
+        A :class:`memory.BinaryFile` or a :class:`memory.Pointer`/int with
+        ``size`` to get addresses, a path to get file offsets, or a
+        bytes-like object to get offsets.
+    :param bytes/str/Pattern pattern:
+        The pattern to search for.
+    :param int size:
+        The size of the memory range, if ``source`` is an address.
+    :param int limit:
+        The maximum number of matches to return.
+    :rtype: list
+    """
+    if isinstance(source, BinaryFile):
+        return scan_binary(source, pattern, limit)
+
+    if size is not None:
+        return scan_memory(source, size, pattern, limit)
+
+    if isinstance(source, str) or hasattr(source, "__fspath__"):
+        return scan_file(source, pattern, limit)
+
+    return scan_buffer(source, pattern, limit)
+
+def is_unique(source, pattern, size=None):
+    """Return whether the pattern matches exactly once."""
+    return len(scan_all(source, pattern, size, 2)) == 1
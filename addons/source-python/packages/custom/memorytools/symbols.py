@@ -0,0 +1,255 @@
+# ../addons/source-python/packages/custom/memorytools/symbols.py
+
+"""Provides a persistent index of the symbols of ELF binaries."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Ctypes
+import ctypes
+from ctypes.util import find_library
+#   Fnmatch
+from fnmatch import fnmatchcase
+#   Marshal
+import marshal
+#   Os
+import os
+#   Pathlib
+from pathlib import Path
+#   Sys
+import sys
+#   Zlib
+from zlib import crc32
+
+# Source.Python Imports
+#   Paths
+from paths import CUSTOM_DATA_PATH
+
+# Memory Tools Imports
+#   Cache
+from memorytools.cache import get_binary_identity
+from memorytools.cache import get_binary_path
+#   Elf
+from memorytools.elf import get_elf_file
+from memorytools.elf import STT_FUNC
+from memorytools.elf import STT_OBJECT
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ("SYMBOL_INDEX_PATH",
+           "SymbolIndex",
+           "demangle",
+           "find_symbol",
+           "get_symbol_index",
+           "search_symbols",
+           )
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# ../addons/source-python/data/custom/memorytools/symbols
+SYMBOL_INDEX_PATH = CUSTOM_DATA_PATH / "memorytools" / "symbols"
+
+# Binary address -> SymbolIndex
+_symbol_indexes = dict()
+
+# The demangler of the C++ runtime or None
+try:
+    _libstdcxx = ctypes.CDLL(find_library("stdc++") or "libstdc++.so.6")
+    _cxa_demangle = _libstdcxx.__cxa_demangle
+    _cxa_demangle.argtypes = (
+        ctypes.c_char_p, ctypes.c_void_p, ctypes.c_void_p,
+        ctypes.POINTER(ctypes.c_int))
+    _cxa_demangle.restype = ctypes.c_void_p
+    _free = ctypes.CDLL(None).free
+    _free.argtypes = (ctypes.c_void_p,)
+except (OSError, AttributeError, TypeError):
+    _cxa_demangle = None
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class SymbolIndex:
+    """The symbols of a binary, parsed once and stored on the disk.
+
+    The addresses are stored relative to the binary, keyed by the identity
+    of its file, so a game update rebuilds the index.
+    """
+
+    version = 1
+
+    def __init__(self, binary, path=SYMBOL_INDEX_PATH, persistent=True):
+        """Load or build the index of the binary.
+
+        :param BinaryFile binary:
+            The binary to index.
+        :param Path path:
+            The directory to store the index files in.
+        :param bool persistent:
+            Whether the index should be written to/read from the disk.
+        """
+        self.binary = binary
+        self.offsets = dict()
+        self._demangled = None
+
+        binary_path = get_binary_path(binary)
+        identity = get_binary_identity(binary, binary_path)
+        self.file = None
+        if identity is not None and persistent:
+            self.file = Path(path) / "{name}.{hash:08X}.symbols".format(
+                name=Path(binary_path).name,
+                hash=crc32(binary_path.encode("utf-8")))
+
+        header = {
+            "version": self.version,
+            "python": list(sys.version_info[:2]),
+            "path": binary_path,
+            "identity": identity,
+        }
+
+        if self.file is not None and self._load(header):
+            return
+
+        self._build()
+        if self.file is not None:
+            self._save(header)
+
+    def __contains__(self, name):
+        return name in self.offsets
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def get(self, name):
+        """Return the address of the symbol or None."""
+        offset = self.offsets.get(name, None)
+        if offset is None:
+            return None
+
+        return self.binary.address + offset
+
+    def search(self, pattern):
+        """Return the symbols whose demangled name matches the pattern.
+
+        :param str pattern:
+            A shell-style pattern, e.g. ``CCSBot::*``. It is matched against
+            the mangled name as well.
+        :return:
+            A sorted list of (demangled name, name, address) tuples.
+        :rtype: list
+        """
+        if self._demangled is None:
+            self._demangled = {
+                name: demangle(name) for name in self.offsets}
+
+        return sorted(
+            (demangled, name, self.binary.address + self.offsets[name])
+            for name, demangled in self._demangled.items()
+            if fnmatchcase(demangled, pattern) or fnmatchcase(name, pattern))
+
+    def _build(self):
+        elf_file = get_elf_file(self.binary)
+        if elf_file is None:
+            return
+
+        base = -elf_file.base_vaddr
+        for symbol in elf_file.iter_symbols():
+            if symbol.type in (STT_FUNC, STT_OBJECT) and symbol.value:
+                self.offsets.setdefault(symbol.name, base + symbol.value)
+
+    def _load(self, header):
+        try:
+            with open(self.file, "rb") as file:
+                data = marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return False
+
+        if not isinstance(data, dict) or any(
+                data.get(key) != value for key, value in header.items()):
+            return False
+
+        self.offsets = data["offsets"]
+        return True
+
+    def _save(self, header):
+        data = dict(header, offsets=self.offsets)
+
+        try:
+            self.file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.file.with_suffix(".tmp")
+            with open(temp_file, "wb") as file:
+                marshal.dump(data, file)
+            os.replace(str(temp_file), str(self.file))
+        except OSError:
+            pass
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def get_symbol_index(binary):
+    """Return the symbol index of the binary, loading it only once.
+
+    :param BinaryFile binary:
+        The binary to index.
+    :rtype: SymbolIndex
+    """
+    symbol_index = _symbol_indexes.get(binary.address, None)
+    if symbol_index is None:
+        symbol_index = _symbol_indexes[binary.address] = SymbolIndex(binary)
+
+    return symbol_index
+
+def find_symbol(binary, name):
+    """Return the address of the symbol or None, if it is not indexed.
+
+    :param BinaryFile binary:
+        The binary to search.
+    :param str name:
+        The name of the symbol.
+    :rtype: int
+    """
+    return get_symbol_index(binary).get(name)
+
+def search_symbols(binary, pattern):
+    """Return the symbols whose demangled name matches the pattern.
+
+    Helps finding the symbol names for the data files, e.g.
+    ``search_symbols(server, "CCSBot::Upkeep*")``.
+
+    :param BinaryFile binary:
+        The binary to search.
+    :param str pattern:
+        A shell-style pattern.
+    :return:
+        A sorted list of (demangled name, name, address) tuples.
+    :rtype: list
+    """
+    return get_symbol_index(binary).search(pattern)
+
+def demangle(name):
+    """Return the demangled C++ name or the name, if it is not mangled.
+
+    :param str name:
+        The symbol name.
+    :rtype: str
+    """
+    if _cxa_demangle is None or not name.startswith("_Z"):
+        return name
+
+    status = ctypes.c_int()
+    result = _cxa_demangle(name.encode("ascii"), None, None, status)
+    if not result:
+        return name
+
+    try:
+        if status.value:
+            return name
+        return ctypes.string_at(result).decode("ascii", "replace")
+    finally:
+        _free(result)
@@ -0,0 +1,314 @@
+# ../addons/source-python/packages/custom/memorytools/xref.py
+
+"""Provides an index of the string literals and the code referencing them."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Bisect
+from bisect import bisect_right
+#   Collections
+from collections import defaultdict
+#   Re
+import re
+
+# Site-Packages Imports
+#   NumPy
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Memory Tools Imports
+#   Memory Tools
+from memorytools import get_view
+#   Elf
+from memorytools.elf import get_elf_file
+from memorytools.elf import get_scope
+from memorytools.elf import STT_FUNC
+#   Helpers
+from memorytools.helpers import AddressNotFoundError
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ("StringIndex",
+           "find_string_reference",
+           "get_string_index",
+           )
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# The shortest string literal worth indexing
+MIN_STRING_LENGTH = 4
+
+# How far to search back for the start of a function without a symbol
+MAX_FUNCTION_SIZE = 0x10000
+
+# Instructions padding the space between two functions
+_padding = (
+    b"\x90", b"\xcc", b"\x66\x90", b"\x8d\x76\x00", b"\x8d\x74\x26\x00",
+    b"\x8d\xb6\x00\x00\x00\x00", b"\x8d\xb4\x26\x00\x00\x00\x00",
+    b"\x8d\xbc\x27\x00\x00\x00\x00",
+)
+
+# Binary address -> StringIndex
+_string_indexes = dict()
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class StringIndex:
+    """The string literals of a binary and the code referencing them.
+
+    Code references a string either with its absolute address, or on Linux
+    with its offset from the global offset table (``lea reg, [ebx+disp]``).
+    Both are found as 32-bit operands in the executable sections.
+    """
+
+    def __init__(self, binary):
+        """Index the string literals of the binary.
+
+        The references are indexed at once if NumPy is available, otherwise
+        the references of a string are searched the first time they are
+        requested.
+
+        :param BinaryFile binary:
+            The binary to index.
+        """
+        self.binary = binary
+
+        elf_file = get_elf_file(binary)
+        base = binary.address if elf_file is None else (
+            binary.address - elf_file.base_vaddr)
+
+        # The global offset table position independent code is relative to
+        self.got = None
+        if elf_file is not None:
+            section = elf_file.get_section(".got.plt")
+            if section is None:
+                section = elf_file.get_section(".got")
+            if section is not None:
+                self.got = base + section.addr
+
+        self.text = get_scope(binary, "text") or (binary.address, binary.size)
+        self.rodata = get_scope(binary, "rodata") or (
+            binary.address, binary.size)
+
+        # String -> Addresses
+        self.strings = defaultdict(list)
+        address, size = self.rodata
+        view = get_view(address, size)
+        for match in re.finditer(
+                b"[^\\0]{%d,}(?=\\0)" % MIN_STRING_LENGTH, view):
+            self.strings[match.group()].append(address + match.start())
+
+        # Function start -> Function end
+        self._starts = list()
+        self._ends = list()
+        if elf_file is not None:
+            functions = sorted({
+                (base + symbol.value, base + symbol.value + symbol.size)
+                for symbol in elf_file.iter_symbols()
+                if symbol.type == STT_FUNC and symbol.size})
+            self._starts = [start for start, end in functions]
+            self._ends = [end for start, end in functions]
+
+        # String address -> Reference addresses
+        self._references = dict()
+        if numpy is not None:
+            self._index_references()
+
+    def find_string(self, string):
+        """Return the addresses of the string literal.
+
+        :param str/bytes string:
+            The string without the terminating null byte.
+        :rtype: list
+        """
+        if isinstance(string, str):
+            string = string.encode("utf-8")
+
+        return self.strings.get(string, [])
+
+    def get_references(self, string):
+        """Return the addresses of the operands referencing the string.
+
+        :param str/bytes string:
+            The string without the terminating null byte.
+        :rtype: list
+        """
+        references = list()
+        for address in self.find_string(string):
+            if address not in self._references:
+                self._references[address] = self._find_references(address)
+            references.extend(self._references[address])
+
+        return sorted(references)
+
+    def get_functions(self, string):
+        """Return the start addresses of the functions referencing the
+        string.
+
+        :param str/bytes string:
+            The string without the terminating null byte.
+        :rtype: list
+        """
+        functions = list()
+        for address in self.get_references(string):
+            function = self.get_function_start(address)
+            if function is not None and function not in functions:
+                functions.append(function)
+
+        return functions
+
+    def find_function(self, string):
+        """Return the start address of the only function referencing the
+        string.
+
+        :param str/bytes string:
+            The string without the terminating null byte.
+        :raise AddressNotFoundError:
+            Raised if no function or more than one function references the
+            string.
+        :rtype: int
+        """
+        functions = self.get_functions(string)
+        if len(functions) != 1:
+            raise AddressNotFoundError(
+                "{0} functions reference the string: {1!r}".format(
+                    len(functions), string))
+
+        return functions[0]
+
+    def get_function_start(self, address):
+        """Return the start address of the function containing the address.
+
+        The function symbols are used if available, otherwise the start is
+        the closest 16 byte aligned address following a return and padding.
+
+        :param int address:
+            An address in the function.
+        :return:
+            The address or None, if it could not be found.
+        :rtype: int
+        """
+        index = bisect_right(self._starts, address) - 1
+        if index >= 0 and address < self._ends[index]:
+            return self._starts[index]
+
+        text_start, text_size = self.text
+        start = max(text_start, address - MAX_FUNCTION_SIZE)
+        view = get_view(start, address - start)
+        for candidate in range(address & ~0xF, start, -0x10):
+            if _follows_return(view, candidate - start):
+                return candidate
+
+        return None
+
+    def _get_operands(self, address):
+        operands = [address & 0xFFFFFFFF]
+        if self.got is not None:
+            operands.append((address - self.got) & 0xFFFFFFFF)
+        return operands
+
+    def _find_references(self, address):
+        text_start, text_size = self.text
+        view = get_view(text_start, text_size)
+        regex = re.compile(b"|".join(
+            re.escape(operand.to_bytes(4, "little"))
+            for operand in self._get_operands(address)))
+
+        references = list()
+        position = 0
+        while True:
+            match = regex.search(view, position)
+            if match is None:
+                return references
+
+            references.append(text_start + match.start())
+            position = match.start() + 1
+
+    def _index_references(self):
+        # Operand -> String address
+        operands = dict()
+        for addresses in self.strings.values():
+            for address in addresses:
+                self._references[address] = list()
+                for operand in self._get_operands(address):
+                    operands.setdefault(operand, address)
+
+        if not operands:
+            return
+
+        keys = numpy.array(sorted(operands), dtype=numpy.uint32)
+        text_start, text_size = self.text
+        view = get_view(text_start, text_size)
+
+        # Search the operands at every alignment
+        for alignment in range(4):
+            count = (text_size - alignment) // 4
+            if count <= 0:
+                continue
+
+            words = numpy.frombuffer(view, numpy.uint32, count, alignment)
+            for index in numpy.flatnonzero(numpy.isin(words, keys)):
+                self._references[operands[int(words[index])]].append(
+                    text_start + alignment + 4 * int(index))
+
+        for references in self._references.values():
+            references.sort()
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def get_string_index(binary):
+    """Return the string index of the binary, building it only once.
+
+    :param BinaryFile binary:
+        The binary to index.
+    :rtype: StringIndex
+    """
+    string_index = _string_indexes.get(binary.address, None)
+    if string_index is None:
+        string_index = _string_indexes[binary.address] = StringIndex(binary)
+
+    return string_index
+
+def find_string_reference(binary, string):
+    """Return the start address of the function referencing the string.
+
+    :param BinaryFile binary:
+        The binary to search.
+    :param str/bytes string:
+        The string without the terminating null byte.
+    :raise AddressNotFoundError:
+        Raised if no function or more than one function references the
+        string.
+    :rtype: int
+    """
+    return get_string_index(binary).find_function(string)
+
+def _follows_return(view, offset):
+    # Strip the padding in front of the offset
+    stripped = True
+    while stripped and offset > 0:
+        stripped = False
+        for padding in _padding:
+            start = offset - len(padding)
+            if start >= 0 and view[start:offset] == padding:
+                offset = start
+                stripped = True
+                break
+
+    if offset >= 1 and view[offset-1] == 0xC3:
+        return True
+
+    # ret imm16
+    return offset >= 3 and view[offset-3] == 0xC2
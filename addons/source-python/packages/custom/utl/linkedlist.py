@@ -14,6 +14,11 @@ from memory.helpers import Type
 #   Paths
 from paths import CUSTOM_DATA_PATH
 
+# Memory Tools Imports
+#   Regions
+from memorytools.regions import check_readable
+from memorytools.regions import region_index
+
 # Utl Imports
 #   Manager
 from utl.manager import type_manager
@@ -44,6 +49,10 @@ class UtlLinkedList(_UtlLinkedList, metaclass=type_manager):
     _is_native = None
     _type_size = None
 
+    # Whether the memory is validated while iterating, None for the global
+    # region_index.guard
+    _guard = None
+
     INVALID_INDEX = -1
 
     def __new__ (cls, *args, **kwargs):
@@ -89,10 +98,16 @@ class UtlLinkedList(_UtlLinkedList, metaclass=type_manager):
     def __iter__(self):
         iter = self.head
         base = self.base
+        guard = self._guard
+        if guard is None:
+            guard = region_index.guard
+
         while True:
             if iter == self.INVALID_INDEX:
                 break
 
+            if guard:
+                check_readable(base, self._type_size + 0x04, True)
             yield self.convert(base)
 
             iter = base.get_short(self._type_size + 0x02)
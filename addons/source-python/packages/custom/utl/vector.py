@@ -14,6 +14,11 @@ from memory.helpers import Type
 #   Paths
 from paths import CUSTOM_DATA_PATH
 
+# Memory Tools Imports
+#   Regions
+from memorytools.regions import check_readable
+from memorytools.regions import region_index
+
 # Utl Imports
 #   Manager
 from utl.manager import type_manager
@@ -44,6 +49,10 @@ class UtlVector(_UtlVector, metaclass=type_manager):
     _is_native = None
     _type_size = None
 
+    # Whether the memory is validated while iterating, None for the global
+    # region_index.guard
+    _guard = None
+
     def __new__ (cls, *args, **kwargs):
         if cls._is_native is None or cls._type_size is None:
             if isinstance(cls._type, str):
@@ -86,6 +95,10 @@ class UtlVector(_UtlVector, metaclass=type_manager):
 
     def __iter__(self):
         base = self.base
+        guard = self._guard
+        if guard or (guard is None and region_index.guard):
+            check_readable(base, self.size * self._type_size, True)
+
         for i in range(self.size):
             yield self.convert(base)
             base += self._type_size
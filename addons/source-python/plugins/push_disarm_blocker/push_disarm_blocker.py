@@ -18,5 +18,5 @@ from memorytools.manager import create_patchers_from_file
 # >> PATCHERS
 # =============================================================================
 patchers = create_patchers_from_file(PLUGIN_DATA_PATH / "push_disarm_blocker" / "patcher.ini")
-patchers.patch()
+patchers.apply()
 
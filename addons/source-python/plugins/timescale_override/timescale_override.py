@@ -31,5 +31,5 @@ host_timescale.flags &= ~ConVarFlags.CHEAT
 # =============================================================================
 if PLATFORM == "windows":
     patchers = create_patchers_from_file(PLUGIN_DATA_PATH / "timescale_override" / "patcher.ini")
-    patchers.patch()
+    patchers.apply()
 
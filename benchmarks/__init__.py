@@ -0,0 +1,51 @@
+# ../benchmarks/__init__.py
+
+"""Offline benchmarks of the memorytools hot paths.
+
+The benchmarks run on plain CPython. Source.Python's ``core``, ``memory``
+and ``paths`` modules are replaced by the stand-ins in ``standin``, which
+are backed by ctypes allocated memory. Only configobj is required.
+
+Usage, from the root of the repository::
+
+    python -m benchmarks -o before.json
+    python -m benchmarks -o after.json --compare before.json
+"""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Os
+import os
+#   Sys
+import sys
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ("PACKAGES_PATH",
+           "STANDIN_PATH",
+           "setup_paths",
+           )
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STANDIN_PATH = os.path.join(_root, "benchmarks", "standin")
+PACKAGES_PATH = os.path.join(
+    _root, "addons", "source-python", "packages", "custom")
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def setup_paths():
+    """Make the stand-ins and the custom packages importable."""
+    for path in (PACKAGES_PATH, STANDIN_PATH):
+        if path not in sys.path:
+            sys.path.insert(0, path)
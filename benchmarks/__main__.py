@@ -0,0 +1,74 @@
+# ../benchmarks/__main__.py
+
+"""Runs the benchmarks from the command line."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Argparse
+from argparse import ArgumentParser
+#   Sys
+import sys
+
+# Benchmarks Imports
+from benchmarks import setup_paths
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def main(argv=None):
+    parser = ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the memorytools hot paths.")
+    parser.add_argument(
+        "-o", "--output", default="benchmark_results.json",
+        help="the JSON file to store the results in")
+    parser.add_argument(
+        "-k", "--filter", default=None,
+        help="only run the benchmarks matching the shell-style pattern")
+    parser.add_argument(
+        "-s", "--scale", type=float, default=1.0,
+        help="the factor applied to the number of calls")
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5,
+        help="the number of measurements of every benchmark")
+    parser.add_argument(
+        "-c", "--compare", default=None,
+        help="a JSON file of a previous run to compare with")
+    parser.add_argument(
+        "--no-numpy", action="store_true",
+        help="benchmark the fallbacks used without NumPy")
+    args = parser.parse_args(argv)
+
+    if args.no_numpy:
+        # Makes every "import numpy" raise ImportError
+        sys.modules["numpy"] = None
+
+    setup_paths()
+
+    from benchmarks.runner import compare_results
+    from benchmarks.runner import format_time
+    from benchmarks.runner import load_results
+    from benchmarks.runner import run_benchmarks
+    from benchmarks.runner import save_results
+
+    def print_result(name, result):
+        print("{0:<40} {1:>12} ({2} calls)".format(
+            name, format_time(result["best"]), result["number"]))
+
+    results = run_benchmarks(
+        args.filter, args.scale, args.repeat, print_result)
+    save_results(args.output, results)
+
+    if args.compare is not None:
+        print()
+        print("\n".join(compare_results(load_results(args.compare), results)))
+
+
+# =============================================================================
+# >> MAIN
+# =============================================================================
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# ../benchmarks/bench_calls.py
+
+"""Benchmarks of the call overhead of the Function and ctypes paths."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Ctypes
+import ctypes
+
+# Source.Python Imports
+#   Memory
+from memory import alloc
+from memory import Convention
+from memory import DataType
+from memory import make_object
+from memory import Pointer
+from memory.manager import CustomType
+from memory.manager import manager
+
+# Memory Tools Imports
+#   Ctypes
+from memorytools.ctypes import Ctypes_THISCALL
+#   Manager
+# Adds the (ctypes_)function_pointer methods to TypeManager
+import memorytools.manager
+
+# Benchmarks Imports
+#   Runner
+from benchmarks.runner import benchmark
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+_libc = ctypes.CDLL(None)
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def get_c_function(name):
+    """Return a pointer to a function of the C runtime."""
+    return Pointer(ctypes.cast(getattr(_libc, name), ctypes.c_void_p).value)
+
+def create_pipe_benchmark(backend):
+    method = getattr(manager, backend + "pipe_function_pointer")
+    function = method(
+        get_c_function("abs"), (DataType.INT,), DataType.INT,
+        Convention.CDECL)
+    return lambda: function(-1)
+
+def create_member_benchmark(backend):
+    method = getattr(manager, backend + "function_pointer")
+    cls = manager.create_type("_MemberBenchmark", {
+        "strlen": method(
+            get_c_function("strlen"), (), DataType.UINT, Convention.CDECL),
+    }, (CustomType,))
+
+    memory = alloc(16)
+    ctypes.memmove(memory.address, b"benchmark\0", 10)
+    obj = make_object(cls, memory)
+    obj._buffer = memory
+    return lambda: obj.strlen()
+
+@benchmark("calls.pipe_function", number=100000)
+def pipe_function_benchmark():
+    return create_pipe_benchmark("")
+
+@benchmark("calls.pipe_ctypes", number=100000)
+def pipe_ctypes_benchmark():
+    return create_pipe_benchmark("ctypes_")
+
+@benchmark("calls.member_function", number=100000)
+def member_function_benchmark():
+    return create_member_benchmark("")
+
+@benchmark("calls.member_ctypes", number=100000)
+def member_ctypes_benchmark():
+    return create_member_benchmark("ctypes_")
+
+@benchmark("calls.trampoline", number=1000)
+def trampoline_benchmark():
+    # The stub is only built, never called, so any 32-bit address will do
+    pointer = Pointer(0x10000000)
+    argtypes = (ctypes.c_void_p, ctypes.c_int)
+    return lambda: Ctypes_THISCALL(pointer, argtypes, ctypes.c_int)
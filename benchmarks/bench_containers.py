@@ -0,0 +1,85 @@
+# ../benchmarks/bench_containers.py
+
+"""Benchmarks of the iteration over the utl containers."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Collections
+from collections import deque
+
+# Source.Python Imports
+#   Memory
+from memory import alloc
+from memory import make_object
+from memory.helpers import Type
+
+# Utl Imports
+#   LinkedList
+from utl.linkedlist import UtlLinkedList
+#   Vector
+from utl.vector import UtlVector
+
+# Benchmarks Imports
+#   Runner
+from benchmarks.runner import benchmark
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+ELEMENT_COUNT = 1000
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class IntVector(UtlVector):
+    _type = Type.INT
+
+
+class IntLinkedList(UtlLinkedList):
+    _type = Type.INT
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def consume(iterable):
+    deque(iterable, maxlen=0)
+
+@benchmark("containers.vector", number=100)
+def vector_benchmark():
+    elements = alloc(ELEMENT_COUNT * 4)
+    for index in range(ELEMENT_COUNT):
+        elements.set_int(index, index * 4)
+
+    memory = alloc(0x20)
+    memory.set_pointer(elements, 0x00)
+    memory.set_int(ELEMENT_COUNT, 0x0C)
+
+    vector = make_object(IntVector, memory)
+    vector._buffers = (memory, elements)
+    return lambda: consume(vector)
+
+@benchmark("containers.linkedlist", number=100)
+def linkedlist_benchmark():
+    # Every element is followed by the previous and the next index
+    stride = 4 + 4
+    elements = alloc(ELEMENT_COUNT * stride)
+    for index in range(ELEMENT_COUNT):
+        elements.set_int(index, index * stride)
+        elements.set_short(index - 1, index * stride + 4)
+        elements.set_short(
+            index + 1 if index + 1 < ELEMENT_COUNT else -1,
+            index * stride + 6)
+
+    memory = alloc(0x20)
+    memory.set_pointer(elements, 0x00)
+    memory.set_ushort(0, 0x0C)
+    memory.set_ushort(ELEMENT_COUNT, 0x12)
+
+    linked_list = make_object(IntLinkedList, memory)
+    linked_list._buffers = (memory, elements)
+    return lambda: consume(linked_list)
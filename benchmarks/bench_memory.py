@@ -0,0 +1,73 @@
+# ../benchmarks/bench_memory.py
+
+"""Benchmarks of the memory copies and views."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Source.Python Imports
+#   Memory
+from memory import alloc
+
+# Memory Tools Imports
+#   Memory Tools
+from memorytools import get_bytes
+from memorytools import get_relative_pointer_from_pointer
+from memorytools import get_view
+from memorytools import read_into
+#   Regions
+from memorytools.regions import region_index
+
+# Benchmarks Imports
+#   Runner
+from benchmarks.runner import benchmark
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+SMALL_SIZE = 64
+LARGE_SIZE = 1 << 16
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def _register(name, size, number):
+    @benchmark("memory.get_bytes.{0}".format(name), number=number)
+    def get_bytes_benchmark():
+        memory = alloc(size)
+        return lambda: get_bytes(memory, size)
+
+    @benchmark("memory.get_view.{0}".format(name), number=number)
+    def get_view_benchmark():
+        memory = alloc(size)
+        return lambda: get_view(memory, size)
+
+    @benchmark("memory.read_into.{0}".format(name), number=number)
+    def read_into_benchmark():
+        memory = alloc(size)
+        buffer = bytearray(size)
+        return lambda: read_into(memory, buffer)
+
+_register("small", SMALL_SIZE, 100000)
+_register("large", LARGE_SIZE, 10000)
+
+@benchmark("memory.get_relative_pointer", number=100000)
+def get_relative_pointer_benchmark():
+    memory = alloc(16)
+    memory.set_int(-5, 1)
+    return lambda: get_relative_pointer_from_pointer(memory, 1)
+
+@benchmark("memory.is_readable", number=100000)
+def is_readable_benchmark():
+    memory = alloc(SMALL_SIZE)
+    region_index.refresh()
+    return lambda: region_index.is_readable(memory, SMALL_SIZE)
+
+@benchmark("memory.get_bytes.guarded", number=100000)
+def get_bytes_guarded_benchmark():
+    memory = alloc(SMALL_SIZE)
+    region_index.refresh()
+
+    return lambda: get_bytes(memory, SMALL_SIZE, guard=True)
@@ -0,0 +1,79 @@
+# ../benchmarks/bench_patcher.py
+
+"""Benchmarks of the patch and reset throughput."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Ctypes
+from ctypes import memset
+
+# Source.Python Imports
+#   Memory
+from memory import alloc
+
+# Memory Tools Imports
+#   Memory Tools
+from memorytools import get_bytes
+#   Patcher
+from memorytools.patcher import Patcher
+from memorytools.patcher import Patchers
+
+# Benchmarks Imports
+#   Runner
+from benchmarks.runner import benchmark
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+PATCHER_COUNT = 64
+PATCHER_SIZE = 8
+PATCHER_STRIDE = 32
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def create_patchers(count=PATCHER_COUNT, verify=False):
+    """Return patchers of the same size spread over allocated memory."""
+    memory = alloc(count * PATCHER_STRIDE)
+    memset(memory.address, 0xCC, count * PATCHER_STRIDE)
+
+    patchers = Patchers()
+    for index in range(count):
+        address = memory.address + index * PATCHER_STRIDE
+        patchers["patcher_{0}".format(index)] = Patcher(
+            address, PATCHER_SIZE,
+            base_op_codes=get_bytes(address, PATCHER_SIZE) if verify else None)
+
+    # Keep the memory alive as long as the patchers
+    patchers._memory = memory
+    return patchers
+
+@benchmark("patcher.patch_reset", number=200)
+def patch_reset_benchmark():
+    patchers = create_patchers()
+
+    def statement():
+        patchers.patch()
+        patchers.reset()
+
+    return statement
+
+@benchmark("patcher.apply_reset", number=200)
+def apply_reset_benchmark():
+    patchers = create_patchers(verify=True)
+
+    def statement():
+        patchers.apply()
+        patchers.reset()
+
+    return statement
+
+@benchmark("patcher.find", number=10000)
+def find_benchmark():
+    patchers = create_patchers(1024)
+    address = patchers["patcher_512"].address + 1
+    return lambda: Patcher.find(address)
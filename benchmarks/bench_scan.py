@@ -0,0 +1,90 @@
+# ../benchmarks/bench_scan.py
+
+"""Benchmarks of the signature scanning and resolution."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Ctypes
+from ctypes import memmove
+#   Random
+from random import Random
+
+# Source.Python Imports
+#   Memory
+from memory import alloc
+from memory import BinaryFile
+
+# Memory Tools Imports
+#   Memory Tools
+from memorytools import get_view
+#   Resolver
+from memorytools.resolver import find_signatures
+#   Scan
+from memorytools.scan import Pattern
+from memorytools.scan import scan_buffer
+
+# Benchmarks Imports
+#   Runner
+from benchmarks.runner import benchmark
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+IMAGE_SIZE = 4 << 20
+SIGNATURE_COUNT = 32
+SIGNATURE_LENGTH = 24
+
+_image = None
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def get_image():
+    """Return a synthetic binary and the signatures hidden in it.
+
+    The image is random, so the anchors rarely match by chance, and the
+    signatures are placed in its second half with a few wildcards each.
+    """
+    global _image
+    if _image is not None:
+        return _image
+
+    random = Random(0)
+    data = random.getrandbits(IMAGE_SIZE * 8).to_bytes(IMAGE_SIZE, "little")
+
+    memory = alloc(IMAGE_SIZE, False)
+    memmove(memory.address, data, IMAGE_SIZE)
+
+    signatures = list()
+    step = IMAGE_SIZE // 2 // SIGNATURE_COUNT
+    for index in range(SIGNATURE_COUNT):
+        start = IMAGE_SIZE // 2 + index * step
+        signature = bytearray(data[start:start+SIGNATURE_LENGTH])
+        for position in random.sample(range(1, SIGNATURE_LENGTH), 4):
+            signature[position] = 0x2A
+
+        signatures.append(bytes(signature))
+
+    _image = (BinaryFile(memory, IMAGE_SIZE), signatures)
+    return _image
+
+@benchmark("scan.scan_buffer", number=10)
+def scan_buffer_benchmark():
+    binary, signatures = get_image()
+    view = get_view(binary.address, binary.size)
+    pattern = Pattern(signatures[-1])
+    return lambda: scan_buffer(view, pattern, 1)
+
+@benchmark("scan.find_signatures", number=5)
+def find_signatures_benchmark():
+    binary, signatures = get_image()
+    return lambda: find_signatures(binary, signatures)
+
+@benchmark("scan.pattern", number=10000)
+def pattern_benchmark():
+    signature = get_image()[1][0]
+    return lambda: Pattern(signature)
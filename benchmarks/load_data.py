@@ -0,0 +1,228 @@
+# ../benchmarks/load_data.py
+
+"""Times and profiles the loading of the data files without the game.
+
+The binaries are mapped from ELF files by the memory stand-in. Either point
+``--binaries`` at the bin directory of a game, or write synthetic binaries
+with :mod:`benchmarks.synthetic` first::
+
+    python -m benchmarks.synthetic -o /tmp/binaries
+    python -m benchmarks.load_data --binaries /tmp/binaries -o load.json
+    python -m benchmarks.load_data --binaries /tmp/binaries --profile 30
+"""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Argparse
+from argparse import ArgumentParser
+#   Collections
+from collections import namedtuple
+#   Cprofile
+import cProfile
+#   Fnmatch
+from fnmatch import fnmatch
+#   Os
+import os
+#   Pstats
+import pstats
+#   Time
+from time import perf_counter
+
+# Benchmarks Imports
+from benchmarks import setup_paths
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ("Load",
+           "LOADS",
+           "load",
+           "load_all",
+           "time_loads",
+           )
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+Load = namedtuple("Load", ("name", "loader", "data_path", "path", "type_name"))
+Load.__doc__ = """A data file loaded by memorytools in the packages or plugins.
+
+``loader`` is one of type, functions, ctypes or patchers, ``data_path``
+one of custom or plugins and ``path`` the path relative to it, as it is
+passed by the package.
+"""
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+LOADS = (
+    Load("csbots.CCSBot", "type", "custom",
+         "csbots/entities/CCSBot.ini", "CCSBot"),
+    Load("csbots.functions", "functions", "custom",
+         "csbots/functions/functions.ini", None),
+    Load("botstools.CCSBot", "type", "custom",
+         "botstools/entities/CCSBot.ini", "CCSBot"),
+    Load("downloadtools.function", "ctypes", "custom",
+         "downloadtools/function.ini", None),
+    Load("dt_warning_blocker", "patchers", "plugins",
+         "dt_warning_blocker/patcher.ini", None),
+    Load("movement_unlocker", "patchers", "plugins",
+         "movement_unlocker/patcher.ini", None),
+    Load("punch_disarm_blocker", "patchers", "plugins",
+         "punch_disarm_blocker/patcher.ini", None),
+    Load("push_disarm_blocker", "patchers", "plugins",
+         "push_disarm_blocker/patcher.ini", None),
+)
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def load(entry, lazy=False):
+    """Load the data file of the entry and return the created object.
+
+    Types and pipes are created with their own TypeManager, so an entry can
+    be loaded more than once.
+    """
+    from memory.manager import TypeManager
+    import memorytools.manager as manager
+    from paths import CUSTOM_DATA_PATH
+    from paths import PLUGIN_DATA_PATH
+
+    data_path = CUSTOM_DATA_PATH if entry.data_path == "custom" else (
+        PLUGIN_DATA_PATH)
+    path = data_path.joinpath(*entry.path.split("/"))
+
+    if entry.loader == "type":
+        return manager.create_type_from_file(
+            entry.type_name, path, manager=TypeManager(), lazy=lazy)
+
+    if entry.loader == "functions":
+        return manager.create_function_pipe_from_file(path, TypeManager())
+
+    if entry.loader == "ctypes":
+        return manager.create_ctype_pipe_from_file(path, auto_dealloc=False)
+
+    if entry.loader == "patchers":
+        return manager.create_patchers_from_file(path)
+
+    raise ValueError("Unknown loader: {0}".format(entry.loader))
+
+def load_all(entries=LOADS, lazy=False):
+    """Load the data files of all entries."""
+    for entry in entries:
+        load(entry, lazy)
+
+def time_loads(entries=LOADS, repeat_count=5, lazy=False, callback=None):
+    """Return the load times of the entries in the format of the runner.
+
+    Every instance created by a load, e.g. a patcher, is unloaded before
+    the next measurement.
+    """
+    from core import unload_instances
+
+    results = dict()
+    for entry in entries:
+        times = list()
+        for i in range(repeat_count):
+            start = perf_counter()
+            try:
+                load(entry, lazy)
+                times.append(perf_counter() - start)
+            finally:
+                unload_instances()
+
+        result = results["load." + entry.name] = {
+            "number": 1,
+            "best": min(times),
+            "mean": sum(times) / len(times),
+            "times": times,
+        }
+
+        if callback is not None:
+            callback("load." + entry.name, result)
+
+    return results
+
+def main(argv=None):
+    parser = ArgumentParser(
+        prog="python -m benchmarks.load_data",
+        description="Time and profile the loading of the data files.")
+    parser.add_argument(
+        "-b", "--binaries", default=None,
+        help="the directory of the ELF binaries")
+    parser.add_argument(
+        "-o", "--output", default=None,
+        help="the JSON file to store the load times in")
+    parser.add_argument(
+        "-k", "--filter", default=None,
+        help="only load the entries matching the shell-style pattern")
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5,
+        help="the number of loads of every entry")
+    parser.add_argument(
+        "-c", "--compare", default=None,
+        help="a JSON file of a previous run to compare with")
+    parser.add_argument(
+        "--lazy", action="store_true",
+        help="create the types with lazy attributes")
+    parser.add_argument(
+        "--cache", action="store_true",
+        help="use the address cache, instead of scanning every time")
+    parser.add_argument(
+        "--profile", type=int, default=0, metavar="N",
+        help="profile loading all entries once and print the N most "
+             "expensive functions")
+    args = parser.parse_args(argv)
+
+    if args.binaries is not None:
+        os.environ["SP_BINARY_PATH"] = os.path.abspath(args.binaries)
+
+    setup_paths()
+
+    from benchmarks.runner import compare_results
+    from benchmarks.runner import format_time
+    from benchmarks.runner import load_results
+    from benchmarks.runner import save_results
+    from memorytools.cache import address_cache
+    # Keep the import out of the measurements
+    import memorytools.manager
+
+    address_cache.enabled = args.cache
+
+    entries = [
+        entry for entry in LOADS
+        if args.filter is None or fnmatch(entry.name, args.filter)]
+
+    if args.profile:
+        profile = cProfile.Profile()
+        profile.runcall(load_all, entries, args.lazy)
+        pstats.Stats(profile).sort_stats("cumulative").print_stats(
+            args.profile)
+        return
+
+    def print_result(name, result):
+        print("{0:<40} {1:>12}".format(name, format_time(result["best"])))
+
+    results = time_loads(entries, args.repeat, args.lazy, print_result)
+    print("{0:<40} {1:>12}".format("total", format_time(
+        sum(result["best"] for result in results.values()))))
+
+    if args.output is not None:
+        save_results(args.output, results)
+
+    if args.compare is not None:
+        print()
+        print("\n".join(compare_results(load_results(args.compare), results)))
+
+
+# =============================================================================
+# >> MAIN
+# =============================================================================
+if __name__ == "__main__":
+    main()
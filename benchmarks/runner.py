@@ -0,0 +1,210 @@
+# ../benchmarks/runner.py
+
+"""Provides the registration, timing and storage of the benchmarks."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Collections
+from collections import namedtuple
+#   Datetime
+from datetime import datetime
+#   Fnmatch
+from fnmatch import fnmatch
+#   Importlib
+from importlib import import_module
+#   Json
+import json
+#   Os
+import os
+#   Platform
+import platform
+#   Subprocess
+import subprocess
+#   Sys
+import sys
+#   Timeit
+from timeit import repeat
+
+# Source.Python Imports
+#   Core
+from core import unload_instances
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ("Benchmark",
+           "benchmark",
+           "compare_results",
+           "format_time",
+           "get_metadata",
+           "load_benchmarks",
+           "load_results",
+           "run_benchmarks",
+           "save_results",
+           )
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# The modules which register the benchmarks
+_modules = (
+    "benchmarks.bench_scan",
+    "benchmarks.bench_patcher",
+    "benchmarks.bench_calls",
+    "benchmarks.bench_memory",
+    "benchmarks.bench_containers",
+)
+
+_benchmarks = list()
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+Benchmark = namedtuple("Benchmark", ("name", "setup", "number"))
+Benchmark.__doc__ = """A registered benchmark.
+
+``setup`` prepares the memory and returns the statement to time, which is
+called ``number`` times per measurement.
+"""
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def benchmark(name, number=1000):
+    """Register the decorated setup function as a benchmark.
+
+    :param str name:
+        The dotted name of the benchmark.
+    :param int number:
+        The number of calls of the statement per measurement.
+    """
+    def decorator(setup):
+        _benchmarks.append(Benchmark(name, setup, number))
+        return setup
+
+    return decorator
+
+def load_benchmarks():
+    """Import the benchmark modules and return the registered benchmarks."""
+    for module in _modules:
+        import_module(module)
+
+    return list(_benchmarks)
+
+def run_benchmarks(
+        pattern=None, scale=1.0, repeat_count=5, callback=None):
+    """Run the benchmarks and return their results.
+
+    Every instance created by a benchmark is unloaded after it, so the
+    benchmarks do not affect each other.
+
+    :param str pattern:
+        A shell-style pattern the names have to match.
+    :param float scale:
+        The factor applied to the number of calls of every benchmark.
+    :param int repeat_count:
+        The number of measurements of every benchmark.
+    :param callable callback:
+        Called with the name and the result of every finished benchmark.
+    :return:
+        A dictionary with the name as key and a dictionary with the number
+        of calls and the seconds per call as value.
+    :rtype: dict
+    """
+    results = dict()
+    for bench in load_benchmarks():
+        if pattern is not None and not fnmatch(bench.name, pattern):
+            continue
+
+        number = max(1, int(bench.number * scale))
+        try:
+            times = repeat(
+                bench.setup(), number=number, repeat=repeat_count)
+        finally:
+            unload_instances()
+
+        times = [time / number for time in times]
+        result = results[bench.name] = {
+            "number": number,
+            "best": min(times),
+            "mean": sum(times) / len(times),
+            "times": times,
+        }
+
+        if callback is not None:
+            callback(bench.name, result)
+
+    return results
+
+def get_metadata():
+    """Return the description of the environment of a run."""
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+
+    try:
+        revision = subprocess.check_output(
+            ("git", "rev-parse", "HEAD"),
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+
+    return {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "revision": revision,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "numpy": None if numpy is None else numpy.__version__,
+    }
+
+def save_results(path, results, metadata=None):
+    """Store the results and the environment of a run as JSON."""
+    with open(path, "w") as file:
+        json.dump({
+            "metadata": get_metadata() if metadata is None else metadata,
+            "results": results,
+        }, file, indent=2, sort_keys=True)
+
+def load_results(path):
+    """Return the results of a run stored by :func:`save_results`."""
+    with open(path) as file:
+        return json.load(file)["results"]
+
+def compare_results(old, new):
+    """Return the best times of two runs and their ratio as text lines.
+
+    A ratio above 1 means the new run is faster. Benchmarks which are
+    missing from the new run are skipped, so filtered runs can be compared.
+    """
+    lines = list()
+    for name in sorted(new):
+        if name not in old:
+            lines.append("{0:<40} {1:>12} {2:>12}".format(
+                name, "-", format_time(new[name]["best"])))
+            continue
+
+        old_time = old[name]["best"]
+        new_time = new[name]["best"]
+        lines.append("{0:<40} {1:>12} {2:>12} {3:>8.2f}x".format(
+            name, format_time(old_time), format_time(new_time),
+            old_time / new_time))
+
+    return lines
+
+def format_time(seconds):
+    """Return the seconds with a readable unit."""
+    for unit, factor in (("s", 1), ("ms", 1e3), ("us", 1e6)):
+        if seconds * factor >= 1:
+            return "{0:.3f} {1}".format(seconds * factor, unit)
+
+    return "{0:.1f} ns".format(seconds * 1e9)
@@ -0,0 +1,61 @@
+# ../benchmarks/standin/core/__init__.py
+
+"""Stand-in for Source.Python's core module."""
+
+import os
+import sys
+from weakref import ref
+
+from configobj import ConfigObj
+from path import Path
+
+PLATFORM = "linux"
+SOURCE_ENGINE = os.environ.get("SP_SOURCE_ENGINE", "csgo")
+GAME_NAME = os.environ.get("SP_GAME_NAME", "csgo")
+
+
+class GameConfigObj(ConfigObj):
+    def __init__(self, infile, *args, **kwargs):
+        super().__init__(infile, *args, **kwargs)
+        if not isinstance(infile, Path):
+            return
+        for game_file in (
+                infile.parent / SOURCE_ENGINE / infile.name,
+                infile.parent / SOURCE_ENGINE / GAME_NAME / infile.name):
+            if game_file.isfile():
+                self.merge(ConfigObj(game_file, *args, **kwargs))
+
+
+class AutoUnload(object):
+    _instances = []
+
+    def __new__(cls, *args, **kwargs):
+        self = super().__new__(cls)
+        AutoUnload._instances.append(self)
+        return self
+
+    def _unload_instance(self):
+        pass
+
+
+class WeakAutoUnload(AutoUnload):
+    def __new__(cls, *args, **kwargs):
+        self = object.__new__(cls)
+        AutoUnload._instances.append(ref(self))
+        return self
+
+
+def unload_instances():
+    instances = list(AutoUnload._instances)
+    AutoUnload._instances.clear()
+    for instance in reversed(instances):
+        if isinstance(instance, ref):
+            instance = instance()
+            if instance is None:
+                continue
+
+        instance._unload_instance()
+
+
+def echo_console(text):
+    print(text)
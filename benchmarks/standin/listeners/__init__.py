@@ -0,0 +1,26 @@
+# ../benchmarks/standin/listeners/__init__.py
+
+"""Stand-in for Source.Python's listeners module."""
+
+
+class ListenerManager(object):
+    def __init__(self):
+        self.listeners = []
+
+    def register_listener(self, callback):
+        if callback not in self.listeners:
+            self.listeners.append(callback)
+
+    def unregister_listener(self, callback):
+        self.listeners.remove(callback)
+
+    def notify(self, *args, **kwargs):
+        for callback in list(self.listeners):
+            callback(*args, **kwargs)
+
+    def __contains__(self, callback):
+        return callback in self.listeners
+
+
+on_plugin_loaded_manager = ListenerManager()
+on_plugin_unloaded_manager = ListenerManager()
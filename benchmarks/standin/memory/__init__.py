@@ -0,0 +1,327 @@
+# ../benchmarks/standin/memory/__init__.py
+
+"""Stand-in for Source.Python's memory module backed by ctypes."""
+
+import ctypes
+import os
+import re
+
+
+# =============================================================================
+# >> ENUMERATIONS
+# =============================================================================
+class _Enum(int):
+    """Emulates a Boost.Python enumeration value."""
+
+    def __new__(cls, value, name):
+        self = int.__new__(cls, value)
+        self.name = name
+        return self
+
+    def __repr__(self):
+        return "{0}.{1}".format(type(self).__name__, self.name)
+
+    __str__ = __repr__
+
+
+def _make_enum(name, members):
+    cls = type(name, (_Enum,), {})
+    cls.values = dict()
+    cls.names = dict()
+    for value, member in enumerate(members):
+        instance = cls(value, member)
+        setattr(cls, member, instance)
+        cls.values[value] = instance
+        cls.names[member] = instance
+    return cls
+
+
+DataType = _make_enum("DataType", (
+    "VOID", "BOOL", "CHAR", "UCHAR", "SHORT", "USHORT", "INT", "UINT",
+    "LONG", "ULONG", "LONG_LONG", "ULONG_LONG", "FLOAT", "DOUBLE",
+    "POINTER", "STRING"))
+
+Convention = _make_enum("Convention", (
+    "CUSTOM", "CDECL", "THISCALL", "STDCALL", "FASTCALL"))
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+_native_types = {
+    "bool": ctypes.c_bool,
+    "char": ctypes.c_byte,
+    "uchar": ctypes.c_ubyte,
+    "short": ctypes.c_short,
+    "ushort": ctypes.c_ushort,
+    "int": ctypes.c_int,
+    "uint": ctypes.c_uint,
+    "long": ctypes.c_long,
+    "ulong": ctypes.c_ulong,
+    "long_long": ctypes.c_longlong,
+    "ulong_long": ctypes.c_ulonglong,
+    "float": ctypes.c_float,
+    "double": ctypes.c_double,
+    "pointer": ctypes.c_void_p,
+}
+
+TYPE_SIZES = {name.upper(): ctypes.sizeof(ctype)
+              for name, ctype in _native_types.items()}
+TYPE_SIZES["STRING_POINTER"] = ctypes.sizeof(ctypes.c_void_p)
+
+_ctype_data_type = {
+    DataType.VOID: None,
+    DataType.BOOL: ctypes.c_bool,
+    DataType.CHAR: ctypes.c_byte,
+    DataType.UCHAR: ctypes.c_ubyte,
+    DataType.SHORT: ctypes.c_short,
+    DataType.USHORT: ctypes.c_ushort,
+    DataType.INT: ctypes.c_int,
+    DataType.UINT: ctypes.c_uint,
+    DataType.LONG: ctypes.c_long,
+    DataType.ULONG: ctypes.c_ulong,
+    DataType.LONG_LONG: ctypes.c_longlong,
+    DataType.ULONG_LONG: ctypes.c_ulonglong,
+    DataType.FLOAT: ctypes.c_float,
+    DataType.DOUBLE: ctypes.c_double,
+    DataType.POINTER: ctypes.c_void_p,
+    DataType.STRING: ctypes.c_char_p,
+}
+
+# Address -> buffer of memory allocated by alloc()
+_allocations = dict()
+
+# Name -> BinaryFile
+_binaries = dict()
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class Pointer(object):
+    """A raw address with typed accessors."""
+
+    def __init__(self, address=0, auto_dealloc=False):
+        self.address = int(address)
+        self.auto_dealloc = auto_dealloc
+
+    def __int__(self):
+        return self.address
+
+    __index__ = __int__
+
+    def __bool__(self):
+        return self.address != 0
+
+    def __eq__(self, other):
+        try:
+            return self.address == int(other)
+        except TypeError:
+            return NotImplemented
+
+    def __hash__(self):
+        return hash(self.address)
+
+    def __add__(self, other):
+        return Pointer(self.address + int(other))
+
+    def __sub__(self, other):
+        return Pointer(self.address - int(other))
+
+    __iadd__ = __add__
+    __isub__ = __sub__
+
+    def __repr__(self):
+        return "Pointer(0x{0:X})".format(self.address)
+
+    def is_valid(self):
+        return bool(self)
+
+    def get_pointer(self, offset=0):
+        return Pointer(self._get("pointer", offset) or 0)
+
+    def set_pointer(self, value, offset=0):
+        self._set("pointer", int(value), offset)
+
+    def get_string_array(self, offset=0):
+        return ctypes.string_at(self.address + offset).decode("utf-8")
+
+    def set_string_array(self, value, offset=0):
+        data = value.encode("utf-8") + b"\0"
+        ctypes.memmove(self.address + offset, data, len(data))
+
+    def _get(self, type_name, offset):
+        return _native_types[type_name].from_address(
+            self.address + offset).value
+
+    def _set(self, type_name, value, offset):
+        _native_types[type_name].from_address(
+            self.address + offset).value = value
+
+    def unprotect(self, size):
+        pass
+
+    def protect(self, size):
+        pass
+
+    def dealloc(self):
+        _allocations.pop(self.address, None)
+        self.address = 0
+
+    def make_function(self, convention, args, return_type):
+        return Function(self.address, convention, args, return_type)
+
+    def make_virtual_function(self, index, convention, args, return_type):
+        return self.get_pointer().get_pointer(
+            index * TYPE_SIZES["POINTER"]).make_function(
+                convention, args, return_type)
+
+
+def _make_accessors(type_name):
+    def getter(self, offset=0):
+        return self._get(type_name, offset)
+
+    def setter(self, value, offset=0):
+        self._set(type_name, value, offset)
+
+    setattr(Pointer, "get_" + type_name, getter)
+    setattr(Pointer, "set_" + type_name, setter)
+
+for _type_name in _native_types:
+    if _type_name != "pointer":
+        _make_accessors(_type_name)
+
+
+class Function(Pointer):
+    """A callable native function."""
+
+    def __init__(self, address, convention, arguments, return_type):
+        super().__init__(address)
+        self.convention = convention
+        self.arguments = tuple(arguments)
+        self.return_type = return_type
+        self.custom_convention = None
+        self.trampoline = Pointer(address)
+
+        if isinstance(convention, type):
+            self.custom_convention = convention()
+            self.convention = Convention.CUSTOM
+
+        restype = _ctype_data_type.get(return_type, ctypes.c_void_p)
+        argtypes = [_ctype_data_type[data_type] for data_type in arguments]
+        self._function = ctypes.CFUNCTYPE(restype, *argtypes)(address)
+
+    def __call__(self, *args):
+        args = [int(arg) if isinstance(arg, Pointer) else arg for arg in args]
+        result = self._function(*args)
+        if self.return_type == DataType.POINTER:
+            return Pointer(result or 0)
+        if self.return_type not in DataType.values:
+            return self.return_type(Pointer(result or 0))
+        return result
+
+    def is_hooked(self):
+        return False
+
+
+class CallingConvention(object):
+    """Base class of custom calling conventions."""
+
+    default_convention = Convention.CDECL
+
+    def __init__(self, arg_types=(), return_type=DataType.VOID, alignment=4):
+        self.argument_types = arg_types
+        self.return_type = return_type
+
+
+class BinaryFile(object):
+    """A module image that can be searched for identifiers."""
+
+    def __init__(self, address, size, symbols=None):
+        self.address = int(address)
+        self.size = size
+        self.symbols = dict() if symbols is None else symbols
+
+    def __getitem__(self, identifier):
+        return self.find_address(identifier)
+
+    def find_address(self, identifier):
+        if isinstance(identifier, str):
+            return self.find_symbol(identifier)
+
+        pattern = re.compile(b"".join(
+            b"." if byte == 0x2A else re.escape(bytes((byte,)))
+            for byte in identifier), re.DOTALL)
+        image = (ctypes.c_ubyte * self.size).from_address(self.address)
+        match = pattern.search(memoryview(image).cast("B"))
+        if match is None:
+            raise ValueError("Could not find address.")
+        return Pointer(self.address + match.start())
+
+    def find_symbol(self, symbol):
+        try:
+            return Pointer(self.address + self.symbols[symbol])
+        except KeyError:
+            raise ValueError("Could not find symbol: {0}".format(symbol))
+
+    def find_pointer(self, identifier, offset=0, level=0):
+        pointer = self.find_address(identifier) + offset
+        for i in range(level):
+            pointer = pointer.get_pointer()
+        return pointer
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def alloc(size, auto_dealloc=True):
+    buffer = ctypes.create_string_buffer(size)
+    address = ctypes.addressof(buffer)
+    _allocations[address] = buffer
+    return Pointer(address, auto_dealloc)
+
+def register_binary(name, binary):
+    """Register a binary, so find_binary() can return it."""
+    _binaries[name] = binary
+
+def find_binary(path, srv_check=True, check_extension=True):
+    """Return a registered binary or map the ELF file of the binary.
+
+    The file is searched in the directories of ``SP_BINARY_PATH`` and in
+    the bin directory of the game.
+    """
+    path = str(path)
+    binary = _binaries.get(path, None)
+    if binary is not None:
+        return binary
+
+    names = [path]
+    if check_extension and not path.endswith(".so"):
+        names = [name + ".so" for name in names]
+    if srv_check:
+        names.insert(0, names[0].replace(".so", "_srv.so"))
+
+    from paths import GAME_PATH
+    directories = [
+        directory for directory in os.environ.get(
+            "SP_BINARY_PATH", "").split(os.pathsep) if directory]
+    directories.append(os.path.join(GAME_PATH, "bin"))
+
+    for directory in directories:
+        for name in names:
+            file = os.path.join(directory, name)
+            if os.path.isfile(file):
+                from memory._elf import ElfBinaryFile
+                binary = _binaries[path] = ElfBinaryFile(file)
+                return binary
+
+    raise OSError("Unable to find {0}".format(path))
+
+def get_object_pointer(obj):
+    return obj._ptr()
+
+def make_object(cls, ptr):
+    return cls._obj(ptr)
+
+def get_size(cls):
+    return cls._size
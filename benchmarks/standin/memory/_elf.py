@@ -0,0 +1,128 @@
+# ../benchmarks/standin/memory/_elf.py
+
+"""ELF backed BinaryFile of the memory stand-in.
+
+The file is mapped copy-on-write as it is on the disk, so the mapping shows
+up in /proc/self/maps with the path of the file. Virtual addresses, e.g.
+the values of symbols and of stored pointers, are translated to that
+mapping with the PT_LOAD program headers.
+"""
+
+import ctypes
+import mmap
+import struct
+
+from memory import BinaryFile
+from memory import Pointer
+
+ELF_MAGIC = b"\x7fELF"
+
+PT_LOAD = 1
+SHT_SYMTAB = 2
+SHT_DYNSYM = 11
+SHN_UNDEF = 0
+
+# ELF class -> (Header, Program header, Section header, Symbol) formats
+_formats = {
+    1: ("<16sHHIIIIIHHHHHH", "<IIIIIIII", "<IIIIIIIIII", "<IIIBBH"),
+    2: ("<16sHHIQQQIHHHHHH", "<IIQQQQQQ", "<IIQQQQIIQQ", "<IBBHQQ"),
+}
+
+
+class ElfBinaryFile(BinaryFile):
+    """A binary mapped from an ELF shared object on the disk."""
+
+    def __init__(self, path):
+        self.path = str(path)
+        with open(self.path, "rb") as file:
+            self._mmap = mmap.mmap(
+                file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        data = self._mmap
+        if data[:4] != ELF_MAGIC:
+            raise ValueError("Not an ELF file: {0}".format(self.path))
+
+        elf_class = data[4]
+        if elf_class not in _formats or data[5] != 1:
+            raise ValueError(
+                "Unsupported ELF class or byte order: {0}".format(self.path))
+
+        self.pointer_size = 4 * elf_class
+        header, program_header, section_header, symbol = (
+            struct.Struct(format) for format in _formats[elf_class])
+
+        (_, _, self.machine, _, _, phoff, shoff, _, _, phentsize, phnum,
+            shentsize, shnum, _) = header.unpack_from(data)
+
+        # (vaddr, offset, filesz) of every loaded segment
+        self.segments = list()
+        for index in range(phnum):
+            fields = program_header.unpack_from(data, phoff + index * phentsize)
+            if elf_class == 1:
+                p_type, p_offset, p_vaddr, _, p_filesz = fields[:5]
+            else:
+                p_type, _, p_offset, p_vaddr, _, p_filesz = fields[:6]
+
+            if p_type == PT_LOAD:
+                self.segments.append((p_vaddr, p_offset, p_filesz))
+
+        sections = [
+            section_header.unpack_from(data, shoff + index * shentsize)
+            for index in range(shnum)]
+
+        symbols = dict()
+        for section in sections:
+            sh_type, sh_offset, sh_size, sh_link = (
+                section[1], section[4], section[5], section[6])
+            if sh_type not in (SHT_SYMTAB, SHT_DYNSYM):
+                continue
+
+            strtab_offset = sections[sh_link][4]
+            for offset in range(
+                    sh_offset, sh_offset + sh_size, symbol.size):
+                fields = symbol.unpack_from(data, offset)
+                if elf_class == 1:
+                    st_name, st_value, _, _, _, st_shndx = fields
+                else:
+                    st_name, _, _, st_shndx, st_value, _ = fields
+
+                if not st_name or st_shndx == SHN_UNDEF:
+                    continue
+
+                file_offset = self.get_file_offset(st_value)
+                if file_offset is None:
+                    continue
+
+                end = data.find(b"\0", strtab_offset + st_name)
+                name = data[strtab_offset + st_name:end].decode(
+                    "utf-8", "replace")
+                symbols.setdefault(name, file_offset)
+
+        self._buffer = (ctypes.c_ubyte * len(data)).from_buffer(data)
+        super().__init__(ctypes.addressof(self._buffer), len(data), symbols)
+
+    def __repr__(self):
+        return "ElfBinaryFile({0!r})".format(self.path)
+
+    def get_file_offset(self, vaddr):
+        """Return the file offset of the virtual address or None."""
+        for p_vaddr, p_offset, p_filesz in self.segments:
+            if p_vaddr <= vaddr < p_vaddr + p_filesz:
+                return vaddr - p_vaddr + p_offset
+        return None
+
+    def find_pointer(self, identifier, offset=0, level=0):
+        pointer = self.find_address(identifier) + offset
+        for i in range(level):
+            value = int.from_bytes(
+                ctypes.string_at(pointer.address, self.pointer_size),
+                "little")
+
+            # Follow pointers into the binary, keep the others as they are
+            file_offset = self.get_file_offset(value)
+            if file_offset is None:
+                pointer = Pointer(value)
+            else:
+                pointer = Pointer(self.address + file_offset)
+
+        return pointer
@@ -0,0 +1,117 @@
+# ../benchmarks/standin/memory/helpers.py
+
+"""Stand-in for Source.Python's memory.helpers module."""
+
+import binascii
+
+from core import PLATFORM
+from memory import Convention
+from memory import DataType
+from memory import Pointer
+
+NO_DEFAULT = object()
+
+
+class Type(object):
+    BOOL = "bool"
+    CHAR = "char"
+    UCHAR = "uchar"
+    SHORT = "short"
+    USHORT = "ushort"
+    INT = "int"
+    UINT = "uint"
+    LONG = "long"
+    ULONG = "ulong"
+    LONG_LONG = "long_long"
+    ULONG_LONG = "ulong_long"
+    FLOAT = "float"
+    DOUBLE = "double"
+    POINTER = "pointer"
+    STRING_POINTER = "string_pointer"
+    STRING_ARRAY = "string_array"
+
+    @staticmethod
+    def is_native(type_name):
+        return type_name in Type.__dict__.values()
+
+
+class Key(object):
+    BINARY = "binary"
+    SRV_CHECK = "srv_check"
+    IDENTIFIER = "identifier"
+    OFFSET = "offset"
+    LEVEL = "level"
+    SIZE = "size"
+    ARGS = "arguments"
+    RETURN_TYPE = "return_type"
+    CONVENTION = "convention"
+    DOC = "doc"
+    TYPE_NAME = "type"
+    LENGTH = "length"
+
+    @staticmethod
+    def as_bool(manager, value):
+        return value.lower() == "true"
+
+    @staticmethod
+    def as_int(manager, value):
+        return int(value, 0)
+
+    @staticmethod
+    def as_str(manager, value):
+        return value
+
+    @staticmethod
+    def as_identifier(manager, value):
+        try:
+            return binascii.unhexlify(value.replace(" ", ""))
+        except (binascii.Error, ValueError):
+            return value
+
+    @staticmethod
+    def as_args_tuple(manager, value):
+        if isinstance(value, str):
+            value = value.split(",")
+        return tuple(getattr(DataType, key.strip()) for key in value if key.strip())
+
+    @staticmethod
+    def as_return_type(manager, value):
+        return DataType.names.get(value.upper(), value)
+
+    @staticmethod
+    def as_attribute_type(manager, value):
+        return getattr(Type, value, value)
+
+    @staticmethod
+    def as_convention(manager, value):
+        try:
+            return getattr(Convention, value)
+        except AttributeError:
+            return manager.custom_conventions[value]
+
+
+def parse_data(manager, raw_data, keys):
+    for name, data in raw_data.items():
+        temp_data = []
+        for key, converter, default in keys:
+            value = data.get(key + "_" + PLATFORM, data.get(key, default))
+            if value is NO_DEFAULT:
+                raise KeyError(
+                    'Missing information for key "{0}".'.format(key))
+            temp_data.append(
+                value if value is default else converter(manager, value))
+        yield (name, temp_data)
+
+
+class MemberFunction(object):
+    """A function bound to a this pointer."""
+
+    def __init__(self, manager, return_type, func, this):
+        self._function = func
+        self._this = this
+
+    def __call__(self, *args):
+        return self._function(self._this._ptr(), *args)
+
+    def __getattr__(self, attr):
+        return getattr(self._function, attr)
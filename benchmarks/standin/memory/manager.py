@@ -0,0 +1,135 @@
+# ../benchmarks/standin/memory/manager.py
+
+"""Stand-in for Source.Python's memory.manager module."""
+
+from core import GameConfigObj
+from memory import Convention
+from memory import DataType
+from memory import Pointer
+from memory import TYPE_SIZES
+from memory import make_object
+from memory.helpers import Key
+from memory.helpers import MemberFunction
+from memory.helpers import Type
+
+
+class CustomType(object):
+    """Base class of types created by a TypeManager."""
+
+    _size = None
+
+    def __init__(self, ptr=None):
+        self._pointer = Pointer(ptr)
+
+    @classmethod
+    def _obj(cls, ptr):
+        self = cls.__new__(cls)
+        self._pointer = Pointer(ptr)
+        return self
+
+    def _ptr(self):
+        return self._pointer
+
+
+class TypeManager(dict):
+    """Creates types and attributes from data."""
+
+    def __init__(self):
+        super().__init__()
+        self.custom_conventions = dict()
+
+    def __call__(self, name, bases, cls_dict):
+        cls_dict["_manager"] = self
+        cls = type(name, bases, cls_dict)
+        self[name] = cls
+        return cls
+
+    def create_type(self, name, cls_dict, bases=(CustomType,)):
+        return self(name, bases, cls_dict)
+
+    def create_type_from_file(self, type_name, f, bases=(CustomType,)):
+        """Create a type from the size and the attributes of a data file."""
+        raw_data = GameConfigObj(f)
+        cls_dict = dict()
+
+        size = raw_data.get("size", None)
+        if size is not None:
+            cls_dict["_size"] = int(size, 0)
+
+        for method_name in ("instance_attribute", "pointer_attribute"):
+            for name, data in raw_data.get(method_name, {}).items():
+                cls_dict[name] = getattr(self, method_name)(
+                    Key.as_attribute_type(self, data["type"]),
+                    int(data.get("offset", "0"), 0),
+                    data.get("doc", None))
+
+        return self(type_name, bases, cls_dict)
+
+    def create_pipe(self, cls_dict):
+        return type("Pipe", (object,), {
+            name: staticmethod(value) if callable(value) else value
+            for name, value in cls_dict.items()})
+
+    def create_converter(self, name):
+        return lambda ptr: make_object(self[name], ptr)
+
+    def custom_calling_convention(self, cls):
+        self.custom_conventions[cls.__name__] = cls
+        return cls
+
+    def instance_attribute(self, type_name, offset, doc=None, length=0):
+        native = Type.is_native(type_name)
+
+        def fget(ptr):
+            pointer = ptr._ptr()
+            if native:
+                return getattr(pointer, "get_" + type_name)(offset)
+            return make_object(self[type_name], pointer + offset)
+
+        def fset(ptr, value):
+            getattr(ptr._ptr(), "set_" + type_name)(value, offset)
+
+        return property(fget, fset, None, doc)
+
+    def pointer_attribute(self, type_name, offset, doc=None, length=0):
+        def fget(ptr):
+            pointer = ptr._ptr().get_pointer(offset)
+            if Type.is_native(type_name):
+                return getattr(pointer, "get_" + type_name)()
+            return make_object(self[type_name], pointer)
+
+        return property(fget, None, None, doc)
+
+    def _array(self, type_name, offset, length=None, doc=None):
+        return property(lambda ptr: (ptr._ptr() + offset), None, None, doc)
+
+    static_instance_array = _array
+    dynamic_instance_array = _array
+    static_pointer_array = _array
+    dynamic_pointer_array = _array
+
+    def virtual_function(
+            self, index, args=(), return_type=DataType.VOID,
+            convention=Convention.THISCALL, doc=None):
+        args = (DataType.POINTER,) + tuple(args)
+
+        class fget(object):
+            def __get__(fget_self, obj, cls):
+                if obj is None:
+                    return fget_self
+                func = obj._ptr().make_virtual_function(
+                    index, convention, args, return_type)
+                return MemberFunction(self, return_type, func, obj)
+
+        return fget()
+
+    def pipe_function(
+            self, binary, identifier, args=(), return_type=DataType.VOID,
+            convention=Convention.CDECL, srv_check=True, doc=None):
+        from memory import find_binary
+        return self.pipe_function_pointer(
+            find_binary(binary, srv_check)[identifier],
+            args, return_type, convention, doc)
+
+
+manager = TypeManager()
@@ -0,0 +1,36 @@
+# ../benchmarks/standin/path/__init__.py
+
+"""Stand-in for the path.py package shipped with Source.Python."""
+
+import os
+
+
+class Path(str):
+    """Minimal str based path."""
+
+    def __truediv__(self, other):
+        return type(self)(os.path.join(self, str(other)))
+
+    def joinpath(self, *others):
+        return type(self)(os.path.join(self, *map(str, others)))
+
+    @property
+    def parent(self):
+        return type(self)(os.path.dirname(self))
+
+    @property
+    def name(self):
+        return os.path.basename(self)
+
+    @property
+    def stem(self):
+        return os.path.splitext(self.name)[0]
+
+    def isfile(self):
+        return os.path.isfile(self)
+
+    def isdir(self):
+        return os.path.isdir(self)
+
+    def exists(self):
+        return os.path.exists(self)
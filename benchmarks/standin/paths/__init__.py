@@ -0,0 +1,22 @@
+# ../benchmarks/standin/paths/__init__.py
+
+"""Stand-in for Source.Python's paths module.
+
+The game directory defaults to the repository, so the data files of the
+packages are found. It can be changed with ``SP_GAME_PATH``.
+"""
+
+import os
+
+from path import Path
+
+GAME_PATH = Path(os.environ.get(
+    "SP_GAME_PATH",
+    os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.dirname(os.path.abspath(__file__)))))))
+BASE_PATH = GAME_PATH / "addons" / "source-python"
+DATA_PATH = BASE_PATH / "data"
+CUSTOM_DATA_PATH = DATA_PATH / "custom"
+PLUGIN_DATA_PATH = DATA_PATH / "plugins"
+PLUGIN_PATH = BASE_PATH / "plugins"
+CUSTOM_PACKAGES_PATH = BASE_PATH / "packages" / "custom"
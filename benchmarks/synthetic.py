@@ -0,0 +1,302 @@
+# ../benchmarks/synthetic.py
+
+"""Writes synthetic ELF binaries which satisfy the data files.
+
+Every Linux identifier of the data files is planted into random code of its
+binary, together with the base op-codes of the patchers, and every symbol
+is exported. The binaries can then be loaded by the memory stand-in to time
+and profile the loading of the data files without the game.
+
+Usage, from the root of the repository::
+
+    python -m benchmarks.synthetic -o /tmp/binaries
+"""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Argparse
+from argparse import ArgumentParser
+#   Binascii
+import binascii
+#   Collections
+from collections import namedtuple
+#   Os
+import os
+#   Random
+from random import Random
+#   Struct
+import struct
+
+# Site-Packages Imports
+#   ConfigObj
+from configobj import ConfigObj
+
+# Benchmarks Imports
+from benchmarks import setup_paths
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ("Identifier",
+           "build_binaries",
+           "build_image",
+           "collect_identifiers",
+           "get_data_files",
+           "write_elf",
+           )
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# The offset of the code in the file and in memory
+TEXT_OFFSET = 0x1000
+
+# The random bytes between two planted identifiers
+GAP_SIZE = 64
+
+_elf_header = struct.Struct("<16sHHIIIIIHHHHHH")
+_program_header = struct.Struct("<IIIIIIII")
+_section_header = struct.Struct("<IIIIIIIIII")
+_symbol = struct.Struct("<IIIBBH")
+
+ET_DYN = 3
+EM_386 = 3
+PT_LOAD = 1
+PF_R_X = 5
+SHT_PROGBITS = 1
+SHT_STRTAB = 3
+SHT_DYNSYM = 11
+SHF_ALLOC = 2
+SHF_EXECINSTR = 4
+STB_GLOBAL_STT_FUNC = 0x12
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+Identifier = namedtuple(
+    "Identifier", ("binary", "identifier", "offset", "base_op_codes"))
+Identifier.__doc__ = """An identifier of a data file.
+
+``identifier`` is bytes with 0x2A wildcards or a symbol name and
+``base_op_codes`` are the bytes expected at the offset or None.
+"""
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def get_data_files(directories):
+    """Return the paths of the data files in the directories."""
+    files = list()
+    for directory in directories:
+        for root, dirs, names in os.walk(str(directory)):
+            dirs.sort()
+            files.extend(
+                os.path.join(root, name) for name in sorted(names)
+                if name.endswith(".ini"))
+
+    return files
+
+def collect_identifiers(files, platform="linux"):
+    """Return the identifiers of the data files.
+
+    :param iterable files:
+        The paths of the data files.
+    :param str platform:
+        The platform whose identifiers should be collected.
+    :rtype: list
+    """
+    identifiers = list()
+    for file in files:
+        _collect_section(ConfigObj(file), platform, None, identifiers)
+
+    return identifiers
+
+def _collect_section(section, platform, binary, identifiers):
+    def get(key, default=None):
+        return section.get(key + "_" + platform, section.get(key, default))
+
+    binary = get("binary", binary)
+    identifier = get("identifier")
+    if binary is not None and isinstance(identifier, str):
+        base_op_codes = get("base_op_codes")
+        identifiers.append(Identifier(
+            binary, _as_identifier(identifier), int(get("offset", "0"), 0),
+            None if base_op_codes is None else _as_identifier(base_op_codes)))
+
+    for name in section.sections:
+        _collect_section(section[name], platform, binary, identifiers)
+
+def _as_identifier(value):
+    try:
+        return binascii.unhexlify(value.replace(" ", ""))
+    except (binascii.Error, ValueError):
+        return value
+
+def build_image(identifiers, seed=0):
+    """Return random code containing the identifiers.
+
+    :param iterable identifiers:
+        The identifiers of one binary.
+    :param int seed:
+        The seed of the random code.
+    :return:
+        The code and a dictionary with the symbol names as key and their
+        offsets in the code as value.
+    :rtype: tuple
+    """
+    random = Random(seed)
+
+    def get_random_bytes(length):
+        return random.getrandbits(length * 8).to_bytes(length, "little")
+
+    def write(position, data):
+        end = position + len(data)
+        if len(code) < end:
+            code.extend(get_random_bytes(end - len(code)))
+
+        for index, byte in enumerate(data, position):
+            if byte != 0x2A:
+                code[index] = byte
+
+    code = bytearray()
+    positions = dict()
+    symbols = dict()
+    for entry in identifiers:
+        position = positions.get(entry.identifier, None)
+        if position is None:
+            position = len(code) + GAP_SIZE
+            if isinstance(entry.identifier, str):
+                symbols[entry.identifier] = position
+                write(position, get_random_bytes(16))
+            else:
+                write(position, entry.identifier)
+
+            positions[entry.identifier] = position
+
+        if entry.base_op_codes is not None:
+            write(position + entry.offset, entry.base_op_codes)
+
+        # Leave room to read a pointer at the offset
+        write(position + entry.offset, b"\x2A" * 8)
+
+    code.extend(get_random_bytes(GAP_SIZE))
+    return bytes(code), symbols
+
+def write_elf(path, code, symbols):
+    """Write an x86 ELF shared object exporting the symbols of the code.
+
+    :param str path:
+        The file to write.
+    :param bytes code:
+        The code of the .text section.
+    :param dict symbols:
+        The symbol names as key and their offsets in the code as value.
+    """
+    dynstr = bytearray(b"\0")
+    dynsym = bytearray(_symbol.size)
+    for name, offset in sorted(symbols.items()):
+        dynsym += _symbol.pack(
+            len(dynstr), TEXT_OFFSET + offset, 16, STB_GLOBAL_STT_FUNC, 0, 1)
+        dynstr += name.encode("utf-8") + b"\0"
+
+    shstrtab = b"\0.text\0.dynsym\0.dynstr\0.shstrtab\0"
+
+    # (name, type, flags, data, link, info, entsize)
+    sections = (
+        (1, SHT_PROGBITS, SHF_ALLOC | SHF_EXECINSTR, code, 0, 0, 0),
+        (7, SHT_DYNSYM, SHF_ALLOC, bytes(dynsym), 3, 1, _symbol.size),
+        (15, SHT_STRTAB, SHF_ALLOC, bytes(dynstr), 0, 0, 0),
+        (23, SHT_STRTAB, 0, shstrtab, 0, 0, 0),
+    )
+
+    data = bytearray(TEXT_OFFSET)
+    headers = bytearray(_section_header.size)
+    for name, sh_type, flags, content, link, info, entsize in sections:
+        offset = len(data)
+        headers += _section_header.pack(
+            name, sh_type, flags, offset if flags else 0, offset,
+            len(content), link, info, 1, entsize)
+        data += content
+
+    section_offset = len(data)
+    data += headers
+
+    _elf_header.pack_into(
+        data, 0, b"\x7fELF\x01\x01\x01" + bytes(9), ET_DYN, EM_386, 1, 0,
+        _elf_header.size, section_offset, 0, _elf_header.size,
+        _program_header.size, 1, _section_header.size, len(sections) + 1,
+        len(sections))
+
+    _program_header.pack_into(
+        data, _elf_header.size, PT_LOAD, 0, 0, 0, section_offset,
+        section_offset, PF_R_X, 0x1000)
+
+    with open(path, "wb") as file:
+        file.write(data)
+
+def build_binaries(directory, files, platform="linux", seed=0):
+    """Write a synthetic binary for every binary named by the data files.
+
+    :param str directory:
+        The directory to write the binaries to, as <binary>.so.
+    :param iterable files:
+        The paths of the data files.
+    :return:
+        A dictionary with the binary name as key and the path as value.
+    :rtype: dict
+    """
+    binaries = dict()
+    for entry in collect_identifiers(files, platform):
+        binaries.setdefault(entry.binary, []).append(entry)
+
+    os.makedirs(directory, exist_ok=True)
+
+    paths = dict()
+    for binary, identifiers in sorted(binaries.items()):
+        code, symbols = build_image(identifiers, seed)
+        paths[binary] = os.path.join(directory, binary + ".so")
+        write_elf(paths[binary], code, symbols)
+
+    return paths
+
+def main(argv=None):
+    parser = ArgumentParser(
+        prog="python -m benchmarks.synthetic",
+        description="Write synthetic binaries which satisfy the data files.")
+    parser.add_argument(
+        "-o", "--output", required=True,
+        help="the directory to write the binaries to")
+    parser.add_argument(
+        "--seed", type=int, default=0,
+        help="the seed of the random code")
+    parser.add_argument(
+        "directories", nargs="*",
+        help="the directories of the data files, defaults to the data "
+             "directories of the repository")
+    args = parser.parse_args(argv)
+
+    directories = args.directories
+    if not directories:
+        setup_paths()
+        from paths import CUSTOM_DATA_PATH
+        from paths import PLUGIN_DATA_PATH
+        directories = [CUSTOM_DATA_PATH, PLUGIN_DATA_PATH]
+
+    paths = build_binaries(
+        args.output, get_data_files(directories), seed=args.seed)
+    for binary, path in paths.items():
+        print("{0:<16} {1} ({2} bytes)".format(
+            binary, path, os.path.getsize(path)))
+
+
+# =============================================================================
+# >> MAIN
+# =============================================================================
+if __name__ == "__main__":
+    main()